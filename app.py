@@ -9,6 +9,43 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.agent import MeetingAgent
 from src.llm import get_llm
 from src.helpers import validate_meeting_summary
+from src.routing import ModelRouter
+from src.store import ActionItemStore
+from src.streaming import ACTION_ITEMS, SUMMARY
+
+
+@st.cache_resource
+def get_store():
+    """One action item store per app process, shared by every rerun and session"""
+    return ActionItemStore.from_env()
+
+
+def render_action_item(idx, item):
+    st.markdown(
+        f"""
+        <div class='action-item'>
+            <strong>#{idx}: {item['task']}</strong><br>
+            <small>Owner: {item['owner']}</small><br>
+            <small>Deadline: {item['deadline']}</small>
+        </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+def render_partial_summary(placeholder, partial):
+    """Show the fields and action items streamed so far"""
+    with placeholder.container():
+        st.markdown("### Meeting Summary")
+        if "meeting_title" in partial:
+            st.markdown(f"**Title:** {partial['meeting_title']}")
+        if "agenda" in partial:
+            st.markdown(f"**Agenda:** {partial['agenda']}")
+        if partial[ACTION_ITEMS]:
+            st.markdown("### Action Items")
+            for idx, item in enumerate(partial[ACTION_ITEMS], 1):
+                if isinstance(item, dict):
+                    render_action_item(idx, item)
 
 
 def main():
@@ -129,7 +166,8 @@ def main():
 
     try:
         llm_client = get_llm()
-        agent = MeetingAgent(llm_client)
+        store = get_store()
+        agent = MeetingAgent(llm_client, store=store, router=ModelRouter.from_env())
     except Exception as e:
         st.error(f"Failed to initialize agent: {e}")
         st.info("Make sure OPENAI_API_KEY is set in your environment")
@@ -178,67 +216,87 @@ John: Sounds good!""",
         if not transcript or not transcript.strip():
             st.warning("Please enter a meeting transcript")
         else:
-            with st.spinner("Analyzing meeting transcript..."):
-                try:
-                    result = agent.summarize_meeting(transcript)
+            progress = st.empty()
+            try:
+                result = None
+                partial = {ACTION_ITEMS: []}
+                with st.spinner("Analyzing meeting transcript..."):
+                    for event in agent.stream_summary(transcript):
+                        if event.field == SUMMARY:
+                            result = event.value
+                            continue
+                        if event.field == ACTION_ITEMS:
+                            partial[ACTION_ITEMS].append(event.value)
+                        elif event.field in ("meeting_title", "agenda"):
+                            partial[event.field] = event.value
+                        else:
+                            continue
+                        render_partial_summary(progress, partial)
+                progress.empty()
 
-                    if not validate_meeting_summary(result):
-                        st.error("⚠️ Agent returned invalid response structure")
+                if not validate_meeting_summary(result):
+                    st.error("⚠️ Agent returned invalid response structure")
+                    st.json(result)
+                elif "error" in result:
+                    if result["error"] == "NOT_A_MEETING_TRANSCRIPT":
+                        st.error("❌ This doesn't appear to be a meeting transcript")
+                        st.info(
+                            "The input looks like a story, article, or random text. "
+                            "Please provide an actual meeting conversation."
+                        )
+                    elif result["error"] == "NO_ACTION_ITEMS_FOUND":
+                        st.error("❌ No action items or agenda found")
+                        st.info(
+                            "This appears to be casual conversation without business context. "
+                            "Meeting transcripts should have an agenda and actionable outcomes."
+                        )
+                    else:
+                        st.error(f"❌ Error: {result['error']}")
+
+                    with st.expander("View Raw Response"):
                         st.json(result)
-                    elif "error" in result:
-                        if result["error"] == "NOT_A_MEETING_TRANSCRIPT":
-                            st.error(
-                                "❌ This doesn't appear to be a meeting transcript"
-                            )
-                            st.info(
-                                "The input looks like a story, article, or random text. "
-                                "Please provide an actual meeting conversation."
-                            )
-                        elif result["error"] == "NO_ACTION_ITEMS_FOUND":
-                            st.error("❌ No action items or agenda found")
-                            st.info(
-                                "This appears to be casual conversation without business context. "
-                                "Meeting transcripts should have an agenda and actionable outcomes."
-                            )
-                        else:
-                            st.error(f"❌ Error: {result['error']}")
+                else:
+                    st.markdown("### Meeting Summary")
+
+                    st.markdown(f"**Title:** {result['meeting_title']}")
+                    st.markdown(f"**Agenda:** {result['agenda']}")
+
+                    st.markdown("### Action Items")
 
-                        with st.expander("View Raw Response"):
-                            st.json(result)
+                    if result["action_items"]:
+                        for idx, item in enumerate(result["action_items"], 1):
+                            render_action_item(idx, item)
                     else:
-                        st.markdown("### Meeting Summary")
-
-                        st.markdown(f"**Title:** {result['meeting_title']}")
-                        st.markdown(f"**Agenda:** {result['agenda']}")
-
-                        st.markdown("### Action Items")
-
-                        if result["action_items"]:
-                            for idx, item in enumerate(result["action_items"], 1):
-                                st.markdown(
-                                    f"""
-                                    <div class='action-item'>
-                                        <strong>#{idx}: {item['task']}</strong><br>
-                                        <small>Owner: {item['owner']}</small><br>
-                                        <small>Deadline: {item['deadline']}</small>
-                                    </div>
-                                """,
-                                    unsafe_allow_html=True,
-                                )
-                        else:
-                            st.info("No action items found in this meeting")
-
-                        with st.expander("View Raw JSON"):
-                            st.json(result)
-
-                except NotImplementedError:
-                    st.error("❌ Agent not implemented yet!")
-                    st.info(
-                        "Please implement the `summarize_meeting()` method in `src/agent.py`"
-                    )
-                except Exception as e:
-                    st.error(f"❌ Error processing transcript: {str(e)}")
-                    st.exception(e)
+                        st.info("No action items found in this meeting")
+
+                    with st.expander("View Raw JSON"):
+                        st.json(result)
+
+            except NotImplementedError:
+                st.error("❌ Agent not implemented yet!")
+                st.info(
+                    "Please implement the `summarize_meeting()` method in `src/agent.py`"
+                )
+            except Exception as e:
+                progress.empty()
+                st.error(f"❌ Error processing transcript: {str(e)}")
+                st.exception(e)
+
+    with st.expander("Search action items from past meetings"):
+        owner = st.text_input("Owner", key="store_owner")
+        keywords = st.text_input("Task keywords", key="store_text")
+        if owner.strip() or keywords.strip():
+            items = store.query(
+                owner=owner.strip() or None, text=keywords.strip() or None
+            )
+            for item in items:
+                due = f" → {item.due_start[:10]}" if item.due_start else ""
+                st.markdown(
+                    f"- **{item.task}** ({item.owner}, {item.deadline}{due})"
+                    f" — _{item.meeting_title}_"
+                )
+            if not items:
+                st.info("No matching action items")
 
 
 if __name__ == "__main__":
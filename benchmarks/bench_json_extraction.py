@@ -0,0 +1,80 @@
+"""Micro-benchmark: single-pass JSON extraction vs. the previous regex fallbacks
+
+Run from the repository root with: python -m benchmarks.bench_json_extraction
+"""
+
+import json
+import re
+import timeit
+
+from src.helpers import extract_json_object
+
+SUMMARY = {
+    "meeting_title": "Weekly sync",
+    "agenda": "Status of {release} and {hotfix} work",
+    "action_items": [
+        {"task": f"Task {i} with braces {{x}}", "owner": "Bob", "deadline": "Friday"}
+        for i in range(50)
+    ],
+}
+
+
+def legacy_parse(text: str):
+    """The json.loads -> fenced regex -> greedy regex chain this replaced"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    match = re.search(r"```json\s*(\{.*?\})\s*```", text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if match:
+        return json.loads(match.group())
+    raise ValueError("no JSON")
+
+
+def noisy_response(prose_kb: int, fenced: bool) -> str:
+    """Build a response with prose (containing braces) around a summary"""
+    filler = "The model rambles about {placeholders} and sets {a, b}. " * (
+        prose_kb * 1024 // 56
+    )
+    body = json.dumps(SUMMARY, indent=2)
+    if fenced:
+        body = f"```json\n{body}\n```"
+    return f"{filler}\n{body}\n{filler}"
+
+
+def _time_ms(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e3
+
+
+def main():
+    for fenced in (True, False):
+        for prose_kb in (1, 64, 512):
+            text = noisy_response(prose_kb, fenced)
+            assert extract_json_object(text) == SUMMARY
+            number = max(1, 2000 // prose_kb)
+
+            try:
+                legacy_ok = legacy_parse(text) == SUMMARY
+            except (ValueError, json.JSONDecodeError):
+                legacy_ok = False
+            legacy = (
+                f"{_time_ms(lambda: legacy_parse(text), number):8.3f} ms"
+                if legacy_ok
+                else "  failed"
+            )
+
+            print(
+                f"{'fenced' if fenced else 'bare':>6} {prose_kb:>4} KB prose: "
+                f"extract_json_object {_time_ms(lambda: extract_json_object(text), number):8.3f} ms"
+                f" | legacy {legacy}"
+            )
+
+
+if __name__ == "__main__":
+    main()
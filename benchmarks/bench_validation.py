@@ -0,0 +1,98 @@
+"""Throughput benchmark: bulk validation vs. validate_meeting_summary
+
+Run from the repository root with:
+    python -m benchmarks.bench_validation [--records 200000] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.synthetic import synthetic_summary
+from src.helpers import validate_meeting_summary
+from src.validation import SummaryValidator, validate_jsonl, validate_many
+
+
+def corpus(records: int, invalid_ratio: float = 0.05, seed: int = 0):
+    """Summaries of 1-20 items, a fraction of them broken in one field"""
+    rng = random.Random(seed)
+    summaries = []
+    for i in range(records):
+        summary = synthetic_summary(rng.randint(1, 20), seed=i)
+        if rng.random() < invalid_ratio:
+            item = rng.choice(summary["action_items"])
+            item[rng.choice(("task", "owner", "deadline"))] = "  "
+        summaries.append(summary)
+    return summaries
+
+
+def _rate(label: str, records: int, fn) -> float:
+    started = time.perf_counter()
+    invalid = fn()
+    seconds = time.perf_counter() - started
+    print(
+        f"{label:<42} {records / seconds:>12,.0f} records/s "
+        f"({seconds:6.2f} s, {invalid} invalid)"
+    )
+    return seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    summaries = corpus(args.records)
+    validator = SummaryValidator()
+    n = len(summaries)
+
+    print(f"In memory, {n:,} summaries")
+    _rate(
+        "validate_meeting_summary",
+        n,
+        lambda: sum(not validate_meeting_summary(s) for s in summaries),
+    )
+    _rate(
+        "SummaryValidator.is_valid",
+        n,
+        lambda: sum(not validator.is_valid(s) for s in summaries),
+    )
+    _rate(
+        "validate_many (with reasons)",
+        n,
+        lambda: sum(not r.valid for r in validate_many(summaries)),
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "summaries.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for summary in summaries:
+                f.write(json.dumps(summary) + "\n")
+
+        print(f"\nJSON Lines file, {n:,} records (parsing included)")
+
+        def legacy():
+            with open(path, "r", encoding="utf-8") as f:
+                return sum(not validate_meeting_summary(json.loads(line)) for line in f)
+
+        _rate("json.loads + validate_meeting_summary", n, legacy)
+        _rate(
+            "validate_jsonl, 1 process",
+            n,
+            lambda: sum(not r.valid for r in validate_jsonl(path, workers=1)),
+        )
+        _rate(
+            f"validate_jsonl, {args.workers} processes",
+            n,
+            lambda: sum(
+                not r.valid for r in validate_jsonl(path, workers=args.workers)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
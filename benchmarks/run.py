@@ -0,0 +1,443 @@
+"""Benchmark suite for the summarization pipeline
+
+Measures latency percentiles (p50/p95/p99), throughput and peak RSS for:
+
+- validate/*        validate_meeting_summary on summaries of growing size
+- parse/*           MeetingAgent._parse_summary_response on noisy responses
+- complete_cold/*   LLMClient.complete on cache misses
+- complete_warm/*   LLMClient.complete on cache hits
+- summarize/*       MeetingAgent.summarize_meeting end to end (uncached)
+
+over synthetic transcripts from 1 KB to 1 MB. The LLM is the offline fake
+backend (LLM_FAKE_LATENCY_MS adds simulated network time), so numbers reflect
+our own overhead and are reproducible without API access.
+
+Results are written to benchmarks/results/latest.json and compared with
+benchmarks/baseline.json; the run exits non-zero when a case's p50 (or the
+fields given with --metrics) regresses by more than --threshold and by more
+than the run-to-run noise of the median, estimated from both runs' median
+absolute deviations and the spread between rounds. Every case takes at least
+MIN_RUNS samples.
+
+Each case also times a fixed standard-library workload between its own
+samples. That workload runs none of our code, so it only changes when the
+machine does (load from neighbours, frequency scaling). A case's baseline
+timings are scaled by the ratio of its calibration medians before comparing,
+so a machine that is slower than when the baseline was recorded does not
+read as a regression.
+
+Re-record the baseline (--update-baseline) in the same commit as any change
+that adds overhead on purpose, and say so in its message.
+
+Run from the repository root:
+    python -m benchmarks.run                    # run and compare to baseline
+    python -m benchmarks.run --quick            # fewer iterations and sizes
+    python -m benchmarks.run --update-baseline  # record a new baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic import noisy_response, synthetic_summary, synthetic_transcript
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.helpers import validate_meeting_summary
+from src.llm import LLMClient
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+
+SIZES = {"1kb": 1024, "10kb": 10 * 1024, "100kb": 100 * 1024, "1mb": 1024 * 1024}
+QUICK_SIZES = ("1kb", "100kb")
+# Fewest timed samples per case; medians of fewer samples of the large
+# inputs moved by 30-50% between identical runs
+MIN_RUNS = 20
+# How many standard errors of the median difference count as noise
+NOISE_SIGMAS = 3.0
+CALIBRATION_TEXT = synthetic_transcript(8 * 1024)
+# Calibration runs interleaved with each case's samples
+CALIBRATION_SAMPLES = 25
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Linearly interpolated percentile of a list of samples"""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def median_abs_deviation(samples: List[float]) -> float:
+    """Median distance of the samples from their median"""
+    median = percentile(samples, 50)
+    return percentile([abs(sample - median) for sample in samples], 50)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(
+    fn: Callable[[Any], Any],
+    iterations: int,
+    setup: Callable[[int], Any] = lambda i: i,
+    warmup: int = 1,
+    payload_bytes: int = 0,
+    calibration: Optional[Callable[[], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Time ``fn(setup(i))`` for each iteration; setup time is not counted
+
+    Args:
+        fn: Operation under test
+        iterations: Number of timed calls
+        setup: Builds the argument for each call (untimed)
+        warmup: Untimed calls made first
+        payload_bytes: Input size per call, used to report bytes/second
+        calibration: Reference workload timed CALIBRATION_SAMPLES times
+            between the calls; its median is reported as ``calibration_ms``
+
+    Returns:
+        dict: Latency percentiles (ms), throughput and peak RSS
+    """
+    for i in range(warmup):
+        fn(setup(-1 - i))
+
+    samples, reference = [], []
+    every = max(1, iterations // CALIBRATION_SAMPLES)
+    for i in range(iterations):
+        if calibration is not None and i % every == 0:
+            started = time.perf_counter()
+            calibration()
+            reference.append(time.perf_counter() - started)
+        arg = setup(i)
+        started = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - started)
+
+    total = sum(samples)
+    result = {
+        "iterations": iterations,
+        "mean_ms": total / iterations * 1e3,
+        "p50_ms": percentile(samples, 50) * 1e3,
+        "p95_ms": percentile(samples, 95) * 1e3,
+        "p99_ms": percentile(samples, 99) * 1e3,
+        "min_ms": min(samples) * 1e3,
+        "mad_ms": median_abs_deviation(samples) * 1e3,
+        "throughput_ops": iterations / total if total else float("inf"),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if payload_bytes:
+        result["throughput_mb_s"] = payload_bytes * iterations / total / 1e6
+    if reference:
+        result["calibration_ms"] = percentile(reference, 50) * 1e3
+    return result
+
+
+def _calibrate() -> int:
+    """Tokenize, count and JSON round-trip: the kind of work our code does"""
+    counts = Counter(re.findall(r"[a-z]+", CALIBRATION_TEXT.lower()))
+    return len(json.loads(json.dumps(counts)))
+
+
+def _client(backend: FakeBackend) -> LLMClient:
+    return LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+
+
+def run_suite(
+    sizes: List[str], iterations: int, latency: float, rounds: int = 1
+) -> Dict[str, Any]:
+    """
+    Run every benchmark case, ``rounds`` times over
+
+    The suite is repeated as a whole rather than each case back to back, so
+    a slow spell of the machine lands in one round of a case instead of all
+    of its samples.
+
+    Args:
+        sizes: Keys of SIZES to include
+        iterations: Timed iterations for the smallest size (scaled down for
+            larger inputs, but never below MIN_RUNS)
+        latency: Simulated upstream latency per LLM call, in seconds
+        rounds: Times to repeat the suite
+
+    Returns:
+        dict: Results keyed by case name, combined across rounds
+    """
+    results = [_run_round(sizes, iterations, latency) for _ in range(rounds)]
+    return {
+        name: combine_rounds([result[name] for result in results])
+        for name in results[0]
+    }
+
+
+def combine_rounds(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge one case's results from several rounds
+
+    Timings and throughputs are the median across rounds, ``min_ms`` the
+    overall minimum; ``round_p50_ms`` keeps each round's median so compare()
+    can tell how far whole rounds drift apart.
+    """
+    merged: Dict[str, Any] = {
+        key: percentile([result[key] for result in results], 50)
+        for key in results[0]
+        if key not in ("iterations", "peak_rss_mb")
+    }
+    merged["iterations"] = sum(result["iterations"] for result in results)
+    merged["min_ms"] = min(result["min_ms"] for result in results)
+    merged["peak_rss_mb"] = results[-1]["peak_rss_mb"]
+    merged["round_p50_ms"] = [result["p50_ms"] for result in results]
+    return merged
+
+
+def _run_round(sizes: List[str], iterations: int, latency: float) -> Dict[str, Any]:
+    backend = FakeBackend(latency=latency)
+    cases: Dict[str, Dict[str, Any]] = {}
+
+    for items in (5, 50, 500):
+        summary = synthetic_summary(items)
+        cases[f"validate/{items}_items"] = measure(
+            lambda _: validate_meeting_summary(summary),
+            iterations * 20,
+            calibration=_calibrate,
+        )
+
+    for label in sizes:
+        size = SIZES[label]
+        runs = max(MIN_RUNS, iterations * 1024 // size if size > 1024 else iterations)
+        transcript = synthetic_transcript(size)
+
+        response = noisy_response(synthetic_summary(20), size // 2)
+        cases[f"parse/{label}"] = measure(
+            lambda _: MeetingAgent._parse_summary_response(response),
+            runs * 4,
+            payload_bytes=len(response),
+            calibration=_calibrate,
+        )
+
+        client = _client(backend)
+        cases[f"complete_cold/{label}"] = measure(
+            client.complete,
+            runs,
+            setup=lambda i: f"{transcript}\n#{i}",
+            payload_bytes=size,
+            calibration=_calibrate,
+        )
+        warm_prompt = f"{transcript}\n#warm"
+        client.complete(warm_prompt)
+        cases[f"complete_warm/{label}"] = measure(
+            lambda _: client.complete(warm_prompt),
+            runs * 4,
+            payload_bytes=size,
+            calibration=_calibrate,
+        )
+
+        cases[f"summarize/{label}"] = measure(
+            lambda agent: agent.summarize_meeting(transcript),
+            runs,
+            setup=lambda _: MeetingAgent(_client(backend)),
+            payload_bytes=size,
+            calibration=_calibrate,
+        )
+
+    return cases
+
+
+def median_noise_ms(current: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """
+    Standard error of the difference of two runs' medians, in ms
+
+    Within a round, the median of n samples has a standard error of about
+    1.2533 * sigma / sqrt(n), with sigma estimated robustly as 1.4826 * MAD.
+    Whole rounds also drift apart (other load on the machine, frequency
+    scaling); with several rounds, their spread is used when it is larger.
+    """
+    variance = 0.0
+    for result in (current, baseline):
+        if "mad_ms" not in result or not result.get("iterations"):
+            return 0.0
+        sigma = 1.4826 * result["mad_ms"]
+        within = (1.2533 * sigma) ** 2 / result["iterations"]
+        rounds = result.get("round_p50_ms") or []
+        between = statistics.variance(rounds) / len(rounds) if len(rounds) > 1 else 0
+        variance += max(within, between)
+    return math.sqrt(variance)
+
+
+def machine_scale(current: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """
+    How much slower the machine ran one case than when the baseline was recorded
+
+    Returns:
+        float: Ratio of the case's calibration medians, or 1.0 if either run
+        lacks one
+    """
+    now, before = current.get("calibration_ms"), baseline.get("calibration_ms")
+    if not now or not before:
+        return 1.0
+    return now / before
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float,
+    metrics: List[str] = ("p50_ms",),
+    noise_sigmas: float = NOISE_SIGMAS,
+) -> List[str]:
+    """
+    Find cases whose latency regressed beyond the threshold and the noise
+
+    Args:
+        current: Case results of this run
+        baseline: Case results of the baseline
+        threshold: Allowed relative slowdown (0.25 = 25%)
+        min_delta_ms: Absolute slowdowns below this are treated as noise
+        metrics: Result fields to compare; tail percentiles from a handful of
+            iterations are noisy, so only the median is gated by default
+        noise_sigmas: A p50 slowdown must also exceed this many standard
+            errors of the median difference (see median_noise_ms)
+
+    Returns:
+        list: One message per regression
+    """
+    regressions = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        scale = machine_scale(result, base)
+        for metric in metrics:
+            if metric not in result or metric not in base:
+                continue
+            now, before = result[metric], base[metric] * scale
+            allowed = max(before * threshold, min_delta_ms)
+            if metric == "p50_ms":
+                allowed = max(allowed, noise_sigmas * median_noise_ms(result, base))
+            if now - before > allowed:
+                regressions.append(
+                    f"{name} {metric}: {before:.3f} ms -> {now:.3f} ms "
+                    f"(+{(now / before - 1) * 100:.0f}%, allowed +{allowed:.3f} ms)"
+                )
+    return regressions
+
+
+def _print_table(cases: Dict[str, Any]) -> None:
+    print(
+        f"{'case':<26}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'ops/s':>12}{'RSS MB':>9}"
+    )
+    for name, r in cases.items():
+        rss = f"{r['peak_rss_mb']:.0f}" if r["peak_rss_mb"] is not None else "-"
+        print(
+            f"{name:<26}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}"
+            f"{r['throughput_ops']:>12.1f}{rss:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer sizes/iterations")
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument(
+        "--rounds", type=int, default=None, help="times to repeat the suite"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    parser.add_argument(
+        "--metrics",
+        default="p50_ms",
+        help="comma-separated result fields to gate on, e.g. p50_ms,p95_ms",
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sizes = list(QUICK_SIZES if args.quick else SIZES)
+    iterations = args.iterations or (20 if args.quick else 50)
+    rounds = args.rounds or (2 if args.quick else 3)
+    latency = float(os.getenv("LLM_FAKE_LATENCY_MS", "0")) / 1000
+
+    cases = run_suite(sizes, iterations, latency, rounds)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fake_latency_ms": latency * 1000,
+            "sizes": sizes,
+            "iterations": iterations,
+            "rounds": rounds,
+        },
+        "cases": cases,
+    }
+
+    _print_table(cases)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("No baseline found; run with --update-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    scales = [
+        machine_scale(result, baseline["cases"][name])
+        for name, result in cases.items()
+        if name in baseline["cases"]
+    ]
+    if scales:
+        print(
+            f"\nMachine speed vs baseline (median over cases): x{percentile(scales, 50):.2f}"
+        )
+    regressions = compare(
+        cases,
+        baseline["cases"],
+        args.threshold,
+        args.min_delta_ms,
+        metrics=args.metrics.split(","),
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Synthetic meeting data for benchmarks"""
+
+import json
+import random
+from typing import Any, Dict
+
+SPEAKERS = ["Alice", "Bob", "Charlie", "Dana", "Team Lead", "Client", "Designer"]
+TASKS = [
+    "deploy the login fix",
+    "review the pull request",
+    "update the documentation",
+    "send the screenshots",
+    "schedule the demo",
+    "set up the repository",
+    "draft the project plan",
+    "fix the performance issue",
+]
+DEADLINES = [
+    "today",
+    "tomorrow",
+    "Friday",
+    "end of week",
+    "next Monday",
+    "this afternoon",
+]
+FILLER = [
+    "Sounds good!",
+    "Great, thanks.",
+    "I think we covered that last time.",
+    "Let me check my notes on this one.",
+    "That makes sense to me.",
+]
+
+
+def synthetic_transcript(size_bytes: int, seed: int = 0) -> str:
+    """
+    Generate a meeting transcript of roughly ``size_bytes`` bytes
+
+    About a third of the turns are commitments with owners and deadlines; the
+    rest is filler chatter.
+
+    Args:
+        size_bytes: Target transcript size
+        seed: Random seed for reproducible output
+
+    Returns:
+        str: Transcript text
+    """
+    rng = random.Random(seed)
+    lines = []
+    size = 0
+    while size < size_bytes:
+        speaker = rng.choice(SPEAKERS)
+        if rng.random() < 0.35:
+            text = f"I'll {rng.choice(TASKS)} by {rng.choice(DEADLINES)}."
+        else:
+            text = rng.choice(FILLER)
+        line = f"{speaker}: {text}"
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def synthetic_summary(action_items: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Generate a valid meeting summary with ``action_items`` items
+
+    Args:
+        action_items: Number of action items
+        seed: Random seed for reproducible output
+
+    Returns:
+        dict: Summary in the shape accepted by validate_meeting_summary
+    """
+    rng = random.Random(seed)
+    return {
+        "meeting_title": "Synthetic planning meeting",
+        "agenda": "Review progress and assign follow-up work",
+        "action_items": [
+            {
+                "task": rng.choice(TASKS).capitalize(),
+                "owner": rng.choice(SPEAKERS),
+                "deadline": rng.choice(DEADLINES),
+            }
+            for _ in range(action_items)
+        ],
+    }
+
+
+def noisy_response(summary: Dict[str, Any], prose_bytes: int) -> str:
+    """
+    Wrap a summary in a fenced block surrounded by prose containing braces
+
+    Args:
+        summary: Summary to embed
+        prose_bytes: Approximate amount of prose on each side
+
+    Returns:
+        str: LLM-style response text
+    """
+    sentence = "Here is {some} context the model added around the answer. "
+    filler = sentence * max(1, prose_bytes // len(sentence))
+    return f"{filler}\n```json\n{json.dumps(summary, indent=2)}\n```\n{filler}"
@@ -2,6 +2,8 @@
 
 from typing import Dict, Any
 
+from src.helpers import parse_json_response
+from src.telemetry import count, span
 
 JUDGE_SYSTEM_PROMPT = """You are an expert evaluator for meeting summarizer systems.
 Your job is to assess whether an AI agent correctly extracted information from a meeting transcript.
@@ -32,49 +34,19 @@ Be fair but thorough. Missing one action item shouldn't fail the test, but missi
 The agent should pass with a score >= 60.
 """
 
+# Keys of "criteria_scores", in the order of JUDGE_SYSTEM_PROMPT
+CRITERIA = (
+    "action_items_completeness",
+    "ownership_accuracy",
+    "deadline_accuracy",
+    "meeting_context",
+    "output_quality",
+)
 
-def judge_meeting_summary(
-    transcript: str, agent_summary: Dict[str, Any], expected: Dict[str, Any], llm_client
-) -> Dict[str, Any]:
-    """
-    Use LLM to judge the quality of a meeting summary using semantic evaluation
-
-    Args:
-        transcript: The meeting transcript
-        agent_summary: The agent's summary
-        expected: Expected patterns (action items, owners, deadlines)
-        llm_client: LLM client instance
-
-    Returns:
-        dict: Judge evaluation with pass/fail, score, and feedback
-    """
 
-    full_prompt = f"""{JUDGE_SYSTEM_PROMPT}
-
-
-MEETING TRANSCRIPT
-```
-{transcript}
-```
-
-AGENT'S SUMMARY
-```json
-{agent_summary}
-```
-
-EXPECTED PATTERNS
-The summary should contain these elements (use semantic matching, not exact strings):
-
-Action Items (should extract tasks similar to):
-{chr(10).join(f"- {item}" for item in expected.get('should_contain_action_items', []))}
-
-Owners (should identify people/teams including):
-{chr(10).join(f"- {owner}" for owner in expected.get('should_have_owners', []))}
-
-Deadlines (should extract timeframes like):
-{chr(10).join(f"- {deadline}" for deadline in expected.get('should_have_deadlines', []))}
-
-YOUR TASK
+# Static grading instructions. Together with JUDGE_SYSTEM_PROMPT they form the
+# system message, an identical prefix on every call that providers can cache.
+JUDGE_INSTRUCTIONS = """YOUR TASK
 Evaluate the agent's summary. Use SEMANTIC MATCHING - don't require exact word matches.
 
 For example:
@@ -121,25 +93,55 @@ A summary should FAIL if:
 - Score < 60
 """
 
-    try:
-        response_text = llm_client.complete(full_prompt)
+JUDGE_SYSTEM_MESSAGE = f"{JUDGE_SYSTEM_PROMPT}\n\n{JUDGE_INSTRUCTIONS}"
 
-        import json
-        import re
 
-        json_match = re.search(
-            r"```(?:json)?\s*(\{.*?\})\s*```", response_text, re.DOTALL
-        )
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                json_str = response_text
+def judge_meeting_summary(
+    transcript: str, agent_summary: Dict[str, Any], expected: Dict[str, Any], llm_client
+) -> Dict[str, Any]:
+    """
+    Use LLM to judge the quality of a meeting summary using semantic evaluation
+
+    Args:
+        transcript: The meeting transcript
+        agent_summary: The agent's summary
+        expected: Expected patterns (action items, owners, deadlines)
+        llm_client: LLM client instance
+
+    Returns:
+        dict: Judge evaluation with pass/fail, score, and feedback
+    """
 
-        evaluation = json.loads(json_str)
+    prompt = f"""MEETING TRANSCRIPT
+```
+{transcript}
+```
+
+AGENT'S SUMMARY
+```json
+{agent_summary}
+```
+
+EXPECTED PATTERNS
+The summary should contain these elements (use semantic matching, not exact strings):
+
+Action Items (should extract tasks similar to):
+{chr(10).join(f"- {item}" for item in expected.get('should_contain_action_items', []))}
+
+Owners (should identify people/teams including):
+{chr(10).join(f"- {owner}" for owner in expected.get('should_have_owners', []))}
+
+Deadlines (should extract timeframes like):
+{chr(10).join(f"- {deadline}" for deadline in expected.get('should_have_deadlines', []))}
+
+Evaluate the agent's summary against the transcript and expected patterns above.
+"""
+
+    try:
+        with span("judge.evaluate", prompt_chars=len(prompt)):
+            response_text = llm_client.complete(prompt, system=JUDGE_SYSTEM_MESSAGE)
+            with span("judge.parse"):
+                evaluation = parse_json_response(response_text)
 
         if "pass" not in evaluation:
             evaluation["pass"] = evaluation.get("score", 0) >= 60
@@ -148,9 +150,11 @@ A summary should FAIL if:
         if "feedback" not in evaluation:
             evaluation["feedback"] = "Evaluation completed"
 
+        count("judge_verdicts", outcome="pass" if evaluation["pass"] else "fail")
         return evaluation
 
     except Exception as e:
+        count("judge_verdicts", outcome="error")
         return {
             "pass": False,
             "score": 0,
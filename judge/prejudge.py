@@ -0,0 +1,318 @@
+"""Deterministic rule-based pre-judge that settles clear verdicts locally
+
+The LLM judge is only needed when a summary is borderline. RulePreJudge
+scores a summary against a test case's expected patterns with fuzzy token
+matching and returns an evaluation in the same shape as
+judge_meeting_summary (pass, score, feedback, criteria_scores, issues):
+
+- a summary that fails validate_meeting_summary is a clear fail
+- a summary where every expected owner and deadline is plainly present and
+  nearly all expected action items are found is a clear pass
+- a very low rule score is a clear fail
+- anything else is escalated to the LLM judge
+
+``judge`` has judge_meeting_summary's signature, so it can be passed to
+EvaluationRunner. Run ``python -m judge.prejudge`` to measure how often the
+rules decide locally and how well they agree with the LLM judge.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from src.helpers import validate_meeting_summary
+from src.speakers import SpeakerIndex
+
+from .llm_judge import CRITERIA, judge_meeting_summary
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an the of to for on in at by and or it its this that my our your their "
+    "is are be will can should please up".split()
+)
+SUFFIXES = ("ing", "ed", "es", "er", "s")
+
+
+def _stem(word: str) -> str:
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokens(text: Any) -> List[str]:
+    """Lowercased, stemmed content words of a text"""
+    if not isinstance(text, str):
+        return []
+    return [
+        _stem(word)
+        for word in WORD_PATTERN.findall(text.lower())
+        if word not in STOPWORDS
+    ]
+
+
+def _token_match(a: str, b: str, min_ratio: float) -> bool:
+    if a == b:
+        return True
+    if min(len(a), len(b)) < 4:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= min_ratio
+
+
+def coverage(expected: str, candidate: str, min_ratio: float = 0.8) -> float:
+    """
+    Fraction of the expected phrase's words found (fuzzily) in a candidate
+
+    Args:
+        expected: Expected phrase, e.g. "deploy login feature"
+        candidate: Text to search, e.g. a summary task
+        min_ratio: Similarity needed for two different words to match
+
+    Returns:
+        float: 0.0 to 1.0
+    """
+    return _token_coverage(tokens(expected), tokens(candidate), min_ratio)
+
+
+def _token_coverage(
+    wanted: List[str], have: Iterable[str], min_ratio: float = 0.8
+) -> float:
+    if not wanted:
+        return 1.0
+    have = set(have)
+    found = sum(
+        1
+        for w in wanted
+        if w in have or any(_token_match(w, h, min_ratio) for h in have)
+    )
+    return found / len(wanted)
+
+
+def _best_coverage(expected: str, candidates: Iterable[str]) -> float:
+    return max((coverage(expected, c) for c in candidates), default=0.0)
+
+
+class RulePreJudge:
+    """Score summaries with fuzzy matching and decide only the clear cases"""
+
+    def __init__(
+        self,
+        pass_score: int = 80,
+        fail_score: int = 40,
+        match_threshold: float = 0.5,
+        min_items_found: float = 0.75,
+    ):
+        """
+        Args:
+            pass_score: Minimum rule score for a local pass
+            fail_score: Rule scores at or below this are a local fail
+            match_threshold: Word coverage needed for an expected task, owner
+                or deadline to count as present
+            min_items_found: Fraction of expected action items needed for a
+                local pass
+        """
+        self.pass_score = pass_score
+        self.fail_score = fail_score
+        self.match_threshold = match_threshold
+        self.min_items_found = min_items_found
+
+    def evaluate(
+        self,
+        transcript: str,
+        agent_summary: Dict[str, Any],
+        expected: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Score a summary with rules only
+
+        Args:
+            transcript: The meeting transcript
+            agent_summary: The agent's summary
+            expected: Expected patterns (action items, owners, deadlines)
+
+        Returns:
+            dict: Evaluation in judge_meeting_summary's shape, plus ``decided``
+            (False when the case should go to the LLM judge) and
+            ``judge: "rules"``
+        """
+        if not validate_meeting_summary(agent_summary) or "error" in agent_summary:
+            return self._result(
+                False,
+                0,
+                dict.fromkeys(CRITERIA, 0),
+                ["Summary is not a valid meeting summary"],
+                decided=True,
+            )
+
+        items = agent_summary["action_items"]
+        tasks = [item["task"] for item in items]
+        owners = [item["owner"] for item in items]
+        deadlines = [item["deadline"] for item in items]
+        issues: List[str] = []
+
+        found_items, missing_items = self._matches(
+            expected.get("should_contain_action_items", []), tasks
+        )
+        found_owners, missing_owners = self._matches(
+            expected.get("should_have_owners", []), owners
+        )
+        found_deadlines, missing_deadlines = self._matches(
+            expected.get("should_have_deadlines", []), deadlines
+        )
+        issues += [f"Missing action item: {m}" for m in missing_items]
+        issues += [f"Missing owner: {m}" for m in missing_owners]
+        issues += [f"Missing deadline: {m}" for m in missing_deadlines]
+
+        # Owners that are neither speakers nor mentioned are likely invented
+        speakers = SpeakerIndex.for_transcript(transcript)
+        invented = [owner for owner in set(owners) if speakers.is_hallucinated(owner)]
+        issues += [f"Owner not found in transcript: {o}" for o in invented]
+        owner_penalty = len(invented) / max(1, len(set(owners)))
+
+        has_title = len(agent_summary["meeting_title"].strip()) >= 3
+        has_agenda = len(agent_summary["agenda"].strip()) >= 3
+        criteria = {
+            "action_items_completeness": round(40 * found_items),
+            "ownership_accuracy": round(20 * max(0.0, found_owners - owner_penalty)),
+            "deadline_accuracy": round(20 * found_deadlines),
+            "meeting_context": 5 * has_title + 5 * has_agenda,
+            "output_quality": 10 if items else 5,
+        }
+        score = sum(criteria.values())
+
+        if (
+            found_owners == 1.0
+            and found_deadlines == 1.0
+            and not invented
+            and found_items >= self.min_items_found
+            and score >= self.pass_score
+        ):
+            return self._result(True, score, criteria, issues, decided=True)
+        if score <= self.fail_score:
+            return self._result(False, score, criteria, issues, decided=True)
+        return self._result(score >= 60, score, criteria, issues, decided=False)
+
+    def judge(
+        self,
+        transcript: str,
+        agent_summary: Dict[str, Any],
+        expected: Dict[str, Any],
+        llm_client,
+        escalate: Callable[..., Dict[str, Any]] = judge_meeting_summary,
+    ) -> Dict[str, Any]:
+        """
+        Decide locally when certain, otherwise ask the LLM judge
+
+        Same signature and return shape as judge_meeting_summary; the result's
+        ``judge`` field says which one decided.
+        """
+        evaluation = self.evaluate(transcript, agent_summary, expected)
+        if evaluation["decided"]:
+            return evaluation
+        escalated = escalate(transcript, agent_summary, expected, llm_client)
+        return dict(escalated, judge="llm", decided=True)
+
+    __call__ = judge
+
+    def _matches(
+        self, expected: Iterable[str], candidates: List[str]
+    ) -> Tuple[float, List[str]]:
+        """Fraction of expected phrases present among candidates, and the misses"""
+        expected = list(expected)
+        if not expected:
+            return 1.0, []
+        missing = [
+            phrase
+            for phrase in expected
+            if _best_coverage(phrase, candidates) < self.match_threshold
+        ]
+        return 1 - len(missing) / len(expected), missing
+
+    @staticmethod
+    def _result(
+        passed: bool,
+        score: int,
+        criteria: Dict[str, int],
+        issues: List[str],
+        decided: bool,
+    ) -> Dict[str, Any]:
+        if decided:
+            verdict = "passes" if passed else "fails"
+            feedback = f"Rule-based pre-judge: summary clearly {verdict}"
+        else:
+            feedback = "Rule-based pre-judge: borderline, needs LLM judgement"
+        return {
+            "pass": passed,
+            "score": score,
+            "feedback": feedback,
+            "criteria_scores": criteria,
+            "issues": issues,
+            "decided": decided,
+            "judge": "rules",
+        }
+
+
+def measure_agreement(
+    prejudge: RulePreJudge,
+    cases: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+    llm_client,
+    llm_judge: Callable[..., Dict[str, Any]] = judge_meeting_summary,
+) -> Dict[str, Any]:
+    """
+    Compare rule verdicts with the LLM judge on the same summaries
+
+    Args:
+        prejudge: Pre-judge to evaluate
+        cases: (transcript, agent_summary, expected) triples
+        llm_client: Client for the LLM judge
+        llm_judge: LLM judge function
+
+    Returns:
+        dict: How many cases the rules decided, their agreement rate with the
+        LLM judge on those cases, and the mean absolute score difference
+    """
+    decided = agreed = 0
+    total = 0
+    score_gap = 0.0
+    disagreements = []
+    for index, (transcript, summary, expected) in enumerate(cases):
+        total += 1
+        rules = prejudge.evaluate(transcript, summary, expected)
+        llm = llm_judge(transcript, summary, expected, llm_client)
+        score_gap += abs(rules["score"] - llm.get("score", 0))
+        if not rules["decided"]:
+            continue
+        decided += 1
+        if bool(rules["pass"]) == bool(llm.get("pass")):
+            agreed += 1
+        else:
+            disagreements.append(index)
+    return {
+        "cases": total,
+        "decided_locally": decided,
+        "escalation_rate": (total - decided) / total if total else 0.0,
+        "agreement_rate": agreed / decided if decided else 1.0,
+        "mean_score_difference": score_gap / total if total else 0.0,
+        "disagreements": disagreements,
+    }
+
+
+if __name__ == "__main__":
+    import json
+
+    from data.test_transcripts import TEST_TRANSCRIPTS
+    from src.agent import MeetingAgent
+    from src.llm import get_llm
+
+    client = get_llm()
+    agent = MeetingAgent(client)
+    triples = [
+        (
+            case["transcript"],
+            agent.summarize_meeting(case["transcript"]),
+            case["expected"],
+        )
+        for case in TEST_TRANSCRIPTS.values()
+        if "expected" in case
+    ]
+    print(json.dumps(measure_agreement(RulePreJudge(), triples, client), indent=2))
@@ -0,0 +1,372 @@
+"""Parallel, cached and resumable evaluation of the agent with the LLM judge
+
+Runs MeetingAgent.summarize_meeting and judge_meeting_summary for every test
+case concurrently, caches judge verdicts by (transcript, summary, expected),
+appends each finished case to a JSON Lines results file so an interrupted run
+picks up where it stopped, and prints an aggregate report.
+
+Usage:
+    python -m judge.runner                          # data/test_transcripts.py
+    python -m judge.runner --corpus cases.jsonl --workers 16
+    python -m judge.runner --fresh                  # ignore previous results
+    python -m judge.runner --prejudge               # settle clear cases locally
+
+A corpus file holds one case per line in the shape of TEST_TRANSCRIPTS
+values plus a ``name``: {"name", "transcript", "expected" | "expected_error"}.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.cache import CacheStore
+
+from .llm_judge import CRITERIA, judge_meeting_summary
+
+DEFAULT_RESULTS_PATH = os.path.join(".pytest_cache", "judge_results.jsonl")
+DEFAULT_VERDICT_CACHE_PATH = os.path.join(".pytest_cache", "judge_verdicts.sqlite3")
+
+
+def _digest(*parts: Any) -> str:
+    """Stable hash of JSON-serializable values"""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def verdict_key(
+    transcript: str, summary: Dict[str, Any], expected: Dict[str, Any]
+) -> str:
+    """Cache key of a judge verdict"""
+    return _digest("verdict", transcript, summary, expected)
+
+
+def case_key(name: str, case: Dict[str, Any]) -> str:
+    """Identity of a test case; edited cases get a new key and are re-run"""
+    return _digest(
+        "case",
+        name,
+        case["transcript"],
+        case.get("expected"),
+        case.get("expected_error"),
+    )
+
+
+def load_corpus(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load test cases from a JSON Lines file
+
+    Args:
+        path: File with one {"name", "transcript", ...} object per line
+
+    Returns:
+        dict: Cases keyed by name, in the shape of TEST_TRANSCRIPTS
+    """
+    cases = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            case = json.loads(line)
+            cases[case.pop("name", f"case_{number}")] = case
+    return cases
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(len(ordered) * pct / 100) - 1)
+    return ordered[index]
+
+
+class EvaluationRunner:
+    """Evaluate test cases concurrently with cached verdicts and resumable output"""
+
+    def __init__(
+        self,
+        agent,
+        llm_client,
+        max_workers: int = 4,
+        verdict_cache: Optional[CacheStore] = None,
+        results_path: Optional[str] = DEFAULT_RESULTS_PATH,
+        judge: Callable[..., Dict[str, Any]] = judge_meeting_summary,
+    ):
+        """
+        Args:
+            agent: MeetingAgent producing summaries
+            llm_client: Client passed to the judge
+            max_workers: Cases evaluated at once
+            verdict_cache: Store for judge verdicts; defaults to a SQLite file
+                next to the pytest cache
+            results_path: JSON Lines file that finished cases are appended to
+                and resumed from; None disables resuming
+            judge: Function with judge_meeting_summary's signature
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.agent = agent
+        self.llm_client = llm_client
+        self.max_workers = max_workers
+        if verdict_cache is None:
+            verdict_cache = CacheStore(path=DEFAULT_VERDICT_CACHE_PATH)
+        self.verdict_cache = verdict_cache
+        self.results_path = results_path
+        self.judge = judge
+        self._write_lock = threading.Lock()
+
+    def load_results(self) -> Dict[str, Dict[str, Any]]:
+        """Successful records from previous runs, keyed by case key"""
+        records: Dict[str, Dict[str, Any]] = {}
+        if not self.results_path or not os.path.exists(self.results_path):
+            return records
+        with open(self.results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a line cut short by an interrupted run
+                if record.get("error") is None:
+                    records[record["key"]] = record
+        return records
+
+    def run(
+        self,
+        test_cases: Dict[str, Dict[str, Any]],
+        resume: bool = True,
+        on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate every test case and aggregate the results
+
+        Args:
+            test_cases: Cases in the shape of data.test_transcripts.TEST_TRANSCRIPTS
+            resume: Reuse records of cases finished by an earlier run
+            on_record: Called with each record as its case finishes
+
+        Returns:
+            dict: Aggregate report (see build_report)
+        """
+        previous = self.load_results() if resume else {}
+        if not resume and self.results_path and os.path.exists(self.results_path):
+            os.remove(self.results_path)
+
+        records: List[Dict[str, Any]] = []
+        pending = []
+        for name, case in test_cases.items():
+            record = previous.get(case_key(name, case))
+            if record is not None:
+                records.append(dict(record, resumed=True))
+            else:
+                pending.append((name, case))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.evaluate_case, name, case)
+                for name, case in pending
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                self._append(record)
+                records.append(record)
+                if on_record is not None:
+                    on_record(record)
+
+        order = {name: index for index, name in enumerate(test_cases)}
+        records.sort(key=lambda record: order[record["case"]])
+        return build_report(records)
+
+    def evaluate_case(self, name: str, case: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize and judge one case, never raising
+
+        Args:
+            name: Case name
+            case: Case with transcript and expected / expected_error
+
+        Returns:
+            dict: Record with verdict, summary, latencies and any error
+        """
+        record: Dict[str, Any] = {
+            "case": name,
+            "key": case_key(name, case),
+            "pass": False,
+            "score": 0,
+            "criteria_scores": {},
+            "issues": [],
+            "summary": None,
+            "cached": False,
+            "error": None,
+        }
+        started = time.perf_counter()
+        try:
+            summary = self.agent.summarize_meeting(case["transcript"])
+            record["summary"] = summary
+            record["agent_seconds"] = time.perf_counter() - started
+
+            judged = time.perf_counter()
+            if "expected_error" in case:
+                passed = summary.get("error") == case["expected_error"]
+                record.update({"pass": passed, "score": 100 if passed else 0})
+                if not passed:
+                    record["issues"] = [
+                        f"Expected {case['expected_error']}, got {summary}"
+                    ]
+            else:
+                evaluation, cached = self._judge(
+                    case["transcript"], summary, case.get("expected", {})
+                )
+                record.update(
+                    {
+                        "pass": bool(evaluation.get("pass")),
+                        "score": evaluation.get("score", 0),
+                        "criteria_scores": evaluation.get("criteria_scores") or {},
+                        "issues": evaluation.get("issues") or [],
+                        "feedback": evaluation.get("feedback"),
+                        "judge": evaluation.get("judge", "llm"),
+                        "cached": cached,
+                    }
+                )
+                if str(evaluation.get("feedback", "")).startswith(
+                    "Judge evaluation failed"
+                ):
+                    record["error"] = evaluation["feedback"]
+            record["judge_seconds"] = time.perf_counter() - judged
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        record["total_seconds"] = time.perf_counter() - started
+        return record
+
+    def _judge(
+        self, transcript: str, summary: Dict[str, Any], expected: Dict[str, Any]
+    ):
+        """Return (evaluation, served_from_cache)"""
+        key = verdict_key(transcript, summary, expected)
+        try:
+            cached = self.verdict_cache.get(key)
+        except Exception:
+            cached = None
+        if cached is not None:
+            return json.loads(cached), True
+
+        evaluation = self.judge(transcript, summary, expected, self.llm_client)
+        # Rule verdicts are cheap to recompute; only LLM verdicts are cached
+        if evaluation.get("judge") != "rules" and not str(
+            evaluation.get("feedback", "")
+        ).startswith("Judge evaluation failed"):
+            try:
+                self.verdict_cache.set(key, json.dumps(evaluation))
+            except Exception:
+                pass
+        return evaluation, False
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if not self.results_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.results_path))
+        os.makedirs(directory, exist_ok=True)
+        line = json.dumps(record, default=str) + "\n"
+        with self._write_lock, open(self.results_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def build_report(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate evaluation records
+
+    Args:
+        records: Records produced by EvaluationRunner.evaluate_case
+
+    Returns:
+        dict: Pass rate, mean score, per-criterion means, latency percentiles,
+        cache/resume/pre-judge counts and the names of failed or errored cases
+    """
+    records = list(records)
+    completed = [r for r in records if r.get("error") is None]
+    passed = [r for r in completed if r["pass"]]
+
+    criteria: Dict[str, float] = {}
+    for criterion in CRITERIA:
+        scores = [
+            r["criteria_scores"][criterion]
+            for r in completed
+            if isinstance(r.get("criteria_scores", {}).get(criterion), (int, float))
+        ]
+        if scores:
+            criteria[criterion] = sum(scores) / len(scores)
+
+    latencies = [r["total_seconds"] for r in records if "total_seconds" in r]
+    return {
+        "cases": len(records),
+        "completed": len(completed),
+        "passed": len(passed),
+        "pass_rate": len(passed) / len(completed) if completed else 0.0,
+        "mean_score": (
+            sum(r["score"] for r in completed) / len(completed) if completed else 0.0
+        ),
+        "criteria_means": criteria,
+        "latency_seconds": (
+            {
+                "mean": sum(latencies) / len(latencies),
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "max": max(latencies),
+            }
+            if latencies
+            else {}
+        ),
+        "cached_verdicts": sum(1 for r in records if r.get("cached")),
+        "local_verdicts": sum(1 for r in records if r.get("judge") == "rules"),
+        "resumed": sum(1 for r in records if r.get("resumed")),
+        "failed": [r["case"] for r in completed if not r["pass"]],
+        "errors": {r["case"]: r["error"] for r in records if r.get("error")},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="JSON Lines file of test cases")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--results", default=DEFAULT_RESULTS_PATH)
+    parser.add_argument("--report", help="also write the report to this JSON file")
+    parser.add_argument("--fresh", action="store_true", help="ignore earlier results")
+    parser.add_argument(
+        "--prejudge",
+        action="store_true",
+        help="decide clear passes/fails with rules, judge only borderline cases",
+    )
+    args = parser.parse_args(argv)
+
+    from data.test_transcripts import TEST_TRANSCRIPTS
+    from .prejudge import RulePreJudge
+    from src.agent import MeetingAgent
+    from src.llm import get_llm
+
+    test_cases = load_corpus(args.corpus) if args.corpus else TEST_TRANSCRIPTS
+    llm_client = get_llm()
+    runner = EvaluationRunner(
+        MeetingAgent(llm_client),
+        llm_client,
+        max_workers=args.workers,
+        results_path=args.results,
+        judge=RulePreJudge().judge if args.prejudge else judge_meeting_summary,
+    )
+
+    def progress(record: Dict[str, Any]) -> None:
+        status = "ERROR" if record["error"] else ("PASS" if record["pass"] else "FAIL")
+        print(f"{status:5} {record['score']:>5} {record['case']}", file=sys.stderr)
+
+    report = runner.run(test_cases, resume=not args.fresh, on_record=progress)
+    print(json.dumps(report, indent=2))
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2) + "\n")
+    return 0 if report["completed"] == report["cases"] and not report["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,58 +1,694 @@
+import asyncio
+import copy
 import json
 import os
-import re
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .chunking import chunk_transcript, estimate_tokens, merge_summaries
+from .classifier import TranscriptClassifier
+from .compaction import CompactionResult, TranscriptCompactor, expand_owner_aliases
+from .deadlines import DeadlineResolver
+from .helpers import (
+    MEETING_SUMMARY_SCHEMA,
+    extract_json_object,
+    normalize_structured_summary,
+    validate_meeting_summary,
+)
+from .live import LiveMeetingSession
+from .models import summary_from_dict
+from .routing import ModelRouter, Route
+from .speakers import SpeakerIndex
+from .store import ActionItemStore
+from .streaming import ACTION_ITEMS, SUMMARY, StreamEvent, SummaryStreamParser
+from .telemetry import count, span
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one transcript in a batch; exactly one of summary/error is set"""
+
+    index: int
+    summary: Optional[Dict[str, Any]]
+    error: Optional[Exception]
 
 
 class MeetingAgent:
     """Agent responsible for analyzing meeting transcripts and extracting
     structured information"""
 
-    def __init__(self, llm_client):
+    def __init__(
+        self,
+        llm_client,
+        chunk_token_budget: int = 6000,
+        max_workers: int = 4,
+        pre_classifier: Optional[TranscriptClassifier] = None,
+        use_pre_classifier: bool = True,
+        structured_output: bool = True,
+        compactor: Optional[TranscriptCompactor] = None,
+        deadline_resolver: Optional[DeadlineResolver] = None,
+        canonicalize_owners: bool = True,
+        store: Optional[ActionItemStore] = None,
+        router: Optional[ModelRouter] = None,
+    ):
+        """
+        Args:
+            llm_client: Client exposing complete(prompt, system=...) (and
+                acomplete() for async use)
+            chunk_token_budget: Transcripts estimated above this many tokens are
+                split on speaker turns and summarized chunk by chunk
+            max_workers: Threads used to summarize chunks of one long transcript
+            pre_classifier: Local classifier answering obvious NOT_A_MEETING_TRANSCRIPT /
+                NO_ACTION_ITEMS_FOUND inputs; defaults to TranscriptClassifier()
+            use_pre_classifier: Set False to always ask the LLM
+            structured_output: Request schema-constrained JSON when the client
+                supports complete_structured(), instead of parsing free text
+            compactor: Optional TranscriptCompactor applied before prompting to
+                cut filler turns, whitespace and repeated speaker labels
+            deadline_resolver: Optional DeadlineResolver run after summarizing;
+                each action item gains ``deadline_iso``, its deadline resolved
+                against the meeting time
+            canonicalize_owners: Rewrite owners that refer to a speaker
+                ("bob", "Alice Johnson") to the transcript's speaker label
+            store: Optional ActionItemStore that every successful summary is
+                appended to, for cross-meeting owner/deadline queries
+            router: Optional ModelRouter choosing model and max_tokens per
+                prompt; an answer failing validate_meeting_summary is retried
+                once on its escalated route. Requires a client accepting
+                model= and max_tokens= (LLMClient)
+        """
         self.llm_client = llm_client
+        self.chunk_token_budget = chunk_token_budget
+        self.max_workers = max_workers
+        self.structured_output = structured_output
+        self.compactor = compactor
+        self.deadline_resolver = deadline_resolver
+        self.canonicalize_owners = canonicalize_owners
+        self.store = store
+        self.router = router
+        self.pre_classifier = None
+        if use_pre_classifier:
+            self.pre_classifier = pre_classifier or TranscriptClassifier()
         self.summary_prompt = self._load_summary_prompt()
 
     def _load_summary_prompt(self) -> str:
         """Load the meeting summary prompt from file"""
-        try:
-            prompt_path = os.path.join(
-                os.path.dirname(__file__),
-                "..",
-                "prompts",
-                "summary.txt",
+        prompt_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "prompts",
+            "summary.txt",
+        )
+        with span("agent.load_prompt"):
+            try:
+                with open(prompt_path, "r", encoding="utf-8") as f:
+                    return f.read().strip()
+            except FileNotFoundError:
+                return (
+                    "Analyze the meeting transcript and extract meeting title, "
+                    "agenda, and action items."
+                )
+
+    def _build_prompt(self, transcript: str, note: str = "") -> str:
+        """Build the user message: an optional note and the transcript
+
+        The summary instructions are sent separately as the system message
+        (see _summarize_prompt), so every request shares an identical prefix.
+        """
+        if note:
+            note = f"{note}\n\n"
+        return f"{note}MEETING TRANSCRIPT:\n{transcript}"
+
+    def _chunk_prompts(self, transcript: str, legend: str = "") -> Optional[List[str]]:
+        """Return per-chunk prompts if the transcript exceeds the chunk budget"""
+        if estimate_tokens(transcript) <= self.chunk_token_budget:
+            return None
+        chunks = chunk_transcript(transcript, self.chunk_token_budget)
+        if len(chunks) < 2:
+            return None
+        prefix = f"{legend}\n\n" if legend else ""
+        return [
+            self._build_prompt(
+                chunk,
+                f"{prefix}The transcript below is part {number} of {len(chunks)} "
+                "of a longer meeting. Summarize only what this part contains.",
+            )
+            for number, chunk in enumerate(chunks, 1)
+        ]
+
+    def _compact(self, transcript: str) -> Optional[CompactionResult]:
+        """Compact the transcript if a compactor is configured and it leaves text"""
+        if self.compactor is None:
+            return None
+        with span("agent.compact"):
+            result = self.compactor.compact(transcript)
+        if not result.text.strip():
+            return None
+        count("agent_compaction_tokens", result.original_tokens, stage="before")
+        count("agent_compaction_tokens", result.compacted_tokens, stage="after")
+        return result
+
+    def _prepare_prompts(self, transcript: str) -> Tuple[List[str], Dict[str, str]]:
+        """Build the prompt(s) for a transcript and the speaker aliases they use"""
+        legend, aliases = "", {}
+        compacted = self._compact(transcript)
+        if compacted is not None:
+            transcript, legend, aliases = (
+                compacted.text,
+                compacted.legend,
+                compacted.aliases,
+            )
+        with span("agent.build_prompts"):
+            prompts = self._chunk_prompts(transcript, legend)
+        if prompts is None:
+            return [self._build_prompt(transcript, legend)], aliases
+        count("agent_chunked_transcripts")
+        return prompts, aliases
+
+    def _pre_classify(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """Return an error response if the local classifier is confident, else None"""
+        if self.pre_classifier is None:
+            return None
+        with span("agent.pre_classify"):
+            label = self.pre_classifier.classify(transcript).label
+        if label:
+            count("agent_local_answers", label=label)
+            return {"error": label}
+        return None
+
+    def _uses_structured_output(self) -> bool:
+        return self.structured_output and hasattr(
+            self.llm_client, "complete_structured"
+        )
+
+    def _dedupe_options(
+        self, transcript: str, aliases: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Let the client reuse a near-duplicate transcript's summary
+
+        Only whole-transcript prompts qualify, and only without speaker
+        aliases, whose legend the cached response would not match.
+        """
+        if aliases or getattr(self.llm_client, "near_duplicates", None) is None:
+            return {}
+        return {"dedupe_text": transcript}
+
+    def _route(self, prompt: str) -> Optional[Route]:
+        """Model and output budget for a prompt, if the agent has a router"""
+        if self.router is None:
+            return None
+        with span("agent.route"):
+            route = self.router.route(prompt)
+        count("agent_routes", tier=route.tier, model=route.model)
+        return route
+
+    def _request_options(
+        self, dedupe: Optional[Dict[str, Any]], route: Optional[Route]
+    ) -> Dict[str, Any]:
+        options = dict(dedupe or {}, system=self.summary_prompt)
+        if route is not None:
+            options.update(model=route.model, max_tokens=route.max_tokens)
+        return options
+
+    def _request_summary(
+        self,
+        prompt: str,
+        dedupe: Optional[Dict[str, Any]] = None,
+        route: Optional[Route] = None,
+    ) -> Dict[str, Any]:
+        """Send one summary prompt, using structured output when the client supports it"""
+        options = self._request_options(dedupe, route)
+        if self._uses_structured_output():
+            return normalize_structured_summary(
+                self.llm_client.complete_structured(
+                    prompt, MEETING_SUMMARY_SCHEMA, "meeting_summary", **options
+                )
+            )
+        return self._parse_summary_response(self.llm_client.complete(prompt, **options))
+
+    async def _arequest_summary(
+        self,
+        prompt: str,
+        dedupe: Optional[Dict[str, Any]] = None,
+        route: Optional[Route] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of _request_summary"""
+        options = self._request_options(dedupe, route)
+        if self._uses_structured_output():
+            return normalize_structured_summary(
+                await self.llm_client.acomplete_structured(
+                    prompt, MEETING_SUMMARY_SCHEMA, "meeting_summary", **options
+                )
             )
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            return (
-                "Analyze the meeting transcript and extract meeting title, "
-                "agenda, and action items."
+        return self._parse_summary_response(
+            await self.llm_client.acomplete(prompt, **options)
+        )
+
+    def _escalation(
+        self, route: Optional[Route], summary: Optional[Dict[str, Any]]
+    ) -> Optional[Route]:
+        """Stronger route if the routed answer was unparseable or invalid"""
+        if route is None or (summary is not None and validate_meeting_summary(summary)):
+            return None
+        escalated = self.router.escalate(route)
+        if escalated is not None:
+            reason = "unparseable" if summary is None else "invalid"
+            count("agent_escalations", reason=reason, model=escalated.model)
+        return escalated
+
+    def _summarize_prompt(
+        self, prompt: str, dedupe: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Summarize one prompt on its route, escalating once if the answer is invalid"""
+        route = self._route(prompt)
+        error = None
+        try:
+            summary = self._request_summary(prompt, dedupe, route)
+        except ValueError as e:
+            if route is None:
+                raise
+            summary, error = None, e
+        escalated = self._escalation(route, summary)
+        if escalated is None:
+            if error is not None:
+                raise error
+            return summary
+        return self._request_summary(prompt, dedupe, escalated)
+
+    async def _asummarize_prompt(
+        self, prompt: str, dedupe: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of _summarize_prompt"""
+        route = self._route(prompt)
+        error = None
+        try:
+            summary = await self._arequest_summary(prompt, dedupe, route)
+        except ValueError as e:
+            if route is None:
+                raise
+            summary, error = None, e
+        escalated = self._escalation(route, summary)
+        if escalated is None:
+            if error is not None:
+                raise error
+            return summary
+        return await self._arequest_summary(prompt, dedupe, escalated)
+
+    def summarize_meeting(
+        self,
+        transcript: str,
+        reference_time: Optional[Union[date, datetime, str]] = None,
+    ) -> Dict[str, Any]:
+        """Summarize a meeting transcript and extract action items, owners, and deadlines
+
+        reference_time is when the meeting took place (default: now); it is
+        only used when the agent has a deadline_resolver.
+        """
+        with span("agent.summarize_meeting", transcript_chars=len(transcript)):
+            summary = self._summarize_meeting(transcript)
+            return self._finish(transcript, summary, reference_time)
+
+    def _finish(
+        self,
+        transcript: str,
+        summary: Dict[str, Any],
+        reference_time: Optional[Union[date, datetime, str]],
+    ) -> Dict[str, Any]:
+        """Post-process a summary: owners, deadlines and the store"""
+        self._resolve_owners(transcript, summary)
+        summary = self._resolve_deadlines(summary, reference_time)
+        self._ingest(transcript, summary, reference_time)
+        return summary
+
+    def _summarize_meeting(self, transcript: str) -> Dict[str, Any]:
+        verdict = self._pre_classify(transcript)
+        if verdict is not None:
+            return verdict
+
+        prompts, aliases = self._prepare_prompts(transcript)
+        return self._summarize_prompts(transcript, prompts, aliases)
+
+    def _summarize_prompts(
+        self, transcript: str, prompts: List[str], aliases: Dict[str, str]
+    ) -> Dict[str, Any]:
+        if len(prompts) == 1:
+            dedupe = self._dedupe_options(transcript, aliases)
+            summary = self._summarize_prompt(prompts[0], dedupe)
+            return expand_owner_aliases(summary, aliases)
+
+        def summarize_chunk(prompt: str):
+            try:
+                return self._summarize_prompt(prompt)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(self.max_workers, len(prompts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(summarize_chunk, prompts))
+        return expand_owner_aliases(self._merge_chunk_outcomes(outcomes), aliases)
+
+    async def asummarize_meeting(
+        self,
+        transcript: str,
+        reference_time: Optional[Union[date, datetime, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of summarize_meeting using the client's acomplete()"""
+        with span("agent.asummarize_meeting", transcript_chars=len(transcript)):
+            summary = await self._asummarize_meeting(transcript)
+            return self._finish(transcript, summary, reference_time)
+
+    async def _asummarize_meeting(self, transcript: str) -> Dict[str, Any]:
+        verdict = self._pre_classify(transcript)
+        if verdict is not None:
+            return verdict
+
+        prompts, aliases = self._prepare_prompts(transcript)
+        if len(prompts) == 1:
+            dedupe = self._dedupe_options(transcript, aliases)
+            summary = await self._asummarize_prompt(prompts[0], dedupe)
+            return expand_owner_aliases(summary, aliases)
+
+        async def summarize_chunk(prompt: str):
+            try:
+                return await self._asummarize_prompt(prompt)
+            except Exception as e:
+                return e
+
+        outcomes = await asyncio.gather(*(summarize_chunk(p) for p in prompts))
+        return expand_owner_aliases(self._merge_chunk_outcomes(outcomes), aliases)
+
+    def stream_summary(
+        self,
+        transcript: str,
+        reference_time: Optional[Union[date, datetime, str]] = None,
+    ) -> Iterator[StreamEvent]:
+        """
+        Summarize a meeting, yielding parts of the summary as they are generated
+
+        Each top-level field and each action item is yielded as soon as the
+        model has finished writing it, then the final summary, post-processed
+        and escalated exactly like summarize_meeting()'s. Partial events carry
+        the model's raw values; only the final summary is validated. Inputs
+        answered locally, chunked transcripts and clients without
+        stream_complete() yield only the final summary.
+
+        Args:
+            transcript: Meeting transcript
+            reference_time: When the meeting took place; see summarize_meeting
+
+        Yields:
+            StreamEvent: Partial fields, then StreamEvent("summary", summary)
+        """
+        summary = yield from self._stream_meeting(transcript)
+        yield StreamEvent(SUMMARY, self._finish(transcript, summary, reference_time))
+
+    def _stream_meeting(
+        self, transcript: str
+    ) -> Generator[StreamEvent, None, Dict[str, Any]]:
+        verdict = self._pre_classify(transcript)
+        if verdict is not None:
+            return verdict
+
+        prompts, aliases = self._prepare_prompts(transcript)
+        if len(prompts) > 1 or not hasattr(self.llm_client, "stream_complete"):
+            return self._summarize_prompts(transcript, prompts, aliases)
+
+        prompt = prompts[0]
+        dedupe = self._dedupe_options(transcript, aliases)
+        route = self._route(prompt)
+        options = self._request_options(dedupe, route)
+        structured = self._uses_structured_output()
+        if structured:
+            options.update(schema=MEETING_SUMMARY_SCHEMA, schema_name="meeting_summary")
+
+        count("agent_streamed_summaries")
+        parser = SummaryStreamParser()
+        for piece in self.llm_client.stream_complete(prompt, **options):
+            for event in parser.feed(piece):
+                if event.value is None:
+                    continue
+                if event.field == ACTION_ITEMS and aliases:
+                    expand_owner_aliases({ACTION_ITEMS: [event.value]}, aliases)
+                yield event
+
+        error = None
+        try:
+            summary = self._parse_summary_response(parser.text)
+        except ValueError as e:
+            if route is None:
+                raise
+            summary, error = None, e
+        if structured and summary is not None:
+            summary = normalize_structured_summary(summary)
+        escalated = self._escalation(route, summary)
+        if escalated is not None:
+            summary = self._request_summary(prompt, dedupe, escalated)
+        elif error is not None:
+            raise error
+        return expand_owner_aliases(summary, aliases)
+
+    def _resolve_owners(self, transcript: str, summary: Dict[str, Any]) -> None:
+        """Canonicalize owners against the speaker index and count invented ones"""
+        if not self.canonicalize_owners or "action_items" not in summary:
+            return
+        with span("agent.resolve_owners"):
+            index = SpeakerIndex.for_transcript(transcript)
+            hallucinated = index.canonicalize_owners(summary)
+        if hallucinated:
+            count("agent_hallucinated_owners", len(hallucinated))
+
+    def owner_report(self, transcript: str, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Check a summary's owners against the transcript's speakers
+
+        Args:
+            transcript: The summarized transcript
+            summary: Summary returned by summarize_meeting
+
+        Returns:
+            dict: Per-speaker turns, mentions and aliases ("speakers"),
+            action items per owner ("action_items") and owners that appear
+            nowhere in the transcript ("hallucinated")
+        """
+        index = SpeakerIndex.for_transcript(transcript)
+        items = summary.get("action_items") or []
+        return {
+            "speakers": index.stats(),
+            "action_items": index.action_item_counts(summary),
+            "hallucinated": sorted(
+                {
+                    item["owner"]
+                    for item in items
+                    if isinstance(item, dict)
+                    and index.is_hallucinated(item.get("owner"))
+                }
+            ),
+        }
+
+    def _ingest(
+        self,
+        transcript: str,
+        summary: Dict[str, Any],
+        reference_time: Optional[Union[date, datetime, str]],
+    ) -> None:
+        """
+        Append a successful summary to the store; storage never fails a summary
+
+        The summary is stored as a MeetingSummary, so it is validated once
+        here and a malformed answer never reaches the store.
+        """
+        if self.store is None or "action_items" not in summary:
+            return
+        try:
+            with span("agent.store_ingest"):
+                self.store.ingest(
+                    summary_from_dict(summary), transcript, held_at=reference_time
+                )
+        except Exception:
+            count("agent_store_errors")
+
+    def _resolve_deadlines(
+        self,
+        summary: Dict[str, Any],
+        reference_time: Optional[Union[date, datetime, str]],
+    ) -> Dict[str, Any]:
+        """Optional post-processing: add ISO deadlines to the action items"""
+        if self.deadline_resolver is None:
+            return summary
+        with span("agent.resolve_deadlines"):
+            return self.deadline_resolver.resolve_summary(
+                summary, reference_time or datetime.now()
             )
 
-    def summarize_meeting(self, transcript: str) -> Dict[str, Any]:
-        """Summarize a meeting transcript and extract action items, owners, and deadlines"""
-        raise NotImplementedError("summarize_meeting must be implemented by the user")
+    @staticmethod
+    def _merge_chunk_outcomes(outcomes: List[Any]) -> Dict[str, Any]:
+        """
+        Merge chunk summaries, tolerating failed chunks unless all of them fail
+
+        A chunk whose answer fails validate_meeting_summary counts as failed,
+        so one malformed part cannot break the merge of the others.
+        """
+        summaries = [
+            o for o in outcomes if isinstance(o, dict) and validate_meeting_summary(o)
+        ]
+        if len(summaries) < len(outcomes):
+            count("agent_failed_chunks", len(outcomes) - len(summaries))
+        if not summaries:
+            errors = [o for o in outcomes if isinstance(o, Exception)]
+            if errors:
+                raise errors[0]
+            raise ValueError("No chunk produced a valid summary")
+        return merge_summaries(summaries)
+
+    def live_session(self, window_tokens: int = 400) -> LiveMeetingSession:
+        """
+        Start an incremental summary of a meeting that is still in progress
+
+        Args:
+            window_tokens: Approximate size of each newly arrived segment sent to
+                the LLM
+
+        Returns:
+            LiveMeetingSession accepting transcript lines via feed()
+        """
+        return LiveMeetingSession(self, window_tokens=window_tokens)
+
+    def summarize_many(
+        self,
+        transcripts: Iterable[str],
+        max_workers: int = 4,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Summarize many transcripts concurrently
+
+        Identical transcripts are summarized once and the result is reported
+        for each of their positions, each position getting its own copy of
+        the summary. A failure for one transcript is returned
+        as that item's error and does not affect the rest of the batch.
+
+        Args:
+            transcripts: Transcripts to summarize
+            max_workers: Number of worker threads
+            ordered: Yield results in input order; if False, yield as they complete
+
+        Yields:
+            BatchResult for each input transcript
+        """
+        positions = self._group_duplicates(transcripts)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self.summarize_meeting, transcript): transcript
+                for transcript in positions
+            }
+            if ordered:
+                by_transcript = {t: f for f, t in futures.items()}
+                for index, future in enumerate(
+                    self._by_index(positions, by_transcript)
+                ):
+                    yield self._batch_result(index, future)
+                return
+
+            for future in as_completed(futures):
+                for index in positions[futures[future]]:
+                    yield self._batch_result(index, future)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def asummarize_many(
+        self,
+        transcripts: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Async variant of summarize_many
+
+        Args:
+            transcripts: Transcripts to summarize
+            max_concurrency: Optional cap on summaries in progress; the LLM client
+                additionally bounds in-flight upstream requests
+            ordered: Yield results in input order; if False, yield as they complete
+
+        Yields:
+            BatchResult for each input transcript
+        """
+        positions = self._group_duplicates(transcripts)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(transcript: str):
+            try:
+                if semaphore is None:
+                    return transcript, await self.asummarize_meeting(transcript), None
+                async with semaphore:
+                    return transcript, await self.asummarize_meeting(transcript), None
+            except Exception as e:
+                return transcript, None, e
+
+        tasks = {t: asyncio.ensure_future(run(t)) for t in positions}
+        try:
+            if ordered:
+                for index, task in enumerate(self._by_index(positions, tasks)):
+                    _, summary, error = await task
+                    yield BatchResult(index, copy.deepcopy(summary), error)
+                return
+
+            for next_done in asyncio.as_completed(list(tasks.values())):
+                transcript, summary, error = await next_done
+                for index in positions[transcript]:
+                    yield BatchResult(index, copy.deepcopy(summary), error)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    @staticmethod
+    def _group_duplicates(transcripts: Iterable[str]) -> Dict[str, List[int]]:
+        """Map each distinct transcript to the input positions where it occurs"""
+        positions: Dict[str, List[int]] = {}
+        for index, transcript in enumerate(transcripts):
+            positions.setdefault(transcript, []).append(index)
+        return positions
+
+    @staticmethod
+    def _by_index(
+        positions: Dict[str, List[int]], handles: Dict[str, Any]
+    ) -> List[Any]:
+        """Expand per-transcript futures/tasks back into input order"""
+        ordered = [None] * sum(len(indices) for indices in positions.values())
+        for transcript, indices in positions.items():
+            for index in indices:
+                ordered[index] = handles[transcript]
+        return ordered
+
+    @staticmethod
+    def _batch_result(index: int, future) -> BatchResult:
+        """Convert a finished future into a BatchResult, capturing its failure"""
+        try:
+            summary = future.result()
+        except Exception as e:
+            return BatchResult(index, None, e)
+        return BatchResult(index, copy.deepcopy(summary), None)
 
     @staticmethod
     def _parse_summary_response(response_text: str) -> Dict[str, Any]:
         """Parse summary output while handling fenced or malformed JSON."""
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError as err:
-            markdown_json_match = re.search(
-                r"```json\s*(\{.*?\})\s*```", response_text, re.DOTALL
-            )
-            if markdown_json_match:
-                try:
-                    return json.loads(markdown_json_match.group(1))
-                except json.JSONDecodeError:
-                    pass
-
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                try:
-                    return json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    pass
-
-            raise ValueError("Summary response does not contain valid JSON") from err
+        with span("agent.parse_response", response_chars=len(response_text)):
+            try:
+                return extract_json_object(response_text)
+            except json.JSONDecodeError as err:
+                raise ValueError(
+                    "Summary response does not contain valid JSON"
+                ) from err
@@ -0,0 +1,487 @@
+"""LLM backends used by LLMClient
+
+A backend turns a prompt into response text. LLMClient layers caching,
+request coalescing and concurrency limits on top, so every backend gets those
+for free. Select one with the LLM_BACKEND environment variable:
+
+- ``openai`` (default): llama_index OpenAI model, requires OPENAI_API_KEY
+- ``replay``: serves responses recorded in LLM_REPLAY_PATH (JSON Lines)
+- ``fake``: offline, deterministic, schema-valid summaries with configurable
+  latency (LLM_FAKE_LATENCY_MS, LLM_FAKE_JITTER_MS) for load testing
+
+Backends may also implement ``stream_complete``, yielding the response text
+in pieces as it is generated; LLMClient.stream_complete falls back to a
+single piece from complete() for those that don't (see stream_backend).
+
+Setting LLM_RECORD_PATH wraps the selected backend so every response is
+appended to that file in the format the replay backend reads.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+from .chunking import SPEAKER_TURN_PATTERN
+from .classifier import COMMITMENT_PATTERN, DEADLINE_PATTERN
+from .telemetry import record_token_usage
+
+
+class LLMBackend(Protocol):
+    """Interface every backend implements"""
+
+    name: str
+    model: str
+    max_tokens: int
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        """Return the completion text for a prompt
+
+        ``kwargs`` may include ``system``: instructions sent as a separate,
+        leading system message so providers can cache that prefix, and
+        ``model`` / ``max_tokens`` overriding the backend's defaults for this
+        request.
+        """
+        ...
+
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        """Async variant of complete()"""
+        ...
+
+
+def _validate_openai_environment():
+    """Validate required environment variables"""
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError(
+            "OpenAI API key is required for LLM operations. "
+            "Please set environment variables:\n"
+            "OPENAI_API_KEY=your_api_key\n"
+            "OPENAI_API_BASE=https://api.openai.com/v1 (optional)\n"
+            "Example: OPENAI_API_KEY=sk-your-key python app.py\n"
+            "To run without the API set LLM_BACKEND=fake or LLM_BACKEND=replay"
+        )
+
+
+class OpenAIBackend:
+    """OpenAI chat model via llama_index"""
+
+    name = "openai"
+    # Token usage comes from the API response rather than an estimate
+    reports_usage = True
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        max_tokens: int = 4096,
+        temperature: float = 0.1,
+        llm=None,
+        timeout: float = 60.0,
+        max_retries: int = 0,
+    ):
+        """
+        Args:
+            model: OpenAI model name
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            llm: Pre-built llama_index LLM to use instead of constructing one
+            timeout: HTTP timeout in seconds for one request
+            max_retries: Retries inside the OpenAI SDK; 0 because LLMClient's
+                resilience policy already retries with backoff
+        """
+        if llm is None:
+            _validate_openai_environment()
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._llm = llm
+        self._prebuilt = llm is not None
+        # Instances for routed (model, max_tokens) pairs other than the default
+        self._routed: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def _build_llm(self, model: str, max_tokens: int):
+        from llama_index.llms.openai import OpenAI
+
+        return OpenAI(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+        )
+
+    @property
+    def llm(self):
+        """Get LLM instance (lazy initialization)"""
+        if self._llm is None:
+            self._llm = self._build_llm(self.model, self.max_tokens)
+        return self._llm
+
+    def _llm_for(self, kwargs: Dict[str, Any]):
+        """
+        LLM instance for a request, consuming its model/max_tokens overrides
+
+        llama_index applies an instance's max_tokens over per-call arguments,
+        so each routed pair gets its own (cached) instance. A pre-built llm
+        receives the overrides as call arguments instead.
+        """
+        model = kwargs.pop("model", self.model)
+        max_tokens = kwargs.pop("max_tokens", self.max_tokens)
+        if (model, max_tokens) == (self.model, self.max_tokens):
+            return self.llm, model
+        if self._prebuilt:
+            kwargs.update(model=model, max_tokens=max_tokens)
+            return self.llm, model
+        with self._lock:
+            llm = self._routed.get((model, max_tokens))
+            if llm is None:
+                llm = self._routed[(model, max_tokens)] = self._build_llm(
+                    model, max_tokens
+                )
+        return llm, model
+
+    def complete(self, prompt: str, system: Optional[str] = None, **kwargs: Any) -> str:
+        llm, model = self._llm_for(kwargs)
+        if system is None:
+            response = llm.complete(prompt, **kwargs)
+            text = response.text
+        else:
+            response = llm.chat(_chat_messages(system, prompt), **kwargs)
+            text = response.message.content or ""
+        self._record_usage(prompt, text, response, system, model)
+        return text
+
+    async def acomplete(
+        self, prompt: str, system: Optional[str] = None, **kwargs: Any
+    ) -> str:
+        llm, model = self._llm_for(kwargs)
+        if system is None:
+            response = await llm.acomplete(prompt, **kwargs)
+            text = response.text
+        else:
+            response = await llm.achat(_chat_messages(system, prompt), **kwargs)
+            text = response.message.content or ""
+        self._record_usage(prompt, text, response, system, model)
+        return text
+
+    def stream_complete(
+        self, prompt: str, system: Optional[str] = None, **kwargs: Any
+    ) -> Iterator[str]:
+        """Yield text deltas as OpenAI streams them"""
+        llm, model = self._llm_for(kwargs)
+        if system is None:
+            responses = llm.stream_complete(prompt, **kwargs)
+        else:
+            responses = llm.stream_chat(_chat_messages(system, prompt), **kwargs)
+        pieces: List[str] = []
+        for response in responses:
+            if response.delta:
+                pieces.append(response.delta)
+                yield response.delta
+        # Streamed responses carry no usage, so tokens are estimated
+        record_token_usage(model, prompt, "".join(pieces), system=system)
+
+    def _record_usage(
+        self, prompt: str, text: str, response, system: Optional[str], model: str
+    ) -> None:
+        """Count tokens from the usage llama_index copies into additional_kwargs"""
+        usage = getattr(response, "additional_kwargs", None)
+        usage = dict(usage) if isinstance(usage, dict) else {}
+        cached = _cached_prompt_tokens(getattr(response, "raw", None))
+        if cached is not None:
+            usage["cached_prompt_tokens"] = cached
+        record_token_usage(model, prompt, text, usage or None, system=system)
+
+
+def _chat_messages(system: str, prompt: str) -> List[Any]:
+    """System instructions first, so identical prefixes hit the provider cache"""
+    from llama_index.core.llms import ChatMessage, MessageRole
+
+    return [
+        ChatMessage(role=MessageRole.SYSTEM, content=system),
+        ChatMessage(role=MessageRole.USER, content=prompt),
+    ]
+
+
+def _cached_prompt_tokens(raw: Any) -> Optional[int]:
+    """Prompt tokens the provider served from its prefix cache, if reported"""
+    usage = getattr(raw, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    return cached if isinstance(cached, int) else None
+
+
+def stream_backend(backend: LLMBackend, prompt: str, **kwargs: Any) -> Iterator[str]:
+    """
+    Stream a completion, as one piece if the backend cannot stream
+
+    Args:
+        backend: Backend to call
+        prompt: The prompt text
+        **kwargs: Request options passed to the backend
+
+    Yields:
+        str: Consecutive pieces of the response text
+    """
+    stream = getattr(backend, "stream_complete", None)
+    if stream is None:
+        yield backend.complete(prompt, **kwargs)
+    else:
+        yield from stream(prompt, **kwargs)
+
+
+def recording_key(prompt: str, **kwargs: Any) -> str:
+    """
+    Key identifying a request in a recording file
+
+    Args:
+        prompt: The prompt text
+        **kwargs: Request options (e.g. response_format)
+
+    Returns:
+        str: Hex digest of the prompt and options
+    """
+    options = json.dumps(kwargs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{prompt}|{options}".encode()).hexdigest()
+
+
+class ReplayBackend:
+    """Serve previously recorded responses, failing on unrecorded prompts"""
+
+    name = "replay"
+
+    def __init__(self, path: str, model: str = "replay", max_tokens: int = 4096):
+        """
+        Args:
+            path: JSON Lines file of {"key", "response"} records, as written by
+                RecordingBackend
+            model: Model name reported for cache keys
+            max_tokens: Output token limit reported for cache keys
+        """
+        self.model = model
+        self.max_tokens = max_tokens
+        self._responses: Dict[str, str] = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._responses[record["key"]] = record["response"]
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        key = recording_key(prompt, **kwargs)
+        try:
+            return self._responses[key]
+        except KeyError:
+            raise LookupError(f"No recorded response for request {key[:12]}") from None
+
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        return self.complete(prompt, **kwargs)
+
+
+class RecordingBackend:
+    """Wrap a backend and append every response to a replay file"""
+
+    def __init__(self, inner: LLMBackend, path: str):
+        self.inner = inner
+        self.path = path
+        self.name = inner.name
+        self.model = inner.model
+        self.max_tokens = inner.max_tokens
+        self._lock = threading.Lock()
+
+    def _record(self, prompt: str, response: str, kwargs: Dict[str, Any]) -> None:
+        record = {
+            "key": recording_key(prompt, **kwargs),
+            "prompt": prompt,
+            "response": response,
+        }
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        response = self.inner.complete(prompt, **kwargs)
+        self._record(prompt, response, kwargs)
+        return response
+
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        response = await self.inner.acomplete(prompt, **kwargs)
+        self._record(prompt, response, kwargs)
+        return response
+
+    def stream_complete(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        pieces = []
+        for piece in stream_backend(self.inner, prompt, **kwargs):
+            pieces.append(piece)
+            yield piece
+        self._record(prompt, "".join(pieces), kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.inner, name)
+
+
+class FakeBackend:
+    """Deterministic offline backend for tests and load testing
+
+    Summary prompts get a schema-valid summary built from the transcript's
+    speaker lines that contain commitment cues; judge prompts get a passing
+    evaluation. Each call sleeps for ``latency`` seconds plus up to ``jitter``
+    seconds of seeded random delay to simulate network time. stream_complete
+    yields the same text in ``chunk_chars``-sized pieces, spreading the
+    delay over them.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        model: str = "fake-summarizer",
+        max_tokens: int = 4096,
+        chunk_chars: int = 16,
+    ):
+        self.latency = latency
+        self.chunk_chars = chunk_chars
+        self.jitter = jitter
+        self.model = model
+        self.max_tokens = max_tokens
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        return self.respond(prompt, **kwargs)
+
+    async def acomplete(self, prompt: str, **kwargs: Any) -> str:
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.respond(prompt, **kwargs)
+
+    def stream_complete(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        delay = self._delay()
+        text = self.respond(prompt, **kwargs)
+        pieces = [
+            text[i : i + self.chunk_chars]
+            for i in range(0, len(text), self.chunk_chars)
+        ]
+        for piece in pieces:
+            if delay:
+                time.sleep(delay / len(pieces))
+            yield piece
+
+    def respond(self, prompt: str, **kwargs: Any) -> str:
+        """Build the response text for a prompt without any delay"""
+        if "AGENT'S SUMMARY" in prompt:
+            return json.dumps(_fake_evaluation())
+
+        transcript = prompt.rsplit("MEETING TRANSCRIPT:\n", 1)[-1]
+        summary = _fake_summary(transcript)
+        if "response_format" in kwargs:
+            summary = {
+                "error": None,
+                "meeting_title": None,
+                "agenda": None,
+                "action_items": None,
+                **summary,
+            }
+        return json.dumps(summary)
+
+
+def _fake_summary(transcript: str) -> Dict[str, Any]:
+    """Summarize by picking speaker lines that contain commitment cues."""
+    items: List[Dict[str, str]] = []
+    speakers = set()
+    for line in transcript.splitlines():
+        match = SPEAKER_TURN_PATTERN.match(line)
+        if not match:
+            continue
+        speaker = match.group().strip().rstrip(":")
+        speakers.add(speaker)
+        text = line[match.end() :].strip()
+        if COMMITMENT_PATTERN.search(text):
+            deadline = DEADLINE_PATTERN.search(text)
+            items.append(
+                {
+                    "task": text,
+                    "owner": speaker,
+                    "deadline": deadline.group() if deadline else "Not specified",
+                }
+            )
+
+    if not speakers:
+        return {"error": "NOT_A_MEETING_TRANSCRIPT"}
+    if not items:
+        return {"error": "NO_ACTION_ITEMS_FOUND"}
+    return {
+        "meeting_title": f"Meeting with {', '.join(sorted(speakers)[:3])}",
+        "agenda": re.sub(r"\s+", " ", items[0]["task"])[:200],
+        "action_items": items,
+    }
+
+
+def _fake_evaluation() -> Dict[str, Any]:
+    return {
+        "pass": True,
+        "score": 80,
+        "feedback": "Fake backend evaluation",
+        "criteria_scores": {
+            "action_items_completeness": 32,
+            "ownership_accuracy": 16,
+            "deadline_accuracy": 16,
+            "meeting_context": 8,
+            "output_quality": 8,
+        },
+        "issues": [],
+    }
+
+
+def create_backend(name: Optional[str] = None) -> LLMBackend:
+    """
+    Create the backend selected by name or the LLM_BACKEND environment variable
+
+    Args:
+        name: Backend name ("openai", "replay" or "fake"); defaults to LLM_BACKEND
+
+    Returns:
+        LLMBackend: Configured backend
+    """
+    name = (name or os.getenv("LLM_BACKEND") or "openai").strip().lower()
+
+    if name == "openai":
+        backend: LLMBackend = OpenAIBackend()
+    elif name == "replay":
+        path = os.getenv("LLM_REPLAY_PATH")
+        if not path:
+            raise ValueError("LLM_REPLAY_PATH must be set when LLM_BACKEND=replay")
+        backend = ReplayBackend(path)
+    elif name == "fake":
+        backend = FakeBackend(
+            latency=float(os.getenv("LLM_FAKE_LATENCY_MS", "0")) / 1000,
+            jitter=float(os.getenv("LLM_FAKE_JITTER_MS", "0")) / 1000,
+        )
+    else:
+        raise ValueError(
+            f"Unknown LLM_BACKEND {name!r}; expected openai, replay or fake"
+        )
+
+    record_path = os.getenv("LLM_RECORD_PATH")
+    if record_path:
+        backend = RecordingBackend(backend, record_path)
+    return backend
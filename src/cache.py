@@ -0,0 +1,488 @@
+"""Persistent response cache used by the LLM client"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+LOCK_STRIPES = 65536
+# Cache hits whose recency is buffered before being written in one transaction
+TOUCH_BATCH = 64
+
+
+def _default_cache_path() -> str:
+    """Get the default cache database path (kept next to the pytest cache)."""
+    return os.path.join(os.getcwd(), ".pytest_cache", "llm_cache.sqlite3")
+
+
+def _env_number(name: str, default, cast):
+    """Read a numeric setting from the environment, falling back to a default."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return cast(value)
+    except ValueError as e:
+        raise ValueError(f"{name} must be a number, got {value!r}") from e
+
+
+class CacheStore:
+    """SQLite-backed key/value store with LRU and TTL eviction
+
+    Every entry lives in a single indexed table, so lookups are a primary-key
+    read instead of a file-system probe plus JSON parse. Writes happen inside
+    a transaction, which keeps the store consistent if the process dies
+    mid-write, and WAL mode lets several processes share one database file.
+    Entries are evicted least-recently-used first whenever the entry count or
+    total payload size exceeds its budget, and entries older than
+    ``ttl_seconds`` are treated as misses.
+
+    Triggers keep the entry count and total size in a one-row ``totals``
+    table, so checking the budgets on a write is a single-row read. Hits
+    record their access time in memory and write it in batches of
+    TOUCH_BATCH, or before the next eviction check.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = None,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.path = path or _default_cache_path()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._touched: Dict[str, float] = {}
+        self._conn = self._connect()
+        self._lock_fd: Optional[int] = None
+        self._stripe_locks: Dict[int, threading.Lock] = {}
+
+    @classmethod
+    def from_env(cls) -> "CacheStore":
+        """Build a cache store configured from LLM_CACHE_* environment variables"""
+        ttl = _env_number("LLM_CACHE_TTL_SECONDS", None, float)
+        return cls(
+            path=os.getenv("LLM_CACHE_PATH") or None,
+            max_entries=_env_number("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, int),
+            max_bytes=_env_number("LLM_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES, int),
+            ttl_seconds=ttl if ttl and ttl > 0 else None,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    entries INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+                BEGIN
+                    UPDATE totals
+                    SET entries = entries + 1, bytes = bytes + new.size
+                    WHERE id = 0;
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+                BEGIN
+                    UPDATE totals
+                    SET entries = entries - 1, bytes = bytes - old.size
+                    WHERE id = 0;
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS entries_resize
+                AFTER UPDATE OF size ON entries
+                BEGIN
+                    UPDATE totals SET bytes = bytes + new.size - old.size WHERE id = 0;
+                END
+                """
+            )
+            # Databases written before the totals table existed start from a scan
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO totals (id, entries, bytes)
+                SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM entries
+                """
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return conn
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str, count: bool = True) -> Optional[str]:
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key
+            count: Whether the lookup contributes to the hit/miss counters
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        return self.lookup(key, count)[0]
+
+    def lookup(
+        self, key: str, count: bool = True
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a cached value, keeping an expired one as a fallback
+
+        Args:
+            key: Cache key
+            count: Whether the lookup contributes to the hit/miss counters
+
+        Returns:
+            (value, stale): the value if fresh; otherwise None and, if the
+            entry had expired (and was just removed), its last value
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                if count:
+                    self._counters["misses"] += 1
+                return None, None
+
+            value, created_at = row
+            if self._is_expired(created_at, now):
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._counters["expirations"] += 1
+                if count:
+                    self._counters["misses"] += 1
+                return None, value
+
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_BATCH:
+                self._write_touches()
+            if count:
+                self._counters["hits"] += 1
+            return value, None
+
+    def _write_touches(self) -> None:
+        """Write buffered access times in their own transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._flush_touches()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _flush_touches(self) -> None:
+        """Write buffered access times; the caller holds the lock and a transaction."""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE key = ? AND accessed_at < ?",
+            [(at, key, at) for key, at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value and evict old entries if the store is over budget
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._flush_touches()
+                # An upsert rather than INSERT OR REPLACE: REPLACE deletes the
+                # old row without firing the delete trigger that keeps totals
+                self._conn.execute(
+                    """
+                    INSERT INTO entries (key, value, size, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        value = excluded.value,
+                        size = excluded.size,
+                        created_at = excluded.created_at,
+                        accessed_at = excluded.accessed_at
+                    """,
+                    (key, value, size, now, now),
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _totals(self) -> Tuple[int, int]:
+        return self._conn.execute(
+            "SELECT entries, bytes FROM totals WHERE id = 0"
+        ).fetchone()
+
+    def _evict(self, now: float) -> None:
+        """Once over budget, drop expired entries, then LRU entries until within it."""
+        count, total_bytes = self._totals()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        if self.ttl_seconds is not None:
+            expired = self._conn.execute(
+                "DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            self._counters["expirations"] += expired
+            if expired:
+                count, total_bytes = self._totals()
+
+        victims = []
+        cursor = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        )
+        for key, size in cursor:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total_bytes -= size
+        cursor.close()
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._counters["evictions"] += len(victims)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._totals()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters and current size
+
+        Returns:
+            dict: hits, misses, evictions, expirations, entries and bytes
+        """
+        with self._lock:
+            entries, total_bytes = self._totals()
+            return {**self._counters, "entries": entries, "bytes": total_bytes}
+
+    def acquire_lock(self, key: str) -> Optional[int]:
+        """
+        Block until this process holds the cross-process lock for a key
+
+        Keys are hashed onto byte ranges of a single ``<path>.lock`` file, so
+        two processes computing the same entry serialize on it while unrelated
+        keys almost never contend. File locks belong to the process, so each
+        stripe also has a thread lock that serializes threads of this process.
+        Returns None on platforms without fcntl or for in-memory stores, where
+        only the in-process guarantees apply.
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            A token to pass to release_lock
+        """
+        if fcntl is None or self.path == ":memory:":
+            return None
+
+        offset = int(key[:8], 16) % LOCK_STRIPES
+        with self._lock:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT)
+            fd = self._lock_fd
+            stripe = self._stripe_locks.get(offset)
+            if stripe is None:
+                stripe = self._stripe_locks[offset] = threading.Lock()
+
+        stripe.acquire()
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX, 1, offset)
+        except BaseException:
+            stripe.release()
+            raise
+        return offset
+
+    def release_lock(self, token: Optional[int]) -> None:
+        """Release a lock obtained from acquire_lock"""
+        if token is None or self._lock_fd is None:
+            return
+        try:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, token)
+        finally:
+            self._stripe_locks[token].release()
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the cross-process lock for a key for the duration of the block"""
+        token = self.acquire_lock(key)
+        try:
+            yield
+        finally:
+            self.release_lock(token)
+
+    def close(self) -> None:
+        """Write buffered access times and close the database connection"""
+        with self._lock:
+            if self._touched:
+                self._write_touches()
+            self._conn.close()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+
+class _Call:
+    """A computation in flight, shared by every caller waiting on its key"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        """Block until the leader finishes; its result, or its error raised"""
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key onto a single execution
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running block and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once per key among concurrent callers
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument function computing the value
+
+        Returns:
+            The value returned by fn
+        """
+        call, leader = self.join(key)
+        if not leader:
+            return call.wait()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result)
+        return result
+
+    def join(self, key: str) -> Tuple["_Call", bool]:
+        """
+        Register a caller for a key without running anything
+
+        For computations that cannot be a single function call (e.g. a
+        streamed response). The leader must call finish(); other callers
+        wait() on the returned call.
+
+        Returns:
+            (call, leader): The key's in-flight call and whether this caller
+            created it
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                return call, True
+            self.coalesced += 1
+            return call, False
+
+    def finish(
+        self,
+        key: str,
+        call: "_Call",
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Publish the leader's result (or error) to every waiting caller"""
+        call.result, call.error = result, error
+        with self._lock:
+            del self._calls[key]
+        call.event.set()
@@ -0,0 +1,169 @@
+"""Transcript chunking and summary merging for long meetings"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+SPEAKER_TURN_PATTERN = re.compile(r"^\s*[A-Z][\w .'&()/-]{0,40}:\s")
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?])\s+")
+NOT_SPECIFIED = "not specified"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a text
+
+    Uses the ~4 characters per token rule of thumb for English, which is
+    close enough for budgeting without loading a tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Approximate token count
+    """
+    return (len(text) + 3) // 4
+
+
+def split_speaker_turns(transcript: str) -> List[str]:
+    """
+    Split a transcript into speaker turns
+
+    A line starting with ``Name:`` begins a new turn; other lines are treated
+    as a continuation of the current turn.
+
+    Args:
+        transcript: Raw transcript text
+
+    Returns:
+        list: One string per speaker turn, in order
+    """
+    turns: List[str] = []
+    for line in transcript.splitlines():
+        if not line.strip():
+            continue
+        if SPEAKER_TURN_PATTERN.match(line) or not turns:
+            turns.append(line.strip())
+        else:
+            turns[-1] = f"{turns[-1]}\n{line.strip()}"
+    return turns
+
+
+def _split_long_turn(turn: str, max_tokens: int) -> List[str]:
+    """Split a single oversized turn on sentence boundaries, then hard-wrap."""
+    pieces: List[str] = []
+    current = ""
+    for sentence in SENTENCE_BREAK_PATTERN.split(turn):
+        candidate = f"{current} {sentence}".strip()
+        if estimate_tokens(candidate) <= max_tokens:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        while estimate_tokens(sentence) > max_tokens:
+            cut = max_tokens * 4
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:]
+        current = sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Pack speaker turns into windows of at most ``max_tokens`` tokens
+
+    Windows only break between turns, except for a single turn that is larger
+    than the budget on its own, which is split on sentence boundaries.
+
+    Args:
+        transcript: Raw transcript text
+        max_tokens: Token budget per window
+
+    Returns:
+        list: Transcript windows, in order
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for turn in split_speaker_turns(transcript):
+        turn_tokens = estimate_tokens(turn) + 1
+        if current and current_tokens + turn_tokens > max_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+
+        if turn_tokens > max_tokens:
+            chunks.extend(_split_long_turn(turn, max_tokens))
+            continue
+
+        current.append(turn)
+        current_tokens += turn_tokens
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and strip punctuation so near-identical strings compare equal."""
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def _item_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    return _normalize(item["task"]), _normalize(item["owner"])
+
+
+def merge_summaries(summaries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge partial summaries of one meeting into a single summary
+
+    The title comes from the first successful part, agendas are concatenated
+    without repeats, and action items are deduplicated on normalized task and
+    owner, keeping the most specific deadline. Error parts are ignored unless
+    every part is an error, in which case NO_ACTION_ITEMS_FOUND wins over
+    NOT_A_MEETING_TRANSCRIPT (some part looked like a meeting).
+
+    Args:
+        summaries: Partial summaries in transcript order
+
+    Returns:
+        dict: Merged summary or error response
+    """
+    successes = []
+    errors = set()
+    for summary in summaries:
+        if "error" in summary:
+            errors.add(summary["error"])
+        else:
+            successes.append(summary)
+
+    if not successes:
+        if "NO_ACTION_ITEMS_FOUND" in errors:
+            return {"error": "NO_ACTION_ITEMS_FOUND"}
+        return {"error": "NOT_A_MEETING_TRANSCRIPT"}
+
+    agendas: List[str] = []
+    seen_agendas = set()
+    items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for summary in successes:
+        agenda = summary.get("agenda", "").strip()
+        if agenda and _normalize(agenda) not in seen_agendas:
+            seen_agendas.add(_normalize(agenda))
+            agendas.append(agenda)
+
+        for item in summary.get("action_items", []):
+            key = _item_key(item)
+            existing = items.get(key)
+            if existing is None:
+                items[key] = dict(item)
+            elif _normalize(existing["deadline"]) == _normalize(NOT_SPECIFIED):
+                existing["deadline"] = item["deadline"]
+
+    return {
+        "meeting_title": successes[0]["meeting_title"],
+        "agenda": " ".join(agendas),
+        "action_items": list(items.values()),
+    }
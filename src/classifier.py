@@ -0,0 +1,197 @@
+"""Local pre-classifier that answers obvious error cases without an LLM call
+
+Run ``python -m src.classifier`` from the repository root to report its
+accuracy on the reference transcripts.
+"""
+
+import re
+from typing import Any, Dict, NamedTuple, Optional
+
+from .chunking import SPEAKER_TURN_PATTERN
+
+NOT_A_MEETING = "NOT_A_MEETING_TRANSCRIPT"
+NO_ACTION_ITEMS = "NO_ACTION_ITEMS_FOUND"
+
+COMMITMENT_PATTERN = re.compile(
+    r"\b(?:i'?ll|i will|we'?ll|we will|i can|we can|i'm going to|i am going to"
+    r"|can you|could you|would you|please|need(?:s)? to|have to|going to"
+    r"|let'?s (?:schedule|set|plan|review|meet|sync|follow|discuss|kick)"
+    r"|action items?|follow[- ]up|next steps?|assign(?:ed)?|owner|todo|to-do)\b",
+    re.IGNORECASE,
+)
+DEADLINE_PATTERN = re.compile(
+    r"\b(?:today|tonight|tomorrow|this (?:morning|afternoon|evening|week|month)"
+    r"|next (?:week|month|monday|tuesday|wednesday|thursday|friday)"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|end of (?:the )?(?:day|week|month|quarter|sprint)|eod|eow|deadline|due"
+    r"|by \d{1,2}(?::\d{2})?\s*(?:am|pm)?)\b",
+    re.IGNORECASE,
+)
+BUSINESS_PATTERN = re.compile(
+    r"\b(?:agenda|project|client|customer|deploy\w*|release|review|bug|fix\w*"
+    r"|feature|sprint|demo|documentation|docs|repository|repo|roadmap|budget"
+    r"|plan|status|update|meeting|standup|sync|ticket|design|mockups?"
+    r"|dashboard|report|launch|milestone|deliverable)\b",
+    re.IGNORECASE,
+)
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class Verdict(NamedTuple):
+    """Pre-classifier decision; label is None when the LLM should decide"""
+
+    label: Optional[str]
+    confidence: float
+    features: Dict[str, Any]
+
+
+class TranscriptClassifier:
+    """Score speaker turns and commitment/deadline cues to spot clear non-meetings
+
+    Two confidences are computed from cheap features:
+
+    - not a meeting: little or no speaker-turn structure and no commitment,
+      deadline or business cues (e.g. a story or article)
+    - no action items: a multi-speaker conversation with no commitment,
+      deadline or business cues at all (e.g. small talk)
+
+    A label is returned only when its confidence reaches ``min_confidence``;
+    everything else is left to the LLM.
+    """
+
+    def __init__(
+        self,
+        min_confidence: float = 0.9,
+        min_words: int = 20,
+        min_turns: int = 4,
+    ):
+        """
+        Args:
+            min_confidence: Confidence needed to answer locally (0-1)
+            min_words: Prose shorter than this is too little evidence for NOT_A_MEETING
+            min_turns: Conversations shorter than this are too little evidence
+                for NO_ACTION_ITEMS
+        """
+        self.min_confidence = min_confidence
+        self.min_words = min_words
+        self.min_turns = min_turns
+
+    @staticmethod
+    def extract_features(text: str) -> Dict[str, Any]:
+        """
+        Compute the cheap features used for classification
+
+        Args:
+            text: Raw transcript text
+
+        Returns:
+            dict: Line, turn, speaker, word and cue counts
+        """
+        lines = [line for line in text.splitlines() if line.strip()]
+        speakers = set()
+        turns = 0
+        for line in lines:
+            match = SPEAKER_TURN_PATTERN.match(line)
+            if match:
+                turns += 1
+                speakers.add(match.group().strip().rstrip(":").lower())
+
+        return {
+            "lines": len(lines),
+            "turns": turns,
+            "speakers": len(speakers),
+            "turn_ratio": turns / len(lines) if lines else 0.0,
+            "words": len(WORD_PATTERN.findall(text)),
+            "commitment_cues": len(COMMITMENT_PATTERN.findall(text)),
+            "deadline_cues": len(DEADLINE_PATTERN.findall(text)),
+            "business_cues": len(BUSINESS_PATTERN.findall(text)),
+        }
+
+    def classify(self, text: str) -> Verdict:
+        """
+        Classify a transcript
+
+        Args:
+            text: Raw transcript text
+
+        Returns:
+            Verdict: error label and confidence, or label None for ambiguous input
+        """
+        features = self.extract_features(text)
+        cues = (
+            features["commitment_cues"]
+            + features["deadline_cues"]
+            + features["business_cues"]
+        )
+        no_cues = 1.0 if cues == 0 else 0.0
+
+        not_meeting = (
+            (1.0 - features["turn_ratio"])
+            * no_cues
+            * min(1.0, features["words"] / self.min_words)
+        )
+        no_action_items = (
+            features["turn_ratio"]
+            * no_cues
+            * min(1.0, features["speakers"] / 2)
+            * min(1.0, features["turns"] / self.min_turns)
+        )
+
+        if not_meeting >= no_action_items and not_meeting >= self.min_confidence:
+            return Verdict(NOT_A_MEETING, not_meeting, features)
+        if no_action_items >= self.min_confidence:
+            return Verdict(NO_ACTION_ITEMS, no_action_items, features)
+        return Verdict(None, max(not_meeting, no_action_items), features)
+
+
+def evaluate_classifier(
+    classifier: TranscriptClassifier, test_cases: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Measure how the pre-classifier performs on labelled transcripts
+
+    Cases with ``expected_error`` are labelled with that error; all others are
+    real meetings that must be escalated to the LLM.
+
+    Args:
+        classifier: Classifier to evaluate
+        test_cases: Mapping in the shape of data.test_transcripts.TEST_TRANSCRIPTS
+
+    Returns:
+        dict: Counts, precision of local answers, coverage of error cases, and
+        the names of misclassified cases
+    """
+    answered = correct = error_cases = 0
+    mistakes = []
+    for name, case in test_cases.items():
+        expected = case.get("expected_error")
+        label = classifier.classify(case["transcript"]).label
+        error_cases += expected is not None
+        if label is None:
+            continue
+        answered += 1
+        if label == expected:
+            correct += 1
+        else:
+            mistakes.append(name)
+
+    return {
+        "cases": len(test_cases),
+        "answered_locally": answered,
+        "correct": correct,
+        "precision": correct / answered if answered else 1.0,
+        "error_case_coverage": correct / error_cases if error_cases else 1.0,
+        "mistakes": mistakes,
+    }
+
+
+if __name__ == "__main__":
+    import json
+
+    from data.test_transcripts import TEST_TRANSCRIPTS
+
+    print(
+        json.dumps(
+            evaluate_classifier(TranscriptClassifier(), TEST_TRANSCRIPTS), indent=2
+        )
+    )
@@ -0,0 +1,325 @@
+"""Token-aware transcript compaction applied before prompting
+
+Run ``python -m src.compaction`` from the repository root to report the
+savings and any lost expected terms on the reference transcripts.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .chunking import SPEAKER_TURN_PATTERN, estimate_tokens
+from .classifier import COMMITMENT_PATTERN, DEADLINE_PATTERN
+
+TIMESTAMP_PATTERN = re.compile(
+    r"^\s*[\[(]?\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?m\.?)?[\])]?\s*(?:[-|]\s*)?",
+    re.IGNORECASE,
+)
+WHITESPACE_PATTERN = re.compile(r"[ \t ]+")
+REQUEST_PATTERN = re.compile(
+    r"\?|\b(?:can|could|would|will) (?:you|someone|anyone)\b|\bplease\b",
+    re.IGNORECASE,
+)
+LEGEND_TEMPLATE = (
+    "SPEAKER ALIASES: {pairs}. Always use the full names, never the aliases, "
+    "in owner fields."
+)
+DEFAULT_FILLER_PHRASES = (
+    r"sounds? (?:good|great|perfect)",
+    r"will do",
+    r"thanks?(?: you)?(?: (?:all|everyone|so much))?",
+    r"great",
+    r"good",
+    r"perfect",
+    r"excellent",
+    r"awesome",
+    r"nice",
+    r"cool",
+    r"ok(?:ay)?",
+    r"sure",
+    r"yes|yeah|yep",
+    r"got it",
+    r"agreed",
+    r"makes sense",
+    r"(?:that )?works for me",
+    r"right",
+    r"alright",
+    r"um+|uh+|hmm+",
+)
+
+
+class CompactionResult(NamedTuple):
+    """Compacted transcript plus what is needed to read and report on it"""
+
+    text: str
+    legend: str
+    aliases: Dict[str, str]
+    original_tokens: int
+    compacted_tokens: int
+    dropped_turns: int
+    merged_turns: int
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated prompt tokens saved, including the legend's cost"""
+        return self.original_tokens - self.compacted_tokens
+
+    def stats(self) -> Dict[str, Any]:
+        """Token savings report"""
+        return {
+            "original_tokens": self.original_tokens,
+            "compacted_tokens": self.compacted_tokens,
+            "saved_tokens": self.saved_tokens,
+            "saved_ratio": (
+                self.saved_tokens / self.original_tokens
+                if self.original_tokens
+                else 0.0
+            ),
+            "dropped_turns": self.dropped_turns,
+            "merged_turns": self.merged_turns,
+            "aliases": len(self.aliases),
+        }
+
+
+class TranscriptCompactor:
+    """Shrink a transcript's prompt tokens without losing owners or deadlines
+
+    Applied in order:
+
+    - whitespace is normalized and leading timestamps are removed
+    - low-information turns (only acknowledgements such as "Great!" or
+      "Sounds good!") are dropped, unless they contain a commitment or
+      deadline cue or answer a request in the previous turn ("Can you ...?"
+      / "Will do!"), since that reply is what makes the speaker the owner
+    - consecutive turns by the same speaker are merged under one label
+    - speaker labels are replaced by short aliases when that saves tokens,
+      with a legend mapping each alias back to the full name
+    """
+
+    def __init__(
+        self,
+        drop_filler: bool = True,
+        filler_phrases: Iterable[str] = DEFAULT_FILLER_PHRASES,
+        keep_replies_to_requests: bool = True,
+        use_aliases: bool = True,
+        strip_timestamps: bool = True,
+    ):
+        """
+        Args:
+            drop_filler: Drop turns consisting only of filler phrases
+            filler_phrases: Regular expressions for phrases that carry no
+                information on their own
+            keep_replies_to_requests: Keep filler turns that follow a question
+                or request, since they can accept a task
+            use_aliases: Replace speaker labels with short aliases
+            strip_timestamps: Remove leading ``[00:01:23]``-style timestamps
+        """
+        self.drop_filler = drop_filler
+        self.keep_replies_to_requests = keep_replies_to_requests
+        self.use_aliases = use_aliases
+        self.strip_timestamps = strip_timestamps
+        self._filler_pattern = re.compile(
+            r"\b(?:" + "|".join(f"(?:{p})" for p in filler_phrases) + r")\b",
+            re.IGNORECASE,
+        )
+
+    def compact(self, transcript: str) -> CompactionResult:
+        """
+        Compact a transcript
+
+        Args:
+            transcript: Raw transcript text
+
+        Returns:
+            CompactionResult: Compacted text, alias legend and token savings
+        """
+        turns = self._turns(transcript)
+        kept = [
+            turn
+            for previous, turn in zip([None] + turns[:-1], turns)
+            if not self._is_filler(turn, previous)
+        ]
+        dropped = len(turns) - len(kept)
+        kept, merged = _merge_adjacent(kept)
+        aliases = self._aliases(kept) if self.use_aliases else {}
+
+        by_name = {name: alias for alias, name in aliases.items()}
+        lines = []
+        for speaker, text in kept:
+            if speaker is None:
+                lines.append(text)
+            else:
+                lines.append(f"{by_name.get(speaker, speaker)}: {text}")
+        text = "\n".join(lines)
+
+        legend = ""
+        if aliases:
+            pairs = "; ".join(f"{alias} = {name}" for alias, name in aliases.items())
+            legend = LEGEND_TEMPLATE.format(pairs=pairs)
+
+        return CompactionResult(
+            text=text,
+            legend=legend,
+            aliases=aliases,
+            original_tokens=estimate_tokens(transcript),
+            compacted_tokens=estimate_tokens(text) + estimate_tokens(legend),
+            dropped_turns=dropped,
+            merged_turns=merged,
+        )
+
+    def _turns(self, transcript: str) -> List[Tuple[Optional[str], str]]:
+        """Normalized (speaker, text) turns, continuation lines joined"""
+        turns: List[Tuple[Optional[str], str]] = []
+        for line in transcript.splitlines():
+            if self.strip_timestamps:
+                line = TIMESTAMP_PATTERN.sub("", line)
+            line = WHITESPACE_PATTERN.sub(" ", line).strip()
+            if not line:
+                continue
+            match = SPEAKER_TURN_PATTERN.match(line)
+            if match:
+                speaker = match.group().strip()[:-1].strip()
+                turns.append((speaker, line[match.end() :].strip()))
+            elif turns:
+                speaker, text = turns[-1]
+                turns[-1] = (speaker, f"{text} {line}")
+            else:
+                turns.append((None, line))
+        return turns
+
+    def _is_filler(
+        self,
+        turn: Tuple[Optional[str], str],
+        previous: Optional[Tuple[Optional[str], str]],
+    ) -> bool:
+        """Whether a turn carries no information worth prompt tokens"""
+        speaker, text = turn
+        if not self.drop_filler or speaker is None:
+            return False
+        if COMMITMENT_PATTERN.search(text) or DEADLINE_PATTERN.search(text):
+            return False
+        if re.search(r"\w", self._filler_pattern.sub("", text)):
+            return False
+        if (
+            self.keep_replies_to_requests
+            and previous is not None
+            and REQUEST_PATTERN.search(previous[1])
+        ):
+            return False
+        return True
+
+    @staticmethod
+    def _aliases(turns: List[Tuple[Optional[str], str]]) -> Dict[str, str]:
+        """Assign short aliases to speakers whose label repeats enough to pay off"""
+        counts: Dict[str, int] = {}
+        for speaker, _ in turns:
+            if speaker is not None:
+                counts[speaker] = counts.get(speaker, 0) + 1
+
+        taken = {name.lower() for name in counts}
+        aliases: Dict[str, str] = {}
+        saved_chars = 0
+        for name, turns_spoken in counts.items():
+            alias = _make_alias(name, taken)
+            # Legend entry "A = Alice; " must cost less than the label savings
+            net = (len(name) - len(alias)) * turns_spoken - (len(alias) + len(name) + 5)
+            if net <= 0:
+                continue
+            taken.add(alias.lower())
+            aliases[alias] = name
+            saved_chars += net
+        # The legend's fixed wording must be paid for as well
+        if saved_chars <= len(LEGEND_TEMPLATE.format(pairs="")):
+            return {}
+        return aliases
+
+
+def _merge_adjacent(
+    turns: List[Tuple[Optional[str], str]],
+) -> Tuple[List[Tuple[Optional[str], str]], int]:
+    """Join consecutive turns by the same speaker; returns (turns, merges)"""
+    merged: List[Tuple[Optional[str], str]] = []
+    merges = 0
+    for speaker, text in turns:
+        if merged and speaker is not None and merged[-1][0] == speaker:
+            merged[-1] = (speaker, f"{merged[-1][1]} {text}")
+            merges += 1
+        else:
+            merged.append((speaker, text))
+    return merged, merges
+
+
+def _make_alias(name: str, taken: set) -> str:
+    """Initials of the name (e.g. "Team Lead" -> "TL"), numbered if taken"""
+    initials = "".join(word[0] for word in re.findall(r"[A-Za-z0-9]+", name))
+    base = (initials or name[:1]).upper()
+    alias, number = base, 2
+    while alias.lower() in taken:
+        alias = f"{base}{number}"
+        number += 1
+    return alias
+
+
+def expand_owner_aliases(
+    summary: Dict[str, Any], aliases: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Replace any alias the model copied into an owner field with the full name
+
+    Args:
+        summary: Summary produced from a compacted transcript
+        aliases: Mapping of alias to full speaker name
+
+    Returns:
+        dict: The summary, with owners expanded in place
+    """
+    if not aliases or not isinstance(summary.get("action_items"), list):
+        return summary
+    for item in summary["action_items"]:
+        owner = item.get("owner") if isinstance(item, dict) else None
+        if isinstance(owner, str) and owner.strip() in aliases:
+            item["owner"] = aliases[owner.strip()]
+    return summary
+
+
+def missing_expected_terms(
+    transcript: str, result: CompactionResult, expected: Dict[str, Any]
+) -> List[str]:
+    """
+    Owners and deadlines from a judge test case that compaction lost
+
+    A term only counts if it appears in the original transcript; it is
+    preserved if it still appears in the compacted text or its legend.
+
+    Args:
+        transcript: Original transcript
+        result: Compaction of that transcript
+        expected: ``expected`` block of a test case (should_have_owners,
+            should_have_deadlines)
+
+    Returns:
+        list: Terms present before compaction but missing after
+    """
+    before = transcript.lower()
+    after = f"{result.legend}\n{result.text}".lower()
+    terms = list(expected.get("should_have_owners", [])) + list(
+        expected.get("should_have_deadlines", [])
+    )
+    return [
+        term for term in terms if term.lower() in before and term.lower() not in after
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    from data.test_transcripts import TEST_TRANSCRIPTS
+
+    compactor = TranscriptCompactor()
+    report = {}
+    for name, case in TEST_TRANSCRIPTS.items():
+        result = compactor.compact(case["transcript"])
+        report[name] = result.stats()
+        report[name]["missing_terms"] = missing_expected_terms(
+            case["transcript"], result, case.get("expected", {})
+        )
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,318 @@
+"""Resolve free-text deadlines to ISO dates and ranges
+
+Action item deadlines come back as phrases ("tomorrow", "Friday", "end of
+week", "this afternoon"). DeadlineResolver turns them into ISO 8601 values
+relative to the meeting's reference time, so action items can be sorted and
+indexed by due date:
+
+- a day resolves to a date:             "Friday" -> "2024-03-15"
+- a span resolves to an interval:       "next week" -> "2024-03-18/2024-03-22"
+- part of a day resolves to times:      "this afternoon"
+                                        -> "2024-03-11T12:00/2024-03-11T17:00"
+- anything else ("before the demo", "Not specified") resolves to None
+
+Phrases are parsed by precompiled patterns into a reference-independent rule
+that is cached, so repeated phrases cost one dict lookup plus date arithmetic.
+"""
+
+import calendar
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+PARTS_OF_DAY = {
+    "morning": (time(9), time(12)),
+    "afternoon": (time(12), time(17)),
+    "evening": (time(17), time(21)),
+    "night": (time(17), time(23, 59)),
+    "eod": (time(17), time(17)),
+}
+
+_PREFIX = re.compile(
+    r"^(?:(?:by|before|until|till|due|on|no later than|at the latest by|the)\s+)+"
+)
+_SUFFIX = re.compile(r"[\s.,;!]+$|\s+at the latest$")
+_WEEKDAY = "|".join(WEEKDAYS)
+_PART = r"(?:\s+(?P<part>morning|afternoon|evening|night))?"
+_NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4}
+
+_DAY = re.compile(r"(?P<day>today|tonight|tomorrow|day after tomorrow)" + _PART + r"$")
+_THIS_PART = re.compile(r"this\s+(?P<part>morning|afternoon|evening)$")
+_END_OF_DAY = re.compile(r"(?:eod|cob|end of (?:the )?(?:business )?day)$")
+_WEEKDAY_RULE = re.compile(
+    r"(?:(?P<which>this|next|coming|this coming)\s+)?(?P<weekday>"
+    + _WEEKDAY
+    + r")"
+    + _PART
+    + r"$"
+)
+_END_OF_WEEK = re.compile(r"(?:eow|end of (?:the |this )?(?P<next>next )?week)$")
+_WEEK = re.compile(r"(?P<which>this|next)\s+week$")
+_END_OF_MONTH = re.compile(r"(?:eom|end of (?:the |this )?(?P<next>next )?month)$")
+_MONTH = re.compile(r"(?P<which>this|next)\s+month$")
+_END_OF_QUARTER = re.compile(r"end of (?:the |this )?quarter$")
+_IN_UNITS = re.compile(
+    r"in\s+(?P<count>\d+|a|an|one|two|three|four)\s+(?P<unit>day|week)s?$"
+)
+_CLOCK = re.compile(
+    r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>am|pm)?"
+    r"(?:\s+(?P<day>today|tomorrow))?$"
+)
+_ISO_DATE = re.compile(r"(?P<iso>\d{4}-\d{2}-\d{2})$")
+
+# A parsed rule: (kind, arguments); independent of the reference time
+Rule = Tuple[Any, ...]
+
+
+class ResolvedDeadline(NamedTuple):
+    """Absolute deadline; start == end for a single day or instant"""
+
+    start: Union[date, datetime]
+    end: Union[date, datetime]
+
+    def iso(self) -> str:
+        """ISO 8601 date, or interval "start/end" for a range"""
+        start, end = _iso(self.start), _iso(self.end)
+        return start if start == end else f"{start}/{end}"
+
+
+def _iso(value: Union[date, datetime]) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="minutes")
+    return value.isoformat()
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Lowercase, collapse whitespace and drop "by"/"before"-style prefixes"""
+    text = " ".join(phrase.lower().replace("’", "'").split())
+    text = _SUFFIX.sub("", text)
+    return _PREFIX.sub("", text)
+
+
+@lru_cache(maxsize=4096)
+def parse_deadline(phrase: str) -> Optional[Rule]:
+    """
+    Parse a deadline phrase into a rule, without a reference time
+
+    Args:
+        phrase: Deadline text as written in an action item
+
+    Returns:
+        tuple or None: Rule for DeadlineResolver.apply, None if unrecognized
+    """
+    text = normalize_phrase(phrase)
+    if not text:
+        return None
+
+    match = _DAY.match(text)
+    if match:
+        day = match.group("day")
+        offset = {"today": 0, "tonight": 0, "tomorrow": 1}.get(day, 2)
+        part = match.group("part") or ("evening" if day == "tonight" else None)
+        return ("day", offset, part)
+    match = _THIS_PART.match(text)
+    if match:
+        return ("day", 0, match.group("part"))
+    if _END_OF_DAY.match(text):
+        return ("day", 0, "eod")
+    match = _WEEKDAY_RULE.match(text)
+    if match:
+        weeks = 1 if match.group("which") == "next" else 0
+        weekday = WEEKDAYS.index(match.group("weekday"))
+        return ("weekday", weekday, weeks, match.group("part"))
+    match = _END_OF_WEEK.match(text)
+    if match:
+        return ("end_of_week", 1 if match.group("next") else 0)
+    match = _WEEK.match(text)
+    if match:
+        return ("week", 1 if match.group("which") == "next" else 0)
+    match = _END_OF_MONTH.match(text)
+    if match:
+        return ("end_of_month", 1 if match.group("next") else 0)
+    match = _MONTH.match(text)
+    if match:
+        return ("month", 1 if match.group("which") == "next" else 0)
+    if _END_OF_QUARTER.match(text):
+        return ("end_of_quarter",)
+    match = _IN_UNITS.match(text)
+    if match:
+        count = match.group("count")
+        days = int(count) if count.isdigit() else _NUMBER_WORDS[count]
+        if match.group("unit") == "week":
+            days *= 7
+        return ("day", days, None)
+    match = _CLOCK.match(text)
+    if match and (match.group("meridiem") or match.group("minute")):
+        hour, minute = int(match.group("hour")), int(match.group("minute") or 0)
+        if match.group("meridiem") == "pm" and hour < 12:
+            hour += 12
+        elif match.group("meridiem") == "am" and hour == 12:
+            hour = 0
+        if hour > 23 or minute > 59:
+            return None
+        return ("clock", 1 if match.group("day") == "tomorrow" else 0, hour, minute)
+    match = _ISO_DATE.match(text)
+    if match:
+        try:
+            return ("date", date.fromisoformat(match.group("iso")))
+        except ValueError:
+            return None
+    return None
+
+
+class DeadlineResolver:
+    """Turn deadline phrases into absolute dates relative to a meeting"""
+
+    def __init__(self, week_end: int = 4):
+        """
+        Args:
+            week_end: Weekday (0 = Monday) that "end of week" means; Friday by
+                default
+        """
+        if not 0 <= week_end <= 6:
+            raise ValueError("week_end must be a weekday number 0-6")
+        self.week_end = week_end
+
+    def resolve(
+        self, phrase: Any, reference: Union[date, datetime, str]
+    ) -> Optional[ResolvedDeadline]:
+        """
+        Resolve one deadline phrase
+
+        Args:
+            phrase: Deadline text, e.g. "end of this week"
+            reference: When the meeting took place (datetime, date or ISO string)
+
+        Returns:
+            ResolvedDeadline or None if the phrase is not a recognizable date
+        """
+        if not isinstance(phrase, str):
+            return None
+        rule = parse_deadline(phrase)
+        if rule is None:
+            return None
+        return self.apply(rule, _as_date(reference))
+
+    def apply(self, rule: Rule, today: date) -> Optional[ResolvedDeadline]:
+        """Evaluate a parsed rule against the meeting date"""
+        kind = rule[0]
+        if kind == "day":
+            return _with_part(today + timedelta(days=rule[1]), rule[2])
+        if kind == "weekday":
+            _, weekday, weeks, part = rule
+            if weeks:
+                monday = today - timedelta(days=today.weekday()) + timedelta(weeks=1)
+                day = monday + timedelta(days=weekday)
+            else:
+                day = today + timedelta(days=(weekday - today.weekday()) % 7)
+            return _with_part(day, part)
+        if kind == "end_of_week":
+            days = (self.week_end - today.weekday()) % 7
+            return _with_part(today + timedelta(days=days + 7 * rule[1]), None)
+        if kind == "week":
+            end = today + timedelta(days=(self.week_end - today.weekday()) % 7)
+            if rule[1]:
+                monday = today - timedelta(days=today.weekday()) + timedelta(weeks=1)
+                return ResolvedDeadline(monday, monday + timedelta(days=self.week_end))
+            return ResolvedDeadline(today, end)
+        if kind in ("end_of_month", "month"):
+            year, month = today.year, today.month + rule[1]
+            if month > 12:
+                year, month = year + 1, month - 12
+            last = date(year, month, calendar.monthrange(year, month)[1])
+            if kind == "end_of_month":
+                return ResolvedDeadline(last, last)
+            start = today if not rule[1] else date(year, month, 1)
+            return ResolvedDeadline(start, last)
+        if kind == "end_of_quarter":
+            month = ((today.month - 1) // 3 + 1) * 3
+            last = date(today.year, month, calendar.monthrange(today.year, month)[1])
+            return ResolvedDeadline(last, last)
+        if kind == "clock":
+            _, offset, hour, minute = rule
+            moment = datetime.combine(
+                today + timedelta(days=offset), time(hour, minute)
+            )
+            return ResolvedDeadline(moment, moment)
+        if kind == "date":
+            return ResolvedDeadline(rule[1], rule[1])
+        return None
+
+    def resolve_summary(
+        self,
+        summary: Dict[str, Any],
+        reference: Union[date, datetime, str],
+        key: str = "deadline_iso",
+    ) -> Dict[str, Any]:
+        """
+        Add the resolved deadline to every action item, in one pass
+
+        Each item gains ``key`` with the ISO date or interval, or None when
+        its deadline is not a recognizable date. The original ``deadline``
+        text is kept. Error summaries are returned unchanged.
+
+        Args:
+            summary: Summary from MeetingAgent.summarize_meeting
+            reference: When the meeting took place
+            key: Item key to store the ISO value under
+
+        Returns:
+            dict: The same summary, updated in place
+        """
+        items = summary.get("action_items")
+        if not isinstance(items, list):
+            return summary
+        today = _as_date(reference)
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            phrase = item.get("deadline")
+            rule = parse_deadline(phrase) if isinstance(phrase, str) else None
+            resolved = self.apply(rule, today) if rule is not None else None
+            item[key] = resolved.iso() if resolved is not None else None
+        return summary
+
+
+def _as_date(reference: Union[date, datetime, str]) -> date:
+    if isinstance(reference, str):
+        reference = datetime.fromisoformat(reference)
+    if isinstance(reference, datetime):
+        return reference.date()
+    return reference
+
+
+def _with_part(day: date, part: Optional[str]) -> ResolvedDeadline:
+    if part is None:
+        return ResolvedDeadline(day, day)
+    start, end = PARTS_OF_DAY[part]
+    return ResolvedDeadline(datetime.combine(day, start), datetime.combine(day, end))
+
+
+if __name__ == "__main__":
+    import sys
+
+    reference = sys.argv[1] if len(sys.argv) > 1 else datetime.now().isoformat()
+    resolver = DeadlineResolver()
+    for phrase in sys.argv[2:] or (
+        "today",
+        "tomorrow",
+        "this afternoon",
+        "Friday",
+        "next Friday",
+        "end of this week",
+        "next week",
+        "by 3pm",
+        "before the demo",
+    ):
+        resolved = resolver.resolve(phrase, reference)
+        print(f"{phrase:>20} -> {resolved.iso() if resolved else None}")
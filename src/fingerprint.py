@@ -0,0 +1,391 @@
+"""Near-duplicate detection for summarization prompts
+
+The response cache is keyed by the exact prompt bytes, so a transcript that
+is re-uploaded with different line endings, timestamps or a trailing
+"Thanks all!" is a miss and a new paid call. NearDuplicateIndex sits in front
+of the cache and maps such transcripts to the cache entry of one seen before:
+
+- canonicalize() normalizes Unicode, whitespace and timestamps, drops filler
+  turns (with TranscriptCompactor's rules) and lowercases the text; equal
+  canonical forms are an exact match
+- otherwise transcripts match when the MinHash estimate of the Jaccard
+  similarity of their speaker-turn shingles reaches ``threshold`` and their
+  anchors are equal: the speakers, deadline cues, numbers, participants
+  named in each speaker's turns and commitment and negation cues must be
+  the same, so a transcript where "Friday" became "Monday", "Bob will
+  handle it" became "Carol will handle it" or "will" became "will not" is
+  never served a stale summary
+- MinHash signatures are split into LSH bands stored in an indexed table, so
+  a lookup reads only the entries sharing a band, not the whole index
+
+Usage:
+    index = NearDuplicateIndex(path=":memory:", threshold=0.9)
+    index.add(fingerprint(transcript), scope, cache_key)
+    match = index.lookup(fingerprint(reuploaded), scope)
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import List, NamedTuple, Optional, Tuple
+
+from .chunking import SPEAKER_TURN_PATTERN
+from .classifier import COMMITMENT_PATTERN, DEADLINE_PATTERN
+from .compaction import TranscriptCompactor
+
+NUM_PERMUTATIONS = 64
+SHINGLE_WORDS = 3
+DEFAULT_THRESHOLD = 0.9
+# Smallest chance that a pair at exactly the threshold shares a band
+MIN_BAND_RECALL = 0.95
+WORD_PATTERN = re.compile(r"\w+")
+NUMBER_PATTERN = re.compile(r"\d+(?:[.:]\d+)?")
+NEGATION_PATTERN = re.compile(
+    r"\b(?:not|no|never|nobody|nothing|none|cannot|unable)\b|n['\u2019]t\b"
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.blake2b(b"a%d" % i, digest_size=8).digest(), "big")
+        % (_MERSENNE_PRIME - 1)
+        + 1,
+        int.from_bytes(hashlib.blake2b(b"b%d" % i, digest_size=8).digest(), "big")
+        % _MERSENNE_PRIME,
+    )
+    for i in range(NUM_PERMUTATIONS)
+]
+_COMPACTOR = TranscriptCompactor(use_aliases=False)
+
+
+class Fingerprint(NamedTuple):
+    """Canonical-text hash, anchor hash and MinHash signature of a transcript"""
+
+    canonical: str
+    anchor: str
+    signature: Tuple[int, ...]
+
+
+class Match(NamedTuple):
+    """A previously indexed request and how close it is"""
+
+    cache_key: str
+    similarity: float
+    exact: bool
+
+
+def _canonical_turns(transcript: str) -> List[Tuple[str, str]]:
+    """Lowercased (speaker, text) turns of the compacted transcript"""
+    text = unicodedata.normalize("NFKC", transcript)
+    turns = []
+    for line in _COMPACTOR.compact(text).text.splitlines():
+        match = SPEAKER_TURN_PATTERN.match(line)
+        if match:
+            speaker = match.group().strip()[:-1].strip()
+            turns.append((speaker.lower(), line[match.end() :].lower()))
+        else:
+            turns.append(("", line.lower()))
+    return turns
+
+
+def _join(turns: List[Tuple[str, str]]) -> str:
+    return "\n".join(
+        f"{speaker}: {text}" if speaker else text for speaker, text in turns
+    )
+
+
+def canonicalize(transcript: str) -> str:
+    """
+    Normalize a transcript so trivially different copies compare equal
+
+    Args:
+        transcript: Raw transcript text
+
+    Returns:
+        str: Lowercased "speaker: text" lines without timestamps, extra
+        whitespace or filler turns
+    """
+    return _join(_canonical_turns(transcript))
+
+
+def shingles(turns: List[Tuple[str, str]]) -> set:
+    """Word shingles of each turn, tagged with the turn's speaker"""
+    result = set()
+    for speaker, text in turns:
+        words = WORD_PATTERN.findall(text)
+        for start in range(max(1, len(words) - SHINGLE_WORDS + 1)):
+            result.add(f"{speaker}|{' '.join(words[start:start + SHINGLE_WORDS])}")
+    return result
+
+
+def minhash(features: set) -> Tuple[int, ...]:
+    """MinHash signature: the minimum of each of NUM_PERMUTATIONS hash functions"""
+    if not features:
+        return (_MAX_HASH,) * NUM_PERMUTATIONS
+    values = [
+        int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big")
+        for f in features
+    ]
+    return tuple(
+        min(((a * v + b) % _MERSENNE_PRIME) & _MAX_HASH for v in values)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _participant_names(turns: List[Tuple[str, str]]) -> set:
+    """Words of the speaker labels ("alice", "johnson"), as found in turn text"""
+    return {
+        word
+        for speaker, _ in turns
+        for word in WORD_PATTERN.findall(speaker)
+        if len(word) > 1 and not word.isdigit()
+    }
+
+
+def fingerprint(transcript: str) -> Fingerprint:
+    """
+    Fingerprint a transcript for near-duplicate lookup
+
+    Args:
+        transcript: Raw transcript text
+
+    Returns:
+        Fingerprint: Hash of the canonical text, hash of its anchors
+        (speakers, and per speaker: deadline, commitment and negation cues
+        and the participants named in each turn; numbers) and its MinHash
+    """
+    turns = _canonical_turns(transcript)
+    names = _participant_names(turns)
+    anchors: Counter = Counter()
+    for speaker, text in turns:
+        anchors[f"speaker:{speaker}"] = 1
+        anchors.update(
+            f"due:{speaker}:{m.group()}" for m in DEADLINE_PATTERN.finditer(text)
+        )
+        anchors.update(
+            f"cue:{speaker}:{m.group()}" for m in COMMITMENT_PATTERN.finditer(text)
+        )
+        anchors.update(f"neg:{speaker}" for _ in NEGATION_PATTERN.finditer(text))
+        anchors.update(
+            f"names:{speaker}:{name}"
+            for name in names.intersection(WORD_PATTERN.findall(text))
+        )
+        anchors.update(f"num:{n}" for n in NUMBER_PATTERN.findall(text))
+    anchor = "\n".join(f"{k}={v}" for k, v in sorted(anchors.items()))
+    return Fingerprint(
+        canonical=hashlib.sha256(_join(turns).encode()).hexdigest(),
+        anchor=hashlib.sha256(anchor.encode()).hexdigest(),
+        signature=minhash(shingles(turns)),
+    )
+
+
+def band_rows(threshold: float) -> int:
+    """
+    Rows per LSH band for a similarity threshold
+
+    More rows per band means fewer, more selective bands. This picks the
+    most selective split that still makes a pair at the threshold share at
+    least one band with probability MIN_BAND_RECALL.
+    """
+    best = 1
+    for rows in (1, 2, 4, 8, 16, 32):
+        bands = NUM_PERMUTATIONS // rows
+        if 1 - (1 - threshold**rows) ** bands >= MIN_BAND_RECALL:
+            best = rows
+    return best
+
+
+class NearDuplicateIndex:
+    """Persistent index from transcript fingerprints to response cache keys"""
+
+    def __init__(
+        self, path: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD
+    ):
+        """
+        Args:
+            path: SQLite file; ":memory:" for a throwaway index. Defaults to a
+                file next to the response cache
+            threshold: Minimum estimated Jaccard similarity (0-1] of two
+                transcripts' shingles for one to reuse the other's response;
+                1.0 reuses only canonical or shingle-identical transcripts
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.path = path or os.path.join(
+            os.getcwd(), ".pytest_cache", "llm_near_duplicates.sqlite3"
+        )
+        self.threshold = threshold
+        self.rows = band_rows(threshold)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    @classmethod
+    def from_env(cls) -> Optional["NearDuplicateIndex"]:
+        """
+        Index configured from the environment, or None when disabled
+
+        LLM_NEAR_DUPLICATES=1 enables it; LLM_NEAR_DUPLICATE_THRESHOLD and
+        LLM_NEAR_DUPLICATE_PATH override the defaults.
+        """
+        enabled = os.getenv("LLM_NEAR_DUPLICATES", "").strip().lower()
+        if enabled not in ("1", "true", "yes"):
+            return None
+        threshold = os.getenv("LLM_NEAR_DUPLICATE_THRESHOLD", "").strip()
+        return cls(
+            path=os.getenv("LLM_NEAR_DUPLICATE_PATH") or None,
+            threshold=float(threshold) if threshold else DEFAULT_THRESHOLD,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                id INTEGER PRIMARY KEY,
+                scope TEXT NOT NULL,
+                canonical TEXT NOT NULL,
+                anchor TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                cache_key TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS fingerprints_canonical
+                ON fingerprints (scope, canonical);
+            CREATE TABLE IF NOT EXISTS bands (
+                scope TEXT NOT NULL,
+                rows INTEGER NOT NULL,
+                band INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                fingerprint_id INTEGER NOT NULL,
+                PRIMARY KEY (scope, rows, band, value, fingerprint_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        return conn
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[int]:
+        """One 63-bit hash per band of ``rows`` signature values"""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(
+                    _pack(signature[start : start + self.rows]), digest_size=8
+                ).digest(),
+                "big",
+            )
+            >> 1
+            for start in range(0, NUM_PERMUTATIONS, self.rows)
+        ]
+
+    def lookup(self, fp: Fingerprint, scope: str) -> Optional[Match]:
+        """
+        Find the cache key of a previously seen near-duplicate
+
+        Args:
+            fp: Fingerprint of the new transcript
+            scope: Requests are only matched within one scope (same system
+                prompt, model and output format)
+
+        Returns:
+            Match: The most similar indexed request, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cache_key FROM fingerprints WHERE scope = ? AND canonical = ?"
+                " ORDER BY id DESC LIMIT 1",
+                (scope, fp.canonical),
+            ).fetchone()
+            if row is not None:
+                return Match(row[0], 1.0, True)
+            bands = self._bands(fp.signature)
+            candidates = self._conn.execute(
+                f"""
+                SELECT cache_key, signature, anchor FROM fingerprints
+                WHERE id IN (
+                    SELECT fingerprint_id FROM bands
+                    WHERE scope = ? AND rows = ? AND (
+                        {" OR ".join("(band = ? AND value = ?)" for _ in bands)}
+                    )
+                )
+                """,
+                [scope, self.rows]
+                + [param for band in enumerate(bands) for param in band],
+            ).fetchall()
+
+        best: Optional[Match] = None
+        for cache_key, signature, anchor in candidates:
+            if anchor != fp.anchor:
+                continue
+            score = similarity(_unpack(signature), fp.signature)
+            if score >= self.threshold and (best is None or score > best.similarity):
+                best = Match(cache_key, score, False)
+        return best
+
+    def add(self, fp: Fingerprint, scope: str, cache_key: str) -> None:
+        """Record that a transcript's response is stored under cache_key"""
+        bands = self._bands(fp.signature)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM fingerprints WHERE scope = ? AND canonical = ?"
+                    " AND cache_key = ?",
+                    (scope, fp.canonical, cache_key),
+                ).fetchone()
+                if exists is None:
+                    fingerprint_id = self._conn.execute(
+                        """
+                        INSERT INTO fingerprints
+                            (scope, canonical, anchor, signature, cache_key, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            scope,
+                            fp.canonical,
+                            fp.anchor,
+                            _pack(fp.signature),
+                            cache_key,
+                            time.time(),
+                        ),
+                    ).lastrowid
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO bands VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (scope, self.rows, band, value, fingerprint_id)
+                            for band, value in enumerate(bands)
+                        ],
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+
+def _pack(values: Tuple[int, ...]) -> bytes:
+    return struct.pack(f">{len(values)}I", *values)
+
+
+def _unpack(blob: bytes) -> Tuple[int, ...]:
+    return struct.unpack(f">{len(blob) // 4}I", blob)
@@ -2,7 +2,49 @@
 
 import json
 import re
-from typing import Dict, Any
+from typing import Any, Dict
+
+_JSON_DECODER = json.JSONDecoder()
+_OBJECT_START = re.compile(r'\{\s*["}]')
+_BRACE_OR_QUOTE = re.compile(r'[{}"]')
+_QUOTE_OR_ESCAPE = re.compile(r'["\\]')
+
+SUMMARY_ERROR_CODES = ("NOT_A_MEETING_TRANSCRIPT", "NO_ACTION_ITEMS_FOUND")
+
+
+def _nullable(schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {"anyOf": [schema, {"type": "null"}]}
+
+
+# JSON schema for structured-output requests. Strict response formats need a
+# single object root with every property required, so the success and error
+# shapes share one object whose unused fields are null;
+# normalize_structured_summary() maps it back to the validated dict shape.
+MEETING_SUMMARY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "error": _nullable({"type": "string", "enum": list(SUMMARY_ERROR_CODES)}),
+        "meeting_title": _nullable({"type": "string"}),
+        "agenda": _nullable({"type": "string"}),
+        "action_items": _nullable(
+            {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "task": {"type": "string"},
+                        "owner": {"type": "string"},
+                        "deadline": {"type": "string"},
+                    },
+                    "required": ["task", "owner", "deadline"],
+                    "additionalProperties": False,
+                },
+            }
+        ),
+    },
+    "required": ["error", "meeting_title", "agenda", "action_items"],
+    "additionalProperties": False,
+}
 
 
 def validate_meeting_summary(summary: Dict[str, Any]) -> bool:
@@ -18,7 +60,7 @@ def validate_meeting_summary(summary: Dict[str, Any]) -> bool:
         bool: True if valid, False otherwise
     """
     if "error" in summary:
-        valid_errors = {"NOT_A_MEETING_TRANSCRIPT", "NO_ACTION_ITEMS_FOUND"}
+        valid_errors = set(SUMMARY_ERROR_CODES)
         return (
             len(summary) == 1
             and isinstance(summary["error"], str)
@@ -60,6 +102,80 @@ def validate_meeting_summary(summary: Dict[str, Any]) -> bool:
     return True
 
 
+def extract_json_object(text: str) -> Dict[str, Any]:
+    """
+    Extract the first complete top-level JSON object from an LLM response
+
+    Handles bare JSON, markdown code fences and JSON surrounded by prose
+    (including prose that itself contains braces) in a single left-to-right
+    pass. Only objects starting outside any other object are candidates, so
+    a truncated response is rejected rather than answered with one of the
+    objects nested inside it.
+
+    Args:
+        text: Raw text response from LLM
+
+    Returns:
+        dict: Parsed JSON object
+
+    Raises:
+        json.JSONDecodeError: If no complete top-level JSON object can be found
+    """
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            value = json.loads(stripped)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+
+    # Outside objects only JSON-looking starts matter ("{name}" in prose is
+    # skipped); raw_decode, a string- and escape-aware scanner in C, parses
+    # each one. A start that does not parse is an invalid or unclosed object:
+    # its extent is skipped by counting braces outside strings, so nothing
+    # nested in it is tried and every character is scanned a bounded number
+    # of times.
+    pos, depth = 0, 0
+    while True:
+        if depth == 0:
+            match = _OBJECT_START.search(text, pos)
+            if match is None:
+                break
+            try:
+                value, _ = _JSON_DECODER.raw_decode(text, match.start())
+                return value
+            except json.JSONDecodeError:
+                pos, depth = match.start() + 1, 1
+            continue
+
+        match = _BRACE_OR_QUOTE.search(text, pos)
+        if match is None:
+            break
+        char, pos = match.group(), match.end()
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        else:
+            pos = _string_end(text, pos)
+            if pos < 0:
+                break
+
+    raise json.JSONDecodeError("No complete JSON object found in response", text, 0)
+
+
+def _string_end(text: str, pos: int) -> int:
+    """Index just past the string whose body starts at pos, or -1 if unclosed"""
+    while True:
+        match = _QUOTE_OR_ESCAPE.search(text, pos)
+        if match is None:
+            return -1
+        if match.group() == '"':
+            return match.end()
+        pos = match.end() + 1
+
+
 def parse_json_response(text: str) -> Dict[str, Any]:
     """
     Parse JSON from LLM response, handling markdown code blocks
@@ -73,14 +189,20 @@ def parse_json_response(text: str) -> Dict[str, Any]:
     Raises:
         json.JSONDecodeError: If JSON cannot be parsed
     """
-    json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_match = re.search(r"\{.*\}", text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0)
-        else:
-            json_str = text
+    return extract_json_object(text)
+
 
-    return json.loads(json_str)
+def normalize_structured_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a MEETING_SUMMARY_SCHEMA response into the summary shape
+
+    Args:
+        data: Parsed structured-output response
+
+    Returns:
+        dict: {"error": code} if an error was reported, otherwise the summary
+        without null fields
+    """
+    if data.get("error"):
+        return {"error": data["error"]}
+    return {key: value for key, value in data.items() if value is not None}
@@ -0,0 +1,162 @@
+"""Incremental summarization of meetings that are still in progress"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .chunking import estimate_tokens, merge_summaries
+from .helpers import validate_meeting_summary
+from .telemetry import count
+
+
+class LiveMeetingSession:
+    """Summarize a meeting window by window as transcript lines arrive
+
+    Lines are buffered until roughly ``window_tokens`` tokens have accumulated;
+    only that new segment is then sent to the LLM, and its partial summary is
+    merged into the running summary. Finishing the meeting therefore costs one
+    call over the last partial window rather than a pass over the whole text.
+    The final summary gets the same post-processing as summarize_meeting
+    (owners, deadlines, the store); running summaries do not. A segment whose
+    answer fails validation is dropped and counted in ``windows_failed``, so
+    one malformed answer cannot break the merge of later segments.
+    """
+
+    def __init__(self, agent, window_tokens: int = 400, context_lines: int = 2):
+        """
+        Args:
+            agent: MeetingAgent used to build prompts and call the LLM
+            window_tokens: Approximate token size of each summarized segment
+            context_lines: Lines of the previous segment repeated as read-only
+                context, so commitments that span a window boundary are kept
+        """
+        if window_tokens <= 0:
+            raise ValueError("window_tokens must be positive")
+
+        self.agent = agent
+        self.window_tokens = window_tokens
+        self.context_lines = context_lines
+        self.summary: Optional[Dict[str, Any]] = None
+        self.windows_summarized = 0
+        self.windows_failed = 0
+
+        self._lines: List[str] = []
+        self._pending: List[str] = []
+        self._pending_tokens = 0
+        self._context: List[str] = []
+        self._parts: List[Dict[str, Any]] = []
+
+    def feed(self, line: str) -> Optional[Dict[str, Any]]:
+        """
+        Add one transcript line
+
+        Args:
+            line: A speaker line (or continuation line) as it arrives
+
+        Returns:
+            dict: The updated running summary if a window was summarized, else None
+        """
+        line = line.rstrip()
+        if not line.strip():
+            return None
+
+        self._lines.append(line)
+        self._pending.append(line)
+        self._pending_tokens += estimate_tokens(line) + 1
+        if self._pending_tokens >= self.window_tokens:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """
+        Summarize any buffered lines now and merge them into the running summary
+
+        Returns:
+            dict: The running summary (None if nothing has been summarized yet)
+        """
+        if not self._pending:
+            return self.summary
+
+        segment = self._pending
+        self._pending, self._pending_tokens = [], 0
+        try:
+            part = self._summarize_segment(segment)
+        except Exception:
+            self._pending = segment + self._pending
+            self._pending_tokens = sum(
+                estimate_tokens(pending) + 1 for pending in self._pending
+            )
+            raise
+
+        self._context = segment[-self.context_lines :] if self.context_lines else []
+        if not (isinstance(part, dict) and validate_meeting_summary(part)):
+            self.windows_failed += 1
+            count("live_failed_segments")
+            return self.summary
+
+        self._parts.append(part)
+        self.windows_summarized += 1
+        self.summary = merge_summaries(self._parts)
+        return self.summary
+
+    def finish(
+        self, reference_time: Optional[Union[date, datetime, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Summarize the remaining lines and return the final summary
+
+        Args:
+            reference_time: When the meeting took place, for resolving
+                relative deadlines and for the store; defaults to now
+
+        Returns:
+            dict: Final summary or error response
+        """
+        summary = self.flush()
+        if summary is None:
+            return {"error": "NOT_A_MEETING_TRANSCRIPT"}
+        self.summary = self.agent._finish(
+            "\n".join(self._lines), summary, reference_time
+        )
+        return self.summary
+
+    def stream(
+        self,
+        lines: Iterable[str],
+        reference_time: Optional[Union[date, datetime, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Feed lines from an iterable, yielding the running summary after each window
+
+        The last value yielded is the final summary.
+
+        Args:
+            lines: Transcript lines, e.g. from a live captioning feed
+            reference_time: Passed to finish()
+
+        Yields:
+            dict: Updated running summary
+        """
+        for line in lines:
+            summary = self.feed(line)
+            if summary is not None:
+                yield summary
+        yield self.finish(reference_time)
+
+    def _summarize_segment(self, segment: List[str]) -> Dict[str, Any]:
+        """Send one new segment, with a little preceding context, to the LLM"""
+        verdict = self.agent._pre_classify("\n".join(segment))
+        if verdict is not None:
+            return verdict
+
+        note = (
+            "The transcript below is the latest segment of a meeting still in progress."
+        )
+        if self._context:
+            context = "\n".join(self._context)
+            note = (
+                f"{note} These earlier lines were already summarized and are "
+                f"included only for context; do not extract items from them:\n"
+                f"{context}"
+            )
+        prompt = self.agent._build_prompt("\n".join(segment), note)
+        return self.agent._summarize_prompt(prompt)
@@ -2,99 +2,671 @@
 
 import os
 import json
+import asyncio
 import hashlib
-from typing import Optional
+import weakref
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+)
 from dotenv import load_dotenv
-from llama_index.llms.openai import OpenAI
 
-load_dotenv()
+from .backends import LLMBackend, create_backend, stream_backend
+from .cache import CacheStore, SingleFlight
+from .fingerprint import Fingerprint, NearDuplicateIndex, fingerprint
+from .helpers import extract_json_object
+from .resilience import Resilience, UpstreamUnavailableError
+from . import telemetry
 
+load_dotenv()
 
-def _get_cache_file(input_hash: str) -> str:
-    """Get cache file path based on input content hash for persistence across runs."""
-    cache_dir = os.path.join(os.getcwd(), ".pytest_cache")
-    os.makedirs(cache_dir, exist_ok=True)
-    return os.path.join(cache_dir, f"cache_{input_hash[:8]}.json")
 
+def _get_input_hash(
+    prompt: str, model: str, max_tokens: int, system: Optional[str] = None
+) -> str:
+    """Create a hash of input parameters for caching.
 
-def _get_input_hash(prompt: str, model: str, max_tokens: int) -> str:
-    """Create a hash of input parameters for caching."""
-    input_str = f"{prompt}|{model}|{max_tokens}"
+    With a system message, the (long, invariant) system prefix and the user
+    content are hashed separately so the prefix digest is computed once and
+    reused across calls.
+    """
+    if system is None:
+        input_str = f"{prompt}|{model}|{max_tokens}"
+    else:
+        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+        input_str = (
+            f"system:{_get_prefix_hash(system)}|user:{prompt_hash}|{model}|{max_tokens}"
+        )
     return hashlib.sha256(input_str.encode()).hexdigest()
 
 
+@lru_cache(maxsize=64)
+def _get_prefix_hash(system: str) -> str:
+    """Hash of a system prefix, memoized because the same few prefixes repeat."""
+    return hashlib.sha256(system.encode()).hexdigest()
+
+
+def _get_request_options(system: Optional[str], **kwargs: Any) -> Dict[str, Any]:
+    """Backend keyword arguments; ``system`` is only sent when set."""
+    if system is not None:
+        kwargs["system"] = system
+    return kwargs
+
+
+def _get_response_format(schema: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Build an OpenAI json_schema response format for a schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
+
+def _get_dedupe_scope(schema: Optional[Dict[str, Any]] = None) -> str:
+    """Near-duplicate scope input: requests only match with the same format."""
+    if schema is None:
+        return "near_duplicate|text"
+    schema_str = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return f"near_duplicate|schema:{schema_str}"
+
+
+def _get_structured_prompt(prompt: str, schema: Dict[str, Any]) -> str:
+    """Cache input for a structured request; the schema is part of the input."""
+    schema_str = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return f"{prompt}|schema:{schema_str}"
+
+
+class _StreamAbandoned(Exception):
+    """A streamed request whose reader stopped before the end"""
+
+
 class LLMClient:
     """Simple LLM client for text completions"""
 
-    def __init__(self):
-        """Initialize LLM client with environment validation"""
-        self._validate_environment()
-        self._llm = None
-
-    def _validate_environment(self):
-        """Validate required environment variables"""
-        if not os.getenv("OPENAI_API_KEY"):
-            raise ValueError(
-                "OpenAI API key is required for LLM operations. "
-                "Please set environment variables:\n"
-                "OPENAI_API_KEY=your_api_key\n"
-                "OPENAI_API_BASE=https://api.openai.com/v1 (optional)\n"
-                "Example: OPENAI_API_KEY=sk-your-key python app.py"
-            )
+    def __init__(
+        self,
+        cache: Optional[CacheStore] = None,
+        max_concurrency: Optional[int] = None,
+        backend: Optional[LLMBackend] = None,
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+        resilience: Optional[Resilience] = None,
+    ):
+        """
+        Initialize LLM client with environment validation
+
+        Args:
+            cache: Response cache; defaults to a store configured from LLM_CACHE_* env vars
+            max_concurrency: Max in-flight acomplete() requests per event loop
+                (defaults to LLM_MAX_CONCURRENCY or 8)
+            backend: Model backend; defaults to the one selected by LLM_BACKEND
+            near_duplicates: Index serving cached responses to requests whose
+                ``dedupe_text`` is a near-duplicate of an earlier one; defaults
+                to NearDuplicateIndex.from_env() (off unless LLM_NEAR_DUPLICATES=1)
+            resilience: Timeouts, retries, rate limit and circuit breaker for
+                backend requests; defaults to Resilience.from_env()
+        """
+        self.backend = backend if backend is not None else create_backend()
+        self.cache = cache if cache is not None else CacheStore.from_env()
+        self.near_duplicates = (
+            near_duplicates
+            if near_duplicates is not None
+            else NearDuplicateIndex.from_env()
+        )
+        self.resilience = (
+            resilience if resilience is not None else Resilience.from_env()
+        )
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("LLM_MAX_CONCURRENCY", "8")
+        )
+        if self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self._inflight = SingleFlight()
+        # Per event loop: (request semaphore, in-flight tasks by cache key)
+        self._loop_state = weakref.WeakKeyDictionary()
 
     @property
-    def llm(self) -> OpenAI:
-        """Get LLM instance (lazy initialization)"""
-        if self._llm is None:
-            self._llm = OpenAI(
-                model="gpt-4o-mini",
-                max_tokens=4096,
-                temperature=0.1,
-            )
-        return self._llm
+    def llm(self):
+        """Get the llama_index LLM instance of the OpenAI backend"""
+        return self.backend.llm
+
+    def _cache_key(
+        self, prompt: str, system: Optional[str] = None, **options: Any
+    ) -> str:
+        """Cache key for a prompt sent to the requested (or backend) model."""
+        return _get_input_hash(
+            prompt,
+            options.get("model", self.backend.model),
+            options.get("max_tokens", self.backend.max_tokens),
+            system,
+        )
 
-    def complete(self, prompt: str) -> str:
+    def _model_options(
+        self, model: Optional[str], max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Per-request model overrides; backend defaults are not repeated."""
+        options: Dict[str, Any] = {}
+        if model is not None and model != self.backend.model:
+            options["model"] = model
+        if max_tokens is not None and max_tokens != self.backend.max_tokens:
+            options["max_tokens"] = max_tokens
+        return options
+
+    def _dedupe(
+        self,
+        dedupe_text: Optional[str],
+        system: Optional[str],
+        schema: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ) -> Optional[Tuple[str, str]]:
+        """(scope, text) for near-duplicate lookup, or None when not enabled."""
+        if dedupe_text is None or self.near_duplicates is None:
+            return None
+        scope = self._cache_key(_get_dedupe_scope(schema), system, **options)
+        return scope, dedupe_text
+
+    def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        dedupe_text: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """
         Complete a text prompt with caching
 
+        Passing the long, unchanging instructions as ``system`` sends them as a
+        separate leading message, which providers can serve from their prompt
+        cache on every call after the first.
+
         Args:
-            prompt: The text prompt to complete
+            prompt: The text prompt to complete (the variable user content)
+            system: Optional system instructions sent ahead of the prompt
+            dedupe_text: Text the response depends on (e.g. the transcript);
+                with a near-duplicate index, a cached response for a
+                near-duplicate of it is returned instead of calling the LLM
+            model: Model for this request instead of the backend's default
+            max_tokens: Output token limit for this request
 
         Returns:
             The LLM response text
         """
-        cache_key = _get_input_hash(prompt, "gpt-4o-mini", 4096)
-        cache_file = _get_cache_file(cache_key)
+        routed = self._model_options(model, max_tokens)
+        options = _get_request_options(system, **routed)
+        with telemetry.span("llm.complete", model=model or self.backend.model):
+            return self._complete_cached(
+                self._cache_key(prompt, system, **routed),
+                lambda: self._call_backend(prompt, **options),
+                self._dedupe(dedupe_text, system, **routed),
+            )
+
+    def complete_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        schema_name: str = "response",
+        system: Optional[str] = None,
+        dedupe_text: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Complete a prompt with the output constrained to a JSON schema
+
+        The schema is sent as an OpenAI ``json_schema`` response format, so the
+        model returns JSON that already matches it and no text scraping or
+        re-asking is needed.
+
+        Args:
+            prompt: The text prompt to complete
+            schema: JSON schema the response must follow
+            schema_name: Name reported to the API for the schema
+            system: Optional system instructions sent ahead of the prompt
+            dedupe_text: Text the response depends on; see complete()
+            model: Model for this request instead of the backend's default
+            max_tokens: Output token limit for this request
+
+        Returns:
+            dict: The parsed response
+        """
+        routed = self._model_options(model, max_tokens)
+        options = _get_request_options(
+            system,
+            response_format=_get_response_format(schema, schema_name),
+            **routed,
+        )
+        with telemetry.span(
+            "llm.complete", model=model or self.backend.model, structured=True
+        ):
+            content = self._complete_cached(
+                self._cache_key(
+                    _get_structured_prompt(prompt, schema), system, **routed
+                ),
+                lambda: self._call_backend(prompt, **options),
+                self._dedupe(dedupe_text, system, schema, **routed),
+            )
+            with telemetry.span("llm.parse"):
+                return extract_json_object(content)
+
+    def stream_complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+        dedupe_text: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Complete a prompt, yielding the response text as it is generated
+
+        Cached responses, including those of near-duplicate ``dedupe_text``,
+        are yielded as one piece. Otherwise one caller per key (across threads
+        and, via the cache lock, processes) streams the request; identical
+        requests arriving meanwhile wait and receive the full text as one
+        piece. The request runs under the resilience policy until its first
+        piece arrives; a failure after that is not retried, because part of
+        the response has already been delivered. The full text is cached under
+        the key complete() (or complete_structured() when ``schema`` is given)
+        uses, but only once the stream has been read to the end.
+
+        Args:
+            prompt: The text prompt to complete
+            system: Optional system instructions sent ahead of the prompt
+            schema: Optional JSON schema the response must follow, sent as in
+                complete_structured(); the pieces are still raw text
+            schema_name: Name reported to the API for the schema
+            dedupe_text: Text the response depends on; see complete()
+            model: Model for this request instead of the backend's default
+            max_tokens: Output token limit for this request
+
+        Yields:
+            str: Consecutive pieces of the response text
+        """
+        routed = self._model_options(model, max_tokens)
+        if schema is None:
+            options = _get_request_options(system, **routed)
+            cache_key = self._cache_key(prompt, system, **routed)
+        else:
+            options = _get_request_options(
+                system,
+                response_format=_get_response_format(schema, schema_name),
+                **routed,
+            )
+            cache_key = self._cache_key(
+                _get_structured_prompt(prompt, schema), system, **routed
+            )
+        dedupe = self._dedupe(dedupe_text, system, schema, **routed)
+
+        cached, stale = self._cache_lookup(cache_key)
+        if cached is not None:
+            telemetry.count("llm_cache_requests", outcome="hit")
+            yield cached
+            return
+
+        cached, fp = self._near_duplicate_get(dedupe)
+        if cached is not None:
+            yield cached
+            return
+
+        telemetry.count("llm_cache_requests", outcome="miss")
+        while True:
+            call, leader = self._inflight.join(cache_key)
+            if leader:
+                break
+            try:
+                content = call.wait()
+            except _StreamAbandoned:
+                # The leader's reader stopped early; stream the request here
+                continue
+            self._near_duplicate_add(dedupe, fp, cache_key)
+            yield content
+            return
 
         try:
-            if os.path.exists(cache_file):
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
-                    if cache_key in cache_data:
-                        return cache_data[cache_key]
-        except (json.JSONDecodeError, IOError, OSError):
-            pass
+            content = yield from self._stream_uncached(
+                cache_key, prompt, stale, **options
+            )
+        except GeneratorExit:
+            self._inflight.finish(cache_key, call, error=_StreamAbandoned())
+            raise
+        except BaseException as e:
+            self._inflight.finish(cache_key, call, error=e)
+            raise
+        self._inflight.finish(cache_key, call, content)
+        self._near_duplicate_add(dedupe, fp, cache_key)
+
+    def _stream_uncached(
+        self, cache_key: str, prompt: str, stale: Optional[str], **options: Any
+    ) -> Generator[str, None, str]:
+        """Stream one request under the key's cross-process lock; returns the text."""
+        with self.cache.lock(cache_key):
+            # Another process may have filled the entry while we waited
+            cached = self._cache_get(cache_key, count=False)
+            if cached is not None:
+                yield cached
+                return cached
+
+            try:
+                first, rest = self._open_stream(prompt, **options)
+            except Exception as e:
+                content = self._fallback(e, stale)
+                yield content
+                return content
 
+            pieces = [first]
+            yield first
+            try:
+                for piece in rest:
+                    pieces.append(piece)
+                    yield piece
+            except Exception as e:
+                telemetry.count("llm_request_errors")
+                raise Exception(f"LLM completion failed: {e}") from e
+
+            content = "".join(pieces)
+            self._record_usage(
+                prompt, content, options.get("system"), options.get("model")
+            )
+            try:
+                self.cache.set(cache_key, content)
+            except Exception:
+                pass
+            return content
+
+    def _open_stream(self, prompt: str, **kwargs: Any) -> Tuple[str, Iterator[str]]:
+        """Start a streamed request upstream: its first piece and the rest."""
+
+        def start() -> Tuple[str, Iterator[str]]:
+            stream = stream_backend(self.backend, prompt, **kwargs)
+            return next(stream, ""), stream
+
+        model = kwargs.get("model", self.backend.model)
+        with telemetry.span(
+            "llm.stream_first_piece", backend=self.backend.name, model=model
+        ):
+            return self.resilience.call(start)
+
+    def _call_backend(self, prompt: str, **kwargs: Any) -> str:
+        """Send one request upstream, timing it and counting its tokens."""
+        model = kwargs.get("model", self.backend.model)
+        with telemetry.span("llm.request", backend=self.backend.name, model=model):
+            content = self.resilience.call(
+                lambda: self.backend.complete(prompt, **kwargs)
+            )
+        self._record_usage(prompt, content, kwargs.get("system"), model)
+        return content
+
+    async def _acall_backend(self, prompt: str, **kwargs: Any) -> str:
+        """Async counterpart of _call_backend."""
+        model = kwargs.get("model", self.backend.model)
+        with telemetry.span("llm.request", backend=self.backend.name, model=model):
+            content = await self.resilience.acall(
+                lambda: self.backend.acomplete(prompt, **kwargs)
+            )
+        self._record_usage(prompt, content, kwargs.get("system"), model)
+        return content
+
+    def _record_usage(
+        self,
+        prompt: str,
+        content: str,
+        system: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        """Estimate tokens for backends that don't report provider usage."""
+        if not getattr(self.backend, "reports_usage", False):
+            telemetry.record_token_usage(
+                model or self.backend.model, prompt, content, system=system
+            )
+
+    def _complete_cached(
+        self,
+        cache_key: str,
+        request: Callable[[], str],
+        dedupe: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """Serve from cache or run one coalesced request for the key."""
+        cached, stale = self._cache_lookup(cache_key)
+        if cached is not None:
+            telemetry.count("llm_cache_requests", outcome="hit")
+            return cached
+
+        cached, fp = self._near_duplicate_get(dedupe)
+        if cached is not None:
+            return cached
+
+        telemetry.count("llm_cache_requests", outcome="miss")
+        content = self._inflight.do(
+            cache_key, lambda: self._complete_uncached(cache_key, request, stale)
+        )
+        self._near_duplicate_add(dedupe, fp, cache_key)
+        return content
+
+    def _near_duplicate_get(
+        self, dedupe: Optional[Tuple[str, str]]
+    ) -> Tuple[Optional[str], Optional[Fingerprint]]:
+        """Cached response of a near-duplicate request, and the request's fingerprint."""
+        if dedupe is None:
+            return None, None
+        scope, text = dedupe
+        with telemetry.span("llm.near_duplicate_lookup"):
+            try:
+                fp = fingerprint(text)
+                match = self.near_duplicates.lookup(fp, scope)
+            except Exception:
+                telemetry.count("llm_cache_errors")
+                return None, None
+            if match is None:
+                return None, fp
+            cached = self._cache_get(match.cache_key, count=False)
+        if cached is not None:
+            outcome = "canonical_hit" if match.exact else "near_hit"
+            telemetry.count("llm_cache_requests", outcome=outcome)
+        return cached, fp
+
+    def _near_duplicate_add(
+        self,
+        dedupe: Optional[Tuple[str, str]],
+        fp: Optional[Fingerprint],
+        cache_key: str,
+    ) -> None:
+        """Index a fresh response so near-duplicates of its input can reuse it."""
+        if dedupe is None or fp is None:
+            return
         try:
-            response = self.llm.complete(prompt)
-            content = response.text
+            self.near_duplicates.add(fp, dedupe[0], cache_key)
+        except Exception:
+            telemetry.count("llm_cache_errors")
+
+    def _cache_get(self, cache_key: str, count: bool = True) -> Optional[str]:
+        """Read from the cache, treating storage errors as a miss."""
+        return self._cache_lookup(cache_key, count)[0]
 
+    def _cache_lookup(
+        self, cache_key: str, count: bool = True
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """(fresh, expired) cached values, treating storage errors as a miss."""
+        with telemetry.span("llm.cache_lookup"):
             try:
-                cache_data = {}
-                if os.path.exists(cache_file):
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        cache_data = json.load(f)
+                return self.cache.lookup(cache_key, count=count)
+            except Exception:
+                telemetry.count("llm_cache_errors")
+                return None, None
+
+    @staticmethod
+    def _fallback(error: Exception, stale: Optional[str]) -> str:
+        """Answer with an expired cached response if upstream is unavailable."""
+        if stale is not None and isinstance(error, UpstreamUnavailableError):
+            telemetry.count("llm_call_outcomes", outcome="stale_fallback")
+            return stale
+        telemetry.count("llm_request_errors")
+        raise Exception(f"LLM completion failed: {error}") from error
 
-                cache_data[cache_key] = content
+    def _complete_uncached(
+        self, cache_key: str, request: Callable[[], str], stale: Optional[str] = None
+    ) -> str:
+        """Call the LLM once per key across threads and processes."""
+        with self.cache.lock(cache_key):
+            # Another process may have filled the entry while we waited
+            cached = self._cache_get(cache_key, count=False)
+            if cached is not None:
+                return cached
 
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(cache_data, f, indent=2)
+            try:
+                content = request()
+            except Exception as e:
+                return self._fallback(e, stale)
+
+            try:
+                self.cache.set(cache_key, content)
             except Exception:
                 pass
 
             return content
-        except Exception as e:
-            raise Exception(f"LLM completion failed: {e}") from e
+
+    def _get_loop_state(self) -> Tuple[asyncio.Semaphore, Dict[str, asyncio.Task]]:
+        """Get the semaphore and in-flight tasks bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+        if state is None:
+            state = (asyncio.Semaphore(self.max_concurrency), {})
+            self._loop_state[loop] = state
+        return state
+
+    async def acomplete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        dedupe_text: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Complete a text prompt asynchronously, sharing the cache with complete()
+
+        At most ``max_concurrency`` requests per event loop are sent upstream at
+        once, and identical prompts awaited concurrently share one request.
+
+        Args:
+            prompt: The text prompt to complete
+            system: Optional system instructions sent ahead of the prompt
+            dedupe_text: Text the response depends on; see complete()
+            model: Model for this request instead of the backend's default
+            max_tokens: Output token limit for this request
+
+        Returns:
+            The LLM response text
+        """
+        routed = self._model_options(model, max_tokens)
+        options = _get_request_options(system, **routed)
+        with telemetry.span("llm.acomplete", model=model or self.backend.model):
+            return await self._acomplete_cached(
+                self._cache_key(prompt, system, **routed),
+                lambda: self._acall_backend(prompt, **options),
+                self._dedupe(dedupe_text, system, **routed),
+            )
+
+    async def acomplete_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        schema_name: str = "response",
+        system: Optional[str] = None,
+        dedupe_text: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of complete_structured()"""
+        routed = self._model_options(model, max_tokens)
+        options = _get_request_options(
+            system,
+            response_format=_get_response_format(schema, schema_name),
+            **routed,
+        )
+        with telemetry.span(
+            "llm.acomplete", model=model or self.backend.model, structured=True
+        ):
+            content = await self._acomplete_cached(
+                self._cache_key(
+                    _get_structured_prompt(prompt, schema), system, **routed
+                ),
+                lambda: self._acall_backend(prompt, **options),
+                self._dedupe(dedupe_text, system, schema, **routed),
+            )
+            with telemetry.span("llm.parse"):
+                return extract_json_object(content)
+
+    async def _acomplete_cached(
+        self,
+        cache_key: str,
+        request: Callable[[], Awaitable[str]],
+        dedupe: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """Serve from cache or run one coalesced, semaphore-bounded request."""
+        cached, stale = self._cache_lookup(cache_key)
+        if cached is not None:
+            telemetry.count("llm_cache_requests", outcome="hit")
+            return cached
+
+        cached, fp = self._near_duplicate_get(dedupe)
+        if cached is not None:
+            return cached
+
+        telemetry.count("llm_cache_requests", outcome="miss")
+        _, inflight = self._get_loop_state()
+        task = inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._acomplete_uncached(cache_key, request, stale)
+            )
+            inflight[cache_key] = task
+            task.add_done_callback(lambda _: inflight.pop(cache_key, None))
+        else:
+            self._inflight.coalesced += 1
+            telemetry.count("llm_coalesced_requests")
+
+        content = await asyncio.shield(task)
+        self._near_duplicate_add(dedupe, fp, cache_key)
+        return content
+
+    async def _acomplete_uncached(
+        self,
+        cache_key: str,
+        request: Callable[[], Awaitable[str]],
+        stale: Optional[str] = None,
+    ) -> str:
+        """Async counterpart of _complete_uncached bounded by the loop semaphore."""
+        semaphore, _ = self._get_loop_state()
+        async with semaphore:
+            token = await asyncio.to_thread(self.cache.acquire_lock, cache_key)
+            try:
+                cached = await asyncio.to_thread(
+                    self._cache_get, cache_key, count=False
+                )
+                if cached is not None:
+                    return cached
+
+                try:
+                    content = await request()
+                except Exception as e:
+                    return self._fallback(e, stale)
+
+                try:
+                    await asyncio.to_thread(self.cache.set, cache_key, content)
+                except Exception:
+                    pass
+
+                return content
+            finally:
+                self.cache.release_lock(token)
 
 
 _llm_client: Optional[LLMClient] = None
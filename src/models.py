@@ -0,0 +1,247 @@
+"""Compact, immutable summary models
+
+The agent returns summaries as nested dicts, which is convenient at the
+edges but costly to keep around in bulk: every dict carries a hash table and
+every copy of "Bob" or "Friday" is its own string. These models are
+validated once at construction and then trusted:
+
+- ActionItem, MeetingSummary and SummaryError are frozen and slotted (no
+  per-instance __dict__)
+- owner and deadline strings are interned, so repeated names and dates are
+  stored once per process
+- to_dict / to_json produce exactly the shape validate_meeting_summary
+  accepts, and to_json writes the JSON without building intermediate dicts
+
+MeetingAgent converts each summary it stores into these models, and
+ActionItemStore ingests them without re-checking their fields.
+"""
+
+import sys
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from .helpers import (
+    SUMMARY_ERROR_CODES,
+    normalize_structured_summary,
+    parse_json_response,
+)
+from .validation import explain_meeting_summary
+
+
+class SummaryValidationError(ValueError):
+    """Raised when data does not describe a valid summary"""
+
+    def __init__(self, reasons: Iterable[str]):
+        self.reasons = tuple(reasons)
+        super().__init__("; ".join(self.reasons) or "invalid summary")
+
+
+def _require_text(value: Any, name: str) -> None:
+    if not isinstance(value, str) or not value or value.isspace():
+        raise SummaryValidationError([f"{name} must be a non-empty string"])
+
+
+@dataclass(frozen=True)
+class ActionItem:
+    """One task with its owner and deadline"""
+
+    __slots__ = ("task", "owner", "deadline")
+
+    task: str
+    owner: str
+    deadline: str
+
+    def __post_init__(self):
+        _require_text(self.task, "task")
+        _require_text(self.owner, "owner")
+        _require_text(self.deadline, "deadline")
+        object.__setattr__(self, "owner", sys.intern(self.owner))
+        object.__setattr__(self, "deadline", sys.intern(self.deadline))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled items are interned again
+        return ActionItem, (self.task, self.owner, self.deadline)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ActionItem":
+        """Build from {"task", "owner", "deadline"}; extra keys are ignored"""
+        try:
+            return cls(data["task"], data["owner"], data["deadline"])
+        except (KeyError, TypeError) as e:
+            raise SummaryValidationError([f"invalid action item: {e!r}"]) from None
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"task": self.task, "owner": self.owner, "deadline": self.deadline}
+
+    def to_json(self) -> str:
+        return (
+            f'{{"task": {encode_basestring_ascii(self.task)}, '
+            f'"owner": {encode_basestring_ascii(self.owner)}, '
+            f'"deadline": {encode_basestring_ascii(self.deadline)}}}'
+        )
+
+
+@dataclass(frozen=True)
+class MeetingSummary:
+    """A successful summary: title, agenda and action items"""
+
+    __slots__ = ("meeting_title", "agenda", "action_items")
+
+    meeting_title: str
+    agenda: str
+    action_items: Tuple[ActionItem, ...]
+
+    is_error = False
+
+    def __post_init__(self):
+        _require_text(self.meeting_title, "meeting_title")
+        _require_text(self.agenda, "agenda")
+        items = self.action_items
+        if isinstance(items, list):
+            items = tuple(items)
+            object.__setattr__(self, "action_items", items)
+        elif not isinstance(items, tuple):
+            raise SummaryValidationError(["action_items must be a list"])
+        for position, item in enumerate(items):
+            if not isinstance(item, ActionItem):
+                raise SummaryValidationError(
+                    [f"action_items[{position}] must be an ActionItem"]
+                )
+
+    def __reduce__(self):
+        return MeetingSummary, (self.meeting_title, self.agenda, self.action_items)
+
+    @property
+    def owners(self) -> Tuple[str, ...]:
+        """Distinct owners in order of first appearance"""
+        return tuple(dict.fromkeys(item.owner for item in self.action_items))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "meeting_title": self.meeting_title,
+            "agenda": self.agenda,
+            "action_items": [item.to_dict() for item in self.action_items],
+        }
+
+    def to_json(self) -> str:
+        items = ", ".join(item.to_json() for item in self.action_items)
+        return (
+            f'{{"meeting_title": {encode_basestring_ascii(self.meeting_title)}, '
+            f'"agenda": {encode_basestring_ascii(self.agenda)}, '
+            f'"action_items": [{items}]}}'
+        )
+
+
+@dataclass(frozen=True)
+class SummaryError:
+    """The agent's answer when there is nothing to summarize"""
+
+    __slots__ = ("error",)
+
+    error: str
+
+    is_error = True
+
+    def __post_init__(self):
+        if self.error not in SUMMARY_ERROR_CODES:
+            raise SummaryValidationError(
+                [f"error must be one of {', '.join(SUMMARY_ERROR_CODES)}"]
+            )
+        object.__setattr__(self, "error", sys.intern(self.error))
+
+    def __reduce__(self):
+        return SummaryError, (self.error,)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"error": self.error}
+
+    def to_json(self) -> str:
+        return f'{{"error": {encode_basestring_ascii(self.error)}}}'
+
+
+SummaryResult = Union[MeetingSummary, SummaryError]
+
+
+def summary_from_dict(data: Dict[str, Any]) -> SummaryResult:
+    """
+    Build a model from a summary dict in the agent's output shape
+
+    Args:
+        data: Summary dict, as returned by MeetingAgent.summarize_meeting
+
+    Returns:
+        MeetingSummary or SummaryError
+
+    Raises:
+        SummaryValidationError: If validate_meeting_summary would reject it,
+            with every reason attached
+    """
+    try:
+        if "error" in data:
+            if len(data) != 1:
+                raise SummaryValidationError([])
+            return SummaryError(data["error"])
+        items = data["action_items"]
+        if not isinstance(items, list):
+            raise SummaryValidationError([])
+        return MeetingSummary(
+            data["meeting_title"],
+            data["agenda"],
+            tuple(
+                ActionItem(item["task"], item["owner"], item["deadline"])
+                for item in items
+            ),
+        )
+    except (SummaryValidationError, KeyError, TypeError):
+        # Only the failure path walks the data again, to report every reason
+        raise SummaryValidationError(explain_meeting_summary(data)) from None
+
+
+def summary_from_json(text: str, structured: bool = False) -> SummaryResult:
+    """
+    Build a model from an LLM response
+
+    Args:
+        text: Raw response text; JSON may be fenced or surrounded by prose
+        structured: The response follows MEETING_SUMMARY_SCHEMA (null fields)
+
+    Returns:
+        MeetingSummary or SummaryError
+
+    Raises:
+        json.JSONDecodeError: If no JSON object is found
+        SummaryValidationError: If the JSON is not a valid summary
+    """
+    data = parse_json_response(text)
+    if structured:
+        data = normalize_structured_summary(data)
+    return summary_from_dict(data)
+
+
+if __name__ == "__main__":
+    # Rough memory comparison for many small summaries
+    import json
+    import tracemalloc
+
+    def sample(i: int) -> Dict[str, Any]:
+        return {
+            "meeting_title": f"Sync {i}",
+            "agenda": "Weekly status",
+            "action_items": [
+                {"task": f"Task {i}.{j}", "owner": f"Owner{j}", "deadline": "Friday"}
+                for j in range(5)
+            ],
+        }
+
+    raw = [json.dumps(sample(i)) for i in range(20000)]
+    for label, build in (
+        ("dicts", json.loads),
+        ("models", lambda text: summary_from_dict(json.loads(text))),
+    ):
+        tracemalloc.start()
+        kept = [build(text) for text in raw]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>6}: {size / len(kept):8.0f} bytes per summary")
+        del kept
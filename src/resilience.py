@@ -0,0 +1,541 @@
+"""Retries, deadlines, rate limiting and circuit breaking for upstream calls
+
+LLMClient sends every backend request through a Resilience object:
+
+- TokenBucket: client-side rate limit shared by all threads and coroutines
+  using the client, so a batch cannot burst past the provider's quota
+- CircuitBreaker: after ``failure_threshold`` consecutive transient failures
+  calls fail fast with CircuitOpenError for ``reset_timeout`` seconds, then a
+  single probe decides whether to close it again
+- RetryPolicy: transient failures (timeouts, connection errors, 408/409/429
+  and 5xx responses) are retried with full-jitter exponential backoff; a
+  Retry-After / x-ratelimit-reset header on the error sets the delay instead.
+  Every attempt has its own timeout and all attempts share one deadline
+
+Exhausted retries, an open circuit and a missed deadline all raise an
+UpstreamUnavailableError, which LLMClient answers from its cache when it can.
+Outcomes are counted in the ``llm_call_outcomes`` and ``llm_retries``
+telemetry counters.
+
+Usage:
+    resilience = Resilience(RetryPolicy(max_attempts=3), TokenBucket(rate=5))
+    text = resilience.call(lambda: backend.complete(prompt))
+"""
+
+import asyncio
+import contextvars
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .cache import _env_number
+from .telemetry import count
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+# Exception class names of transient errors raised by HTTP/LLM client libraries
+RETRYABLE_ERROR_NAMES = re.compile(
+    r"Timeout|Connection|RateLimit|ServiceUnavailable|InternalServer|Overloaded"
+)
+RATE_LIMIT_RESET_HEADERS = ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+DURATION_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+DEADLINE_WORKERS = 64
+
+# Worker pool for attempt timeouts, shared by every Resilience so building a
+# client does not start threads of its own
+_deadline_executor: Optional[ThreadPoolExecutor] = None
+_deadline_executor_lock = threading.Lock()
+
+
+class UpstreamUnavailableError(Exception):
+    """The upstream could not produce a response within the retry policy"""
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised without calling upstream while the circuit breaker is open"""
+
+
+class DeadlineExceeded(UpstreamUnavailableError, TimeoutError):
+    """An attempt or the whole call ran past its time budget"""
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an API error, if the error carries one"""
+    for source in (error, getattr(error, "response", None)):
+        status = getattr(source, "status_code", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Seconds in "1.5", "120ms", "6m0s" or an HTTP date"""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = DURATION_PART_PATTERN.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value.replace(" ", ""):
+        scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(n) * scale[u] for n, u in parts)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """
+    Delay the upstream asked for before the next attempt
+
+    Args:
+        error: Exception raised by the backend
+
+    Returns:
+        float or None: Seconds from a ``retry_after`` attribute or the
+        Retry-After-Ms, Retry-After or x-ratelimit-reset-* response headers
+    """
+    explicit = getattr(error, "retry_after", None)
+    if isinstance(explicit, (int, float)):
+        return max(0.0, float(explicit))
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    headers = {str(k).lower(): str(v) for k, v in dict(headers).items()}
+    if "retry-after-ms" in headers:
+        delay = _parse_duration(headers["retry-after-ms"])
+        if delay is not None:
+            return delay / 1000
+    resets = [
+        _parse_duration(headers[name])
+        for name in ("retry-after",) + RATE_LIMIT_RESET_HEADERS
+        if name in headers
+    ]
+    resets = [delay for delay in resets if delay is not None]
+    return resets[0] if resets else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is transient and worth another attempt"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return any(
+        RETRYABLE_ERROR_NAMES.search(cls.__name__) for cls in type(error).__mro__
+    )
+
+
+class RetryPolicy:
+    """How often, how long and how far apart to attempt one call"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        attempt_timeout: Optional[float] = 60.0,
+        deadline: Optional[float] = 180.0,
+    ):
+        """
+        Args:
+            max_attempts: Attempts including the first; 1 disables retries
+            base_delay: Backoff ceiling of the first retry, doubled per retry
+            max_delay: Largest backoff ceiling
+            attempt_timeout: Seconds one attempt may take, None for no limit
+            deadline: Seconds all attempts and backoff together may take
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+        self.deadline = deadline
+
+    def backoff(self, attempt: int, error: BaseException, rng: random.Random) -> float:
+        """
+        Delay before the attempt after ``attempt`` (1-based)
+
+        The upstream's Retry-After wins; otherwise "full jitter": uniform in
+        [0, min(max_delay, base_delay * 2 ** (attempt - 1))], which spreads
+        retries of many clients that failed at the same moment.
+        """
+        requested = retry_after(error)
+        if requested is not None:
+            return requested
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return rng.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Sustained requests per second
+            capacity: Burst size; defaults to one second's worth (at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens now, possibly going into debt
+
+        Returns:
+            float: Seconds the caller must wait before using them; waiting
+            callers queue up in reservation order instead of racing
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available; returns the seconds waited"""
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: float = 1) -> float:
+        """Async variant of acquire()"""
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """Fail fast while the upstream keeps failing"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+            clock: Monotonic time source
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._cooled_down():
+                return self.HALF_OPEN
+            return self._state
+
+    def _cooled_down(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_timeout
+
+    def _transition(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            count("llm_circuit_transitions", state=state)
+
+    def admit(self) -> Optional[bool]:
+        """
+        Admit a call upstream
+
+        Returns:
+            None if the call must fail fast, otherwise whether it is the single
+            half-open probe. A probe must end in record_success(),
+            record_failure() or, if it ended without an outcome (cancelled,
+            interrupted), release_probe()
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            if self._state == self.OPEN and self._cooled_down():
+                self._transition(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return None
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now; in half-open state only one may"""
+        return self.admit() is not None
+
+    def release_probe(self) -> None:
+        """Let another call probe after the current probe ended without an outcome"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(self.OPEN)
+
+
+class Resilience:
+    """Rate limit, circuit breaker and retry policy applied to upstream calls"""
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            retry: Retry policy; defaults to RetryPolicy()
+            limiter: Optional rate limiter shared by every call
+            breaker: Optional circuit breaker shared by every call
+            seed: Seed for backoff jitter (for reproducible tests)
+        """
+        self.retry = retry or RetryPolicy()
+        self.limiter = limiter
+        self.breaker = breaker
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_env(cls) -> "Resilience":
+        """
+        Build the policy from LLM_* environment variables
+
+        LLM_MAX_RETRIES (3), LLM_TIMEOUT_SECONDS (60, per attempt),
+        LLM_DEADLINE_SECONDS (180, per call), LLM_RATE_LIMIT_RPS (off),
+        LLM_RATE_LIMIT_BURST, LLM_BREAKER_FAILURES (5; 0 disables) and
+        LLM_BREAKER_RESET_SECONDS (30).
+        """
+        timeout = _env_number("LLM_TIMEOUT_SECONDS", 60.0, float)
+        deadline = _env_number("LLM_DEADLINE_SECONDS", 180.0, float)
+        rate = _env_number("LLM_RATE_LIMIT_RPS", None, float)
+        failures = _env_number("LLM_BREAKER_FAILURES", 5, int)
+        return cls(
+            retry=RetryPolicy(
+                max_attempts=_env_number("LLM_MAX_RETRIES", 3, int) + 1,
+                attempt_timeout=timeout if timeout > 0 else None,
+                deadline=deadline if deadline > 0 else None,
+            ),
+            limiter=(
+                TokenBucket(rate, _env_number("LLM_RATE_LIMIT_BURST", None, float))
+                if rate
+                else None
+            ),
+            breaker=(
+                CircuitBreaker(
+                    failures, _env_number("LLM_BREAKER_RESET_SECONDS", 30.0, float)
+                )
+                if failures > 0
+                else None
+            ),
+        )
+
+    def _remaining(self, started: float) -> Optional[float]:
+        if self.retry.deadline is None:
+            return None
+        return self.retry.deadline - (time.monotonic() - started)
+
+    def _attempt_timeout(self, started: float) -> Optional[float]:
+        remaining = self._remaining(started)
+        timeouts = [t for t in (self.retry.attempt_timeout, remaining) if t is not None]
+        return min(timeouts) if timeouts else None
+
+    def _before_attempt(self, started: float) -> bool:
+        """
+        Fail fast on an exhausted deadline or an open circuit
+
+        Returns:
+            bool: Whether the attempt holds the circuit breaker's half-open probe
+        """
+        remaining = self._remaining(started)
+        if remaining is not None and remaining <= 0:
+            count("llm_call_outcomes", outcome="deadline_exceeded")
+            raise DeadlineExceeded(f"deadline of {self.retry.deadline}s exceeded")
+        if self.breaker is None:
+            return False
+        probe = self.breaker.admit()
+        if probe is None:
+            count("llm_call_outcomes", outcome="circuit_open")
+            raise CircuitOpenError("circuit breaker is open; upstream is degraded")
+        return probe
+
+    def _after_failure(
+        self, error: BaseException, attempt: int, started: float
+    ) -> float:
+        """
+        Record a failed attempt
+
+        Returns:
+            float: Seconds to back off before retrying
+
+        Raises:
+            The error itself if it is not transient, UpstreamUnavailableError
+            if no attempt or time is left for a retry
+        """
+        retryable = is_retryable(error)
+        if self.breaker is not None:
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                # The upstream answered; the request itself was bad
+                self.breaker.record_success()
+        if not retryable:
+            count("llm_call_outcomes", outcome="rejected")
+            raise error
+        delay = self.retry.backoff(attempt, error, self._random)
+        remaining = self._remaining(started)
+        if attempt >= self.retry.max_attempts or (
+            remaining is not None and delay >= remaining
+        ):
+            count("llm_call_outcomes", outcome="exhausted")
+            raise UpstreamUnavailableError(
+                f"gave up after {attempt} attempt(s): {error}"
+            ) from error
+        reason = "timeout" if isinstance(error, TimeoutError) else "transient"
+        count("llm_retries", reason=reason, status=status_code(error) or "none")
+        return delay
+
+    def _after_success(self, attempt: int) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+        count("llm_call_outcomes", outcome="success" if attempt == 1 else "retried")
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Run fn under the rate limit, circuit breaker and retry policy
+
+        Args:
+            fn: Zero-argument function making one upstream request
+
+        Returns:
+            fn's result
+
+        Raises:
+            UpstreamUnavailableError: Retries, deadline or circuit exhausted
+            Exception: A non-transient error from fn, unchanged
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            # A probe that ends without an outcome (e.g. KeyboardInterrupt)
+            # is released, or the breaker would stay half-open forever
+            probe = self._before_attempt(started)
+            try:
+                if self.limiter is not None:
+                    count("llm_rate_limit_wait_seconds", self.limiter.acquire())
+                try:
+                    result = self._run_with_timeout(fn, self._attempt_timeout(started))
+                except Exception as e:
+                    probe = False
+                    delay = self._after_failure(e, attempt, started)
+                else:
+                    probe = False
+                    self._after_success(attempt)
+                    return result
+            finally:
+                if probe:
+                    self.breaker.release_probe()
+            time.sleep(delay)
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of call(); fn returns a fresh awaitable per attempt"""
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            # Cancellation is not an Exception: release the probe it held
+            probe = self._before_attempt(started)
+            try:
+                if self.limiter is not None:
+                    count("llm_rate_limit_wait_seconds", await self.limiter.aacquire())
+                timeout = self._attempt_timeout(started)
+                try:
+                    try:
+                        result = await asyncio.wait_for(fn(), timeout)
+                    except asyncio.TimeoutError:
+                        raise DeadlineExceeded(
+                            f"attempt timed out after {timeout:.1f}s"
+                        )
+                except Exception as e:
+                    probe = False
+                    delay = self._after_failure(e, attempt, started)
+                else:
+                    probe = False
+                    self._after_success(attempt)
+                    return result
+            finally:
+                if probe:
+                    self.breaker.release_probe()
+            await asyncio.sleep(delay)
+
+    def _run_with_timeout(self, fn: Callable[[], T], timeout: Optional[float]) -> T:
+        """
+        Run fn, giving up after ``timeout`` seconds
+
+        Blocking clients cannot be interrupted, so fn runs on a worker thread
+        and a hung call is abandoned there while the caller moves on.
+        """
+        if timeout is None:
+            return fn()
+        future = _worker_pool().submit(contextvars.copy_context().run, fn)
+        try:
+            return future.result(timeout=max(0.0, timeout))
+        except FutureTimeoutError:
+            future.cancel()
+            raise DeadlineExceeded(f"attempt timed out after {timeout:.1f}s") from None
+
+
+def _worker_pool() -> ThreadPoolExecutor:
+    global _deadline_executor
+    with _deadline_executor_lock:
+        if _deadline_executor is None:
+            _deadline_executor = ThreadPoolExecutor(
+                max_workers=DEADLINE_WORKERS, thread_name_prefix="llm-call"
+            )
+        return _deadline_executor
@@ -0,0 +1,175 @@
+"""Per-request model and output budget selection
+
+Every summary used to go to one model with a fixed 4096-token output limit.
+ModelRouter picks both from features that cost nothing to compute:
+
+- transcript tokens, distinct speakers and turns with commitment cues
+  decide between the small (fast, cheap) and the large model
+- the output budget is sized to the expected number of action items (one
+  per commitment turn) instead of the model maximum
+- escalate() gives the stronger route MeetingAgent retries with when the
+  first answer fails validate_meeting_summary
+
+Usage:
+    router = ModelRouter()
+    route = router.route(prompt)
+    text = llm_client.complete(prompt, model=route.model, max_tokens=route.max_tokens)
+"""
+
+import math
+import os
+from typing import NamedTuple, Optional
+
+from .chunking import SPEAKER_TURN_PATTERN, estimate_tokens
+from .classifier import COMMITMENT_PATTERN
+
+SMALL = "small"
+LARGE = "large"
+ESCALATED = "escalated"
+
+
+class TranscriptFeatures(NamedTuple):
+    """Cheap difficulty signals of a transcript"""
+
+    tokens: int
+    speakers: int
+    commitments: int
+
+
+class Route(NamedTuple):
+    """Model and output budget chosen for one request"""
+
+    model: str
+    max_tokens: int
+    tier: str
+
+
+def transcript_features(text: str) -> TranscriptFeatures:
+    """
+    Measure a transcript (or a prompt containing one) in a single pass
+
+    Args:
+        text: Transcript or prompt text
+
+    Returns:
+        TranscriptFeatures: Estimated tokens, distinct speaker labels and the
+        number of speaker turns containing a commitment cue
+    """
+    speakers = set()
+    commitments = 0
+    for line in text.splitlines():
+        match = SPEAKER_TURN_PATTERN.match(line)
+        if not match:
+            continue
+        speakers.add(match.group().strip()[:-1].strip().lower())
+        if COMMITMENT_PATTERN.search(line, match.end()):
+            commitments += 1
+    return TranscriptFeatures(estimate_tokens(text), len(speakers), commitments)
+
+
+class ModelRouter:
+    """Route summary requests by transcript size and difficulty"""
+
+    def __init__(
+        self,
+        small_model: str = "gpt-4o-mini",
+        large_model: str = "gpt-4o",
+        small_max_tokens_in: int = 4000,
+        small_max_speakers: int = 6,
+        small_max_commitments: int = 12,
+        base_output_tokens: int = 200,
+        tokens_per_item: int = 80,
+        headroom: float = 1.5,
+        min_output_tokens: int = 256,
+        max_output_tokens: int = 4096,
+    ):
+        """
+        Args:
+            small_model: Model for short, simple transcripts
+            large_model: Model for long or crowded transcripts and escalations
+            small_max_tokens_in: Largest transcript (tokens) for the small model
+            small_max_speakers: Most speakers for the small model
+            small_max_commitments: Most commitment turns for the small model
+            base_output_tokens: Output tokens for the title, agenda and JSON
+            tokens_per_item: Output tokens per expected action item
+            headroom: Multiplier on the estimate so long tasks are not cut off
+            min_output_tokens: Smallest output budget
+            max_output_tokens: Largest output budget (the model limit)
+        """
+        if not 0 < min_output_tokens <= max_output_tokens:
+            raise ValueError("need 0 < min_output_tokens <= max_output_tokens")
+        self.small_model = small_model
+        self.large_model = large_model
+        self.small_max_tokens_in = small_max_tokens_in
+        self.small_max_speakers = small_max_speakers
+        self.small_max_commitments = small_max_commitments
+        self.base_output_tokens = base_output_tokens
+        self.tokens_per_item = tokens_per_item
+        self.headroom = headroom
+        self.min_output_tokens = min_output_tokens
+        self.max_output_tokens = max_output_tokens
+
+    @classmethod
+    def from_env(cls) -> Optional["ModelRouter"]:
+        """
+        Router configured from LLM_SMALL_MODEL / LLM_LARGE_MODEL, or None when
+        LLM_ROUTING is 0/false/no
+        """
+        if os.getenv("LLM_ROUTING", "").strip().lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            small_model=os.getenv("LLM_SMALL_MODEL") or "gpt-4o-mini",
+            large_model=os.getenv("LLM_LARGE_MODEL") or "gpt-4o",
+        )
+
+    def output_budget(self, features: TranscriptFeatures) -> int:
+        """Output tokens for the expected number of action items"""
+        items = max(1, features.commitments)
+        estimate = (
+            self.base_output_tokens + self.tokens_per_item * items
+        ) * self.headroom
+        # Round up to a multiple of 64 so similar transcripts share a cache key
+        budget = int(math.ceil(estimate / 64) * 64)
+        return max(self.min_output_tokens, min(self.max_output_tokens, budget))
+
+    def route(self, text: str) -> Route:
+        """
+        Choose the model and output budget for a prompt
+
+        Args:
+            text: Prompt or transcript to summarize
+
+        Returns:
+            Route: The small model when the transcript is within every small
+            limit, otherwise the large model
+        """
+        features = transcript_features(text)
+        small = (
+            features.tokens <= self.small_max_tokens_in
+            and features.speakers <= self.small_max_speakers
+            and features.commitments <= self.small_max_commitments
+        )
+        return Route(
+            self.small_model if small else self.large_model,
+            self.output_budget(features),
+            SMALL if small else LARGE,
+        )
+
+    def escalate(self, route: Route) -> Optional[Route]:
+        """
+        Stronger route to retry with after an invalid answer
+
+        Args:
+            route: Route that produced the invalid answer
+
+        Returns:
+            Route or None: The large model with twice the budget, the full
+            budget if the large model was already used, or None if there is
+            nothing stronger left
+        """
+        if route.model != self.large_model:
+            budget = min(self.max_output_tokens, route.max_tokens * 2)
+            return Route(self.large_model, budget, ESCALATED)
+        if route.max_tokens < self.max_output_tokens:
+            return Route(self.large_model, self.max_output_tokens, ESCALATED)
+        return None
@@ -0,0 +1,223 @@
+"""Speaker index built in one scan of a transcript
+
+Owners in a summary are whatever string the model chose. SpeakerIndex ties
+them back to the transcript's speaker labels without another LLM call:
+
+- canonical("bob") / canonical("Alice Johnson") -> the label "Bob" / "Alice"
+- is_hallucinated("Zed") -> True when the owner is neither a speaker nor
+  mentioned anywhere in the transcript
+- action_item_counts(summary) -> action items per speaker
+
+The index records each speaker's turn offsets, how often they are mentioned
+by name in the conversation, and the aliases (lowercase label, unique name
+parts, initials) that resolve to them. SpeakerIndex.for_transcript caches the
+index by transcript hash so the agent and the judge share one scan; an index
+is read-only once built, so sharing it is safe.
+"""
+
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .chunking import NOT_SPECIFIED, SPEAKER_TURN_PATTERN
+
+# A word, keeping inner apostrophes (O'Brien) but not a possessive 's (Bob's)
+NAME_WORD_PATTERN = re.compile(r"([a-z0-9]+(?:'(?!s\b)[a-z]+)?)(?:'s\b)?")
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)")
+# Words that never identify a person on their own
+GENERIC_WORDS = frozenset(
+    "a an and or the of to for team lead mr mrs ms dr prof sir madam".split()
+)
+# Indexes kept by SpeakerIndex.for_transcript, least recently used dropped first
+INDEX_CACHE_SIZE = 64
+
+
+class Speaker(NamedTuple):
+    """One speaker label and what the scan learned about it"""
+
+    label: str
+    turn_offsets: Tuple[int, ...]
+    mentions: int
+    aliases: Tuple[str, ...]
+
+    @property
+    def turns(self) -> int:
+        return len(self.turn_offsets)
+
+
+def _words(text: str) -> List[str]:
+    text = text.lower().replace("\u2019", "'")
+    return NAME_WORD_PATTERN.findall(PARENTHETICAL_PATTERN.sub(" ", text))
+
+
+class SpeakerIndex:
+    """Speakers of one transcript and the owner strings that resolve to them"""
+
+    _cache: "OrderedDict[str, SpeakerIndex]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, transcript: str):
+        """
+        Args:
+            transcript: Raw transcript text; scanned once, line by line
+        """
+        offsets: Dict[str, List[int]] = {}
+        words: Counter = Counter()
+        position = 0
+        for line in transcript.splitlines(keepends=True):
+            match = SPEAKER_TURN_PATTERN.match(line)
+            text = line
+            if match:
+                label = match.group().strip()[:-1].strip()
+                offsets.setdefault(label, []).append(position)
+                text = line[match.end() :]
+            words.update(_words(text))
+            position += len(line)
+
+        self._words = words
+        lookup: Dict[str, str] = {}
+        aliases: Dict[str, List[str]] = {label: [] for label in offsets}
+
+        # Full labels first, then name parts and initials unique to one speaker
+        for label in offsets:
+            _add_alias(lookup, aliases, " ".join(_words(label)), label)
+        part_owners: Dict[str, set] = {}
+        for label in offsets:
+            parts = [w for w in _words(label) if w not in GENERIC_WORDS]
+            initials = "".join(w[0] for w in _words(label))
+            for part in parts + ([initials] if len(initials) > 1 else []):
+                part_owners.setdefault(part, set()).add(label)
+        for part, labels in part_owners.items():
+            if len(labels) == 1:
+                _add_alias(lookup, aliases, part, next(iter(labels)))
+
+        speakers: Dict[str, Speaker] = {}
+        for label, turn_offsets in offsets.items():
+            name_parts = [a for a in aliases[label] if " " not in a]
+            mentions = max((words[a] for a in name_parts), default=0)
+            speakers[label] = Speaker(
+                label, tuple(turn_offsets), mentions, tuple(sorted(aliases[label]))
+            )
+        self._lookup: Mapping[str, str] = MappingProxyType(lookup)
+        self.speakers: Mapping[str, Speaker] = MappingProxyType(speakers)
+
+    @classmethod
+    def for_transcript(cls, transcript: str) -> "SpeakerIndex":
+        """
+        Shared index of a transcript, built on first use
+
+        Indexes are kept by the transcript's SHA-256, so the cache holds
+        digests rather than the transcripts themselves.
+        """
+        key = hashlib.sha256(transcript.encode()).hexdigest()
+        with cls._cache_lock:
+            index = cls._cache.get(key)
+            if index is not None:
+                cls._cache.move_to_end(key)
+                return index
+        index = cls(transcript)
+        with cls._cache_lock:
+            index = cls._cache.setdefault(key, index)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > INDEX_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every index kept by for_transcript"""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def canonical(self, owner: Any) -> Optional[str]:
+        """
+        Speaker label an owner string refers to
+
+        Args:
+            owner: Owner as written by the model
+
+        Returns:
+            str or None: The transcript's speaker label, or None if the owner
+            does not name exactly one speaker
+        """
+        if not isinstance(owner, str):
+            return None
+        words = _words(owner)
+        label = self._lookup.get(" ".join(words))
+        if label is not None:
+            return label
+        matches = {self._lookup[w] for w in words if w in self._lookup}
+        return matches.pop() if len(matches) == 1 else None
+
+    def is_hallucinated(self, owner: Any) -> bool:
+        """Whether an owner is neither a speaker nor mentioned in the transcript"""
+        if not isinstance(owner, str) or owner.strip().lower() == NOT_SPECIFIED:
+            return False
+        if self.canonical(owner) is not None:
+            return False
+        names = [w for w in _words(owner) if w not in GENERIC_WORDS]
+        return bool(names) and not any(self._words[w] for w in names)
+
+    def canonicalize_owners(self, summary: Dict[str, Any]) -> List[str]:
+        """
+        Rewrite owners that refer to a speaker to that speaker's label
+
+        Args:
+            summary: Summary to update in place
+
+        Returns:
+            list: Owners that do not occur in the transcript at all
+        """
+        hallucinated: List[str] = []
+        for item in _items(summary):
+            owner = item.get("owner")
+            label = self.canonical(owner)
+            if label is not None:
+                item["owner"] = label
+            elif self.is_hallucinated(owner):
+                hallucinated.append(owner)
+        return hallucinated
+
+    def action_item_counts(self, summary: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Action items per speaker label
+
+        Owners that are not a speaker are counted under their own text, so
+        the counts always add up to the number of action items.
+        """
+        counts: Dict[str, int] = {label: 0 for label in self.speakers}
+        for item in _items(summary):
+            owner = item.get("owner")
+            key = self.canonical(owner) or str(owner)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Turns, mentions and aliases per speaker"""
+        return {
+            label: {
+                "turns": speaker.turns,
+                "first_offset": speaker.turn_offsets[0],
+                "mentions": speaker.mentions,
+                "aliases": list(speaker.aliases),
+            }
+            for label, speaker in self.speakers.items()
+        }
+
+
+def _add_alias(
+    lookup: Dict[str, str], aliases: Dict[str, List[str]], alias: str, label: str
+) -> None:
+    if alias and alias not in lookup:
+        lookup[alias] = label
+        aliases[label].append(alias)
+
+
+def _items(summary: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    items = summary.get("action_items") if isinstance(summary, dict) else None
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
@@ -0,0 +1,471 @@
+"""Persistent cross-meeting store of summaries and action items
+
+Summaries are appended to a local SQLite database as they are produced, and
+action items are indexed so questions such as "what does Lisa owe this
+week?" are answered without re-running the LLM over old transcripts:
+
+- ``meetings`` is the append-only log: one row per ingested summary, never
+  updated; re-ingesting the same meeting is a no-op
+- ``items`` holds one row per action item, indexed by owner, due date and
+  meeting; relative deadlines are resolved against the meeting time with
+  DeadlineResolver so they can be range-queried
+- ``terms`` is an inverted index of task words for keyword queries
+
+Usage:
+    python -m src.store --owner Lisa --due-from 2024-03-11 --due-to 2024-03-17
+    python -m src.store --text "login fix"
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .deadlines import DeadlineResolver
+from .models import MeetingSummary, SummaryError
+
+# Longest interval DeadlineResolver produces ("this month" / "next month")
+MAX_DUE_SPAN_DAYS = 31
+TERM_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_TERMS = frozenset(
+    "a an the of to for on in at by and or it is be will with from this that".split()
+)
+
+
+def _default_store_path() -> str:
+    """Default database path (kept next to the LLM cache)"""
+    return os.path.join(os.getcwd(), ".pytest_cache", "action_items.sqlite3")
+
+
+def _terms(text: str) -> List[str]:
+    return sorted(
+        {t for t in TERM_PATTERN.findall(text.lower()) if t not in STOP_TERMS}
+    )
+
+
+def owner_key(owner: str) -> str:
+    """Case- and punctuation-insensitive form of an owner name"""
+    return " ".join(TERM_PATTERN.findall(owner.lower()))
+
+
+class StoredItem(NamedTuple):
+    """An action item as stored, with its meeting and resolved due dates"""
+
+    id: int
+    meeting_id: int
+    meeting_title: str
+    held_at: str
+    task: str
+    owner: str
+    deadline: str
+    due_start: Optional[str]
+    due_end: Optional[str]
+
+
+class ActionItemStore:
+    """SQLite-backed, append-only store of summaries with action item indexes"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        deadline_resolver: Optional[DeadlineResolver] = None,
+    ):
+        """
+        Args:
+            path: Database file; ":memory:" for a throwaway store
+            deadline_resolver: Resolver for relative deadlines; defaults to
+                DeadlineResolver()
+        """
+        self.path = path or _default_store_path()
+        self.deadline_resolver = deadline_resolver or DeadlineResolver()
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    @classmethod
+    def from_env(cls) -> "ActionItemStore":
+        """Build a store at ACTION_ITEM_STORE_PATH, or the default path"""
+        return cls(path=os.getenv("ACTION_ITEM_STORE_PATH") or None)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meetings (
+                id INTEGER PRIMARY KEY,
+                meeting_key TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                agenda TEXT NOT NULL,
+                held_at TEXT NOT NULL,
+                ingested_at REAL NOT NULL,
+                summary TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                meeting_id INTEGER NOT NULL REFERENCES meetings (id),
+                task TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                owner_key TEXT NOT NULL,
+                deadline TEXT NOT NULL,
+                due_start TEXT,
+                due_end TEXT
+            );
+            CREATE INDEX IF NOT EXISTS items_owner_due
+                ON items (owner_key, due_start);
+            CREATE INDEX IF NOT EXISTS items_due ON items (due_start, due_end);
+            CREATE INDEX IF NOT EXISTS items_meeting ON items (meeting_id);
+            CREATE TABLE IF NOT EXISTS terms (
+                term TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                PRIMARY KEY (term, item_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS term_counts (
+                term TEXT PRIMARY KEY,
+                items INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def ingest(
+        self,
+        summary: Any,
+        transcript: Optional[str] = None,
+        meeting_key: Optional[str] = None,
+        held_at: Optional[Union[date, datetime, str]] = None,
+    ) -> Optional[int]:
+        """
+        Append one summary and index its action items
+
+        Args:
+            summary: Summary dict from the agent, or a src.models summary
+                (already validated, so it is ingested without re-checking)
+            transcript: Source transcript; its hash identifies the meeting
+                when meeting_key is not given
+            meeting_key: Caller-chosen meeting identity
+            held_at: When the meeting took place; defaults to now
+
+        Returns:
+            int or None: Meeting row id, or None for error summaries; an
+            already ingested meeting returns its existing id
+        """
+        ids = self.ingest_many([(summary, transcript, meeting_key, held_at)])
+        return ids[0]
+
+    def ingest_many(
+        self,
+        entries: Iterable[
+            Tuple[
+                Any, Optional[str], Optional[str], Optional[Union[date, datetime, str]]
+            ]
+        ],
+    ) -> List[Optional[int]]:
+        """
+        Append many summaries in one transaction
+
+        Args:
+            entries: (summary, transcript, meeting_key, held_at) tuples, with
+                the same meaning as ingest()'s arguments
+
+        Returns:
+            list: Meeting row id (or None) per entry
+        """
+        rows = [self._prepare(*entry) for entry in entries]
+        ids: List[Optional[int]] = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                postings: List[Tuple[str, int]] = []
+                term_counts: Counter = Counter()
+                for row in rows:
+                    if row is None:
+                        ids.append(None)
+                    else:
+                        ids.append(self._insert(row, postings, term_counts))
+                # Index terms once per batch rather than once per item
+                self._conn.executemany(
+                    "INSERT INTO terms (term, item_id) VALUES (?, ?)", postings
+                )
+                self._conn.executemany(
+                    """
+                    INSERT INTO term_counts (term, items) VALUES (?, ?)
+                    ON CONFLICT (term) DO UPDATE SET items = items + excluded.items
+                    """,
+                    term_counts.items(),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return ids
+
+    def _prepare(self, summary, transcript, meeting_key, held_at):
+        """Resolve everything an insert needs outside the write lock"""
+        if isinstance(summary, SummaryError):
+            return None
+        if isinstance(summary, MeetingSummary):
+            # Validated at construction: no per-field checks or dict round trip
+            title, agenda = summary.meeting_title, summary.agenda
+            fields = [(i.task, i.owner, i.deadline) for i in summary.action_items]
+            serialized = summary.to_json()
+        elif isinstance(summary, dict) and isinstance(
+            summary.get("action_items"), list
+        ):
+            title = str(summary.get("meeting_title", ""))
+            agenda = str(summary.get("agenda", ""))
+            fields = [
+                (
+                    str(item.get("task", "")),
+                    str(item.get("owner", "")),
+                    str(item.get("deadline", "")),
+                )
+                for item in summary["action_items"]
+                if isinstance(item, dict)
+            ]
+            serialized = json.dumps(summary, sort_keys=True)
+        else:
+            return None
+        if meeting_key is None:
+            source = transcript
+            if source is None:
+                # A summary has one identity whether ingested as dict or model
+                if isinstance(summary, MeetingSummary):
+                    summary = summary.to_dict()
+                source = json.dumps(summary, sort_keys=True)
+            meeting_key = hashlib.sha256(source.encode()).hexdigest()
+        if held_at is None:
+            held_at = datetime.now()
+        if isinstance(held_at, str):
+            held_at = datetime.fromisoformat(held_at)
+
+        items = []
+        for task, owner, deadline in fields:
+            resolved = self.deadline_resolver.resolve(deadline, held_at)
+            due = (
+                (resolved.start.isoformat(), resolved.end.isoformat())
+                if resolved is not None
+                else (None, None)
+            )
+            items.append((task, owner, owner_key(owner), deadline, *due, _terms(task)))
+        return (
+            meeting_key,
+            title,
+            agenda,
+            held_at.isoformat(),
+            serialized,
+            items,
+        )
+
+    def _insert(
+        self, row, postings: List[Tuple[str, int]], term_counts: Counter
+    ) -> int:
+        meeting_key, title, agenda, held_at, serialized, items = row
+        existing = self._conn.execute(
+            "SELECT id FROM meetings WHERE meeting_key = ?", (meeting_key,)
+        ).fetchone()
+        if existing is not None:
+            return existing[0]
+        meeting_id = self._conn.execute(
+            """
+            INSERT INTO meetings
+                (meeting_key, title, agenda, held_at, ingested_at, summary)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (meeting_key, title, agenda, held_at, time.time(), serialized),
+        ).lastrowid
+        for task, owner, key, deadline, due_start, due_end, terms in items:
+            item_id = self._conn.execute(
+                """
+                INSERT INTO items (meeting_id, task, owner, owner_key, deadline,
+                                   due_start, due_end)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (meeting_id, task, owner, key, deadline, due_start, due_end),
+            ).lastrowid
+            postings.extend((term, item_id) for term in terms)
+            term_counts.update(terms)
+        return meeting_id
+
+    def query(
+        self,
+        owner: Optional[str] = None,
+        due_from: Optional[Union[date, str]] = None,
+        due_to: Optional[Union[date, str]] = None,
+        meeting_id: Optional[int] = None,
+        text: Optional[str] = None,
+        include_undated: bool = False,
+        limit: Optional[int] = 100,
+    ) -> List[StoredItem]:
+        """
+        Find action items; all given filters must match
+
+        Args:
+            owner: Owner name, matched case-insensitively
+            due_from: Items due on or after this date (ISO string or date)
+            due_to: Items due on or before this date; ranges such as "next
+                week" match when they overlap [due_from, due_to]
+            meeting_id: Items of one meeting
+            text: Words that must all appear in the task
+            include_undated: With a date filter, also return items whose
+                deadline could not be resolved
+            limit: Maximum rows, soonest due first; None for all
+
+        Returns:
+            list: Matching StoredItem rows
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if owner is not None:
+            clauses.append("i.owner_key = ?")
+            params.append(owner_key(owner))
+        if meeting_id is not None:
+            clauses.append("i.meeting_id = ?")
+            params.append(meeting_id)
+        dated: List[str] = []
+        if due_to is not None:
+            dated.append("i.due_start <= ?")
+            params.append(_day_end(due_to))
+        if due_from is not None:
+            # The start bound lets the due-date index skip items that ended
+            # long before the window; no resolved range is longer than this
+            earliest = _as_date(due_from) - timedelta(days=MAX_DUE_SPAN_DAYS)
+            dated.append("i.due_start >= ? AND i.due_end >= ?")
+            params.extend([earliest.isoformat(), _as_iso(due_from)])
+        if dated:
+            condition = " AND ".join(dated)
+            if include_undated:
+                condition = f"(({condition}) OR i.due_start IS NULL)"
+            clauses.append(condition)
+        if text is not None:
+            terms = _terms(text)
+            if not terms:
+                return []
+            terms = self._rarest_first(terms)
+            if terms is None:
+                return []
+            # Walk the rarest term's postings; probe the others by primary key
+            probes = "".join(
+                f" AND EXISTS (SELECT 1 FROM terms t{n} WHERE t{n}.term = ?"
+                f" AND t{n}.item_id = t0.item_id)"
+                for n in range(1, len(terms))
+            )
+            clauses.append(
+                f"i.id IN (SELECT t0.item_id FROM terms t0 WHERE t0.term = ?{probes})"
+            )
+            params.extend(terms)
+
+        sql = """
+            SELECT i.id, i.meeting_id, m.title, m.held_at, i.task, i.owner,
+                   i.deadline, i.due_start, i.due_end
+            FROM items i JOIN meetings m ON m.id = i.meeting_id
+        """
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY i.due_start IS NULL, i.due_start, i.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [StoredItem(*row) for row in rows]
+
+    def _rarest_first(self, terms: List[str]) -> Optional[List[str]]:
+        """Terms ordered by how few items contain them; None if one never occurs"""
+        marks = ", ".join("?" for _ in terms)
+        with self._lock:
+            counts = dict(
+                self._conn.execute(
+                    f"SELECT term, items FROM term_counts WHERE term IN ({marks})",
+                    terms,
+                ).fetchall()
+            )
+        if len(counts) < len(terms):
+            return None
+        return sorted(terms, key=counts.__getitem__)
+
+    def meeting(self, meeting_id: int) -> Optional[Dict[str, Any]]:
+        """The summary of an ingested meeting, as it was ingested"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM meetings WHERE id = ?", (meeting_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def owner_counts(self) -> Dict[str, int]:
+        """Number of action items per owner"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT MIN(owner), COUNT(*) FROM items GROUP BY owner_key "
+                "ORDER BY COUNT(*) DESC"
+            ).fetchall()
+        return dict(rows)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            meetings = self._conn.execute("SELECT COUNT(*) FROM meetings").fetchone()
+            items, dated = self._conn.execute(
+                "SELECT COUNT(*), COUNT(due_start) FROM items"
+            ).fetchone()
+        return {"meetings": meetings[0], "items": items, "dated_items": dated}
+
+
+def _as_iso(value: Union[date, str]) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def _as_date(value: Union[date, str]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _day_end(value: Union[date, str]) -> str:
+    """Upper bound covering every time on the given day"""
+    text = _as_iso(value)
+    return f"{text}T23:59:59" if len(text) == 10 else text
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the action item store")
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--owner")
+    parser.add_argument("--due-from")
+    parser.add_argument("--due-to")
+    parser.add_argument("--text")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    store = ActionItemStore(path=args.path)
+    for item in store.query(
+        owner=args.owner,
+        due_from=args.due_from,
+        due_to=args.due_to,
+        text=args.text,
+        limit=args.limit,
+    ):
+        print(
+            f"{item.due_start or '-':<20} {item.owner:<16} {item.task}"
+            f"  ({item.deadline}; {item.meeting_title})"
+        )
+    print(json.dumps(store.stats()))
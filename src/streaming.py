@@ -0,0 +1,153 @@
+"""Incremental parsing of a meeting summary while its JSON is still arriving
+
+A streamed completion arrives a few characters at a time. SummaryStreamParser
+scans each chunk once, tracking string/escape state and nesting depth, and
+emits an event as soon as a top-level field or one ``action_items`` entry is
+complete, so a UI can show the title and the first action items long before
+the closing brace arrives.
+
+Usage:
+    parser = SummaryStreamParser()
+    for chunk in llm_client.stream_complete(prompt):
+        for event in parser.feed(chunk):
+            show(event.field, event.value)
+    summary = parser.result()
+"""
+
+import json
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .helpers import extract_json_object
+
+ACTION_ITEMS = "action_items"
+# Field of the event carrying the final summary in MeetingAgent.stream_summary
+SUMMARY = "summary"
+
+
+class StreamEvent(NamedTuple):
+    """A completed part of the summary
+
+    ``field`` is a top-level key of the summary object. Each action item is
+    its own event with field "action_items" and the item dict as value; the
+    array as a whole is not reported again.
+    """
+
+    field: str
+    value: Any
+
+
+class SummaryStreamParser:
+    """Emit summary fields and action items as soon as their JSON closes"""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._done = False
+        # Top-level object state: the key being read or whose value follows
+        self._expect_key = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return self._text
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """
+        Consume the next piece of the response
+
+        Args:
+            chunk: Text appended to the response (any size, may split tokens)
+
+        Returns:
+            list: StreamEvents completed by this chunk, in order
+        """
+        self._text += chunk
+        events: List[StreamEvent] = []
+        text = self._text
+        for pos in range(self._pos, len(text)):
+            if self._done:
+                break
+            char = text[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(text[self._key_start : pos + 1])
+                        self._key_start = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_start = pos
+                    self._expect_key = False
+            elif char in "{[":
+                if self._depth == 0 and char != "{":
+                    continue
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+                elif self._depth == 3 and char == "{" and self._key == ACTION_ITEMS:
+                    self._item_start = pos
+            elif char in "}]":
+                if self._depth == 0:
+                    continue
+                if self._depth == 1:
+                    self._end_value(pos, events)
+                    self._done = True
+                elif self._depth == 3 and self._item_start is not None:
+                    self._emit_item(text[self._item_start : pos + 1], events)
+                    self._item_start = None
+                self._depth -= 1
+            elif self._depth == 1:
+                if char == ":":
+                    self._value_start = pos + 1
+                elif char == ",":
+                    self._end_value(pos, events)
+                    self._expect_key = True
+        self._pos = len(text)
+        return events
+
+    def _end_value(self, end: int, events: List[StreamEvent]) -> None:
+        """Report the top-level value that ends before ``end``"""
+        if self._value_start is None or self._key is None:
+            return
+        raw = self._text[self._value_start : end]
+        self._value_start = None
+        if self._key == ACTION_ITEMS:
+            return
+        try:
+            events.append(StreamEvent(self._key, json.loads(raw)))
+        except json.JSONDecodeError:
+            pass
+
+    def _emit_item(self, raw: str, events: List[StreamEvent]) -> None:
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        events.append(StreamEvent(ACTION_ITEMS, item))
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Parse the complete response
+
+        Returns:
+            dict: The summary object, parsed the same way as a non-streamed
+            response
+
+        Raises:
+            json.JSONDecodeError: If the response holds no JSON object
+        """
+        return extract_json_object(self._text)
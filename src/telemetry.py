@@ -0,0 +1,442 @@
+"""Per-stage timing spans and counters for the agent, LLM client and judge
+
+Telemetry is off by default. Enable it with MEETING_TELEMETRY=1 (or call
+enable()); while disabled, span() returns a shared no-op context manager and
+count() returns immediately, so instrumented code pays only a function call.
+
+Recorded data can be exported as Prometheus text exposition format
+(to_prometheus / write_prometheus) or as OpenTelemetry OTLP/JSON
+(to_otel_json / write_otel_json). Setting MEETING_TELEMETRY_EXPORT to a path
+ending in ``.json`` or ``.prom`` writes that export when the process exits.
+
+Example:
+    with span("llm.request", model="gpt-4o-mini") as s:
+        text = backend.complete(prompt)
+        s.set("completion_chars", len(text))
+    count("llm_cache_requests", outcome="miss")
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .chunking import estimate_tokens
+
+SERVICE_NAME = "meeting-summarizer"
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_FINISHED_SPANS = 10_000
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class _NoopSpan:
+    """Span returned while telemetry is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed stage; use as a context manager and attach attributes with set()"""
+
+    __slots__ = (
+        "telemetry",
+        "name",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "duration_ns",
+        "error",
+        "_started",
+        "_token",
+    )
+
+    def __init__(self, telemetry: "Telemetry", name: str, attributes: Dict[str, Any]):
+        self.telemetry = telemetry
+        self.name = name
+        self.attributes = attributes
+        self.parent_id: Optional[str] = None
+        self.trace_id = ""
+        self.span_id = os.urandom(8).hex()
+        self.start_ns = 0
+        self.duration_ns = 0
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span"""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None:
+            self.trace_id, self.parent_id = parent.trace_id, parent.span_id
+        else:
+            self.trace_id = os.urandom(16).hex()
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_ns = time.perf_counter_ns() - self._started
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _current_span.reset(self._token)
+        self.telemetry._finish(self)
+        return False
+
+
+class _Histogram:
+    """Duration distribution of one stage"""
+
+    __slots__ = ("count", "total", "buckets", "errors")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool) -> None:
+        self.count += 1
+        self.total += seconds
+        self.errors += error
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Telemetry:
+    """Collects stage durations, counters and finished spans in memory"""
+
+    def __init__(self, enabled: bool = False, max_spans: int = MAX_FINISHED_SPANS):
+        """
+        Args:
+            enabled: Record data; when False all calls are no-ops
+            max_spans: Finished spans kept for OTel export (oldest are dropped)
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Time a stage
+
+        Args:
+            name: Stage name, e.g. "agent.summarize_meeting"
+            **attributes: Attributes recorded on the span
+
+        Returns:
+            Context manager yielding the span (a no-op span when disabled)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attributes)
+
+    def count(self, name: str, value: float = 1, **labels: Any) -> None:
+        """
+        Add to a counter
+
+        Args:
+            name: Counter name without the ``_total`` suffix
+            value: Amount to add
+            **labels: Label values identifying the series
+        """
+        if not self.enabled:
+            return
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            stage = self._stages.get(span.name)
+            if stage is None:
+                stage = self._stages[span.name] = _Histogram()
+            stage.observe(span.duration_ns / 1e9, span.error is not None)
+            self._spans.append(span)
+
+    def reset(self) -> None:
+        """Drop everything recorded so far"""
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+            self._spans.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize what has been recorded
+
+        Returns:
+            dict: Per-stage count/total/mean seconds and counter values
+        """
+        with self._lock:
+            stages = {
+                name: {
+                    "count": h.count,
+                    "total_seconds": h.total,
+                    "mean_seconds": h.total / h.count if h.count else 0.0,
+                    "errors": h.errors,
+                }
+                for name, h in self._stages.items()
+            }
+            counters = {
+                name: {
+                    _format_labels(key) or "": value for key, value in series.items()
+                }
+                for name, series in self._counters.items()
+            }
+        return {"stages": stages, "counters": counters}
+
+    def to_prometheus(self, prefix: str = "meeting") -> str:
+        """
+        Render recorded data in Prometheus text exposition format
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            str: Exposition text
+        """
+        metric = f"{prefix}_stage_duration_seconds"
+        lines = [
+            f"# HELP {metric} Duration of instrumented stages",
+            f"# TYPE {metric} histogram",
+        ]
+        with self._lock:
+            for name, h in sorted(self._stages.items()):
+                stage = _escape(name)
+                for bound, hits in zip(DURATION_BUCKETS, h.buckets):
+                    lines.append(
+                        f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {hits}'
+                    )
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {h.total:.9f}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {h.count}')
+
+            errors = f"{prefix}_stage_errors_total"
+            lines += [f"# TYPE {errors} counter"]
+            for name, h in sorted(self._stages.items()):
+                lines.append(f'{errors}{{stage="{_escape(name)}"}} {h.errors}')
+
+            for name, series in sorted(self._counters.items()):
+                counter = f"{prefix}_{name}_total"
+                lines.append(f"# TYPE {counter} counter")
+                for key, value in sorted(series.items()):
+                    labels = _format_labels(key)
+                    lines.append(f"{counter}{{{labels}}} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def to_otel_json(self) -> Dict[str, Any]:
+        """
+        Render recorded spans and counters as OTLP/JSON
+
+        Returns:
+            dict: Object with ``resourceSpans`` and ``resourceMetrics``
+        """
+        resource = {
+            "attributes": [_otel_attribute("service.name", SERVICE_NAME)],
+        }
+        scope = {"name": __name__}
+        now = time.time_ns()
+        with self._lock:
+            spans = [_otel_span(span) for span in self._spans]
+            metrics = [
+                {
+                    "name": name,
+                    "sum": {
+                        "aggregationTemporality": 2,
+                        "isMonotonic": True,
+                        "dataPoints": [
+                            {
+                                "asDouble": value,
+                                "timeUnixNano": str(now),
+                                "attributes": [_otel_attribute(k, v) for k, v in key],
+                            }
+                            for key, value in series.items()
+                        ],
+                    },
+                }
+                for name, series in self._counters.items()
+            ]
+        return {
+            "resourceSpans": [
+                {"resource": resource, "scopeSpans": [{"scope": scope, "spans": spans}]}
+            ],
+            "resourceMetrics": [
+                {
+                    "resource": resource,
+                    "scopeMetrics": [{"scope": scope, "metrics": metrics}],
+                }
+            ],
+        }
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the Prometheus export to a file (e.g. for node_exporter textfile)"""
+        _atomic_write(path, self.to_prometheus())
+
+    def write_otel_json(self, path: str) -> None:
+        """Write the OTLP/JSON export to a file"""
+        _atomic_write(path, json.dumps(self.to_otel_json()))
+
+    def export(self, path: str) -> None:
+        """Write the export matching the file extension (.json or Prometheus text)"""
+        if path.endswith(".json"):
+            self.write_otel_json(path)
+        else:
+            self.write_prometheus(path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey) -> str:
+    return ",".join(f'{k}="{_escape(v)}"' for k, v in key)
+
+
+def _otel_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otel_span(span: Span) -> Dict[str, Any]:
+    record = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.start_ns + span.duration_ns),
+        "attributes": [_otel_attribute(k, v) for k, v in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        record["parentSpanId"] = span.parent_id
+    return record
+
+
+def _atomic_write(path: str, content: str) -> None:
+    """Write via a temp file so scrapers never read a partial export"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+_telemetry = Telemetry(
+    enabled=os.getenv("MEETING_TELEMETRY", "").strip().lower() in ("1", "true", "yes")
+)
+
+
+def get_telemetry() -> Telemetry:
+    """Get the process-wide telemetry collector"""
+    return _telemetry
+
+
+def span(name: str, **attributes: Any):
+    """Time a stage on the process-wide collector (see Telemetry.span)"""
+    if not _telemetry.enabled:
+        return _NOOP_SPAN
+    return Span(_telemetry, name, attributes)
+
+
+def count(name: str, value: float = 1, **labels: Any) -> None:
+    """Add to a counter on the process-wide collector (see Telemetry.count)"""
+    if _telemetry.enabled:
+        _telemetry.count(name, value, **labels)
+
+
+def record_token_usage(
+    model: str,
+    prompt: str,
+    completion: str,
+    usage: Optional[Dict[str, Any]] = None,
+    system: Optional[str] = None,
+) -> None:
+    """
+    Count prompt and completion tokens of one upstream request
+
+    Args:
+        model: Model that served the request
+        prompt: Prompt (user message) text sent
+        completion: Completion text received
+        usage: Provider-reported ``prompt_tokens``/``completion_tokens`` and
+            optionally ``cached_prompt_tokens``; token counts are estimated
+            from the text when absent
+        system: System message sent ahead of the prompt, if any
+    """
+    if not _telemetry.enabled:
+        return
+    if usage and "prompt_tokens" in usage:
+        prompt_tokens = usage["prompt_tokens"]
+        completion_tokens = usage.get("completion_tokens") or 0
+        source = "usage"
+        if usage.get("cached_prompt_tokens") is not None:
+            _telemetry.count(
+                "llm_cached_prompt_tokens", usage["cached_prompt_tokens"], model=model
+            )
+    else:
+        prompt_tokens = estimate_tokens(prompt)
+        if system:
+            prompt_tokens += estimate_tokens(system)
+        completion_tokens = estimate_tokens(completion)
+        source = "estimate"
+    _telemetry.count("llm_prompt_tokens", prompt_tokens, model=model, source=source)
+    _telemetry.count(
+        "llm_completion_tokens", completion_tokens, model=model, source=source
+    )
+
+
+def enable() -> None:
+    """Start recording on the process-wide collector"""
+    _telemetry.enabled = True
+
+
+def disable() -> None:
+    """Stop recording on the process-wide collector"""
+    _telemetry.enabled = False
+
+
+def enabled() -> bool:
+    """Whether the process-wide collector is recording"""
+    return _telemetry.enabled
+
+
+_export_path = os.getenv("MEETING_TELEMETRY_EXPORT")
+if _export_path:
+    atexit.register(_telemetry.export, _export_path)
@@ -0,0 +1,313 @@
+"""Bulk validation of meeting summaries with per-record failure reasons
+
+validate_meeting_summary answers one dict at a time with True/False. This
+module re-validates large batches, e.g. archived summaries after a schema
+change:
+
+- SummaryValidator compiles the schema into frozen key sets and a fixed
+  check order once; valid records take a single fast pass and only invalid
+  ones are walked again to collect every reason
+- validate_many / validate_jsonl stream results for an iterable of dicts or
+  a JSON Lines file, optionally split across worker processes (JSON Lines
+  workers receive raw lines, so parsing is parallelized too)
+
+Verdicts match validate_meeting_summary exactly.
+
+Usage:
+    python -m src.validation summaries.jsonl --workers 8
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .helpers import SUMMARY_ERROR_CODES
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+class ValidationResult(NamedTuple):
+    """Verdict for one record; index is 0-based, line numbers are index + 1"""
+
+    index: int
+    valid: bool
+    reasons: Tuple[str, ...]
+
+
+class SummaryValidator:
+    """Meeting summary checks compiled once and reused for every record"""
+
+    def __init__(
+        self,
+        summary_fields: Iterable[str] = ("meeting_title", "agenda"),
+        item_fields: Iterable[str] = ("task", "owner", "deadline"),
+        error_codes: Iterable[str] = SUMMARY_ERROR_CODES,
+    ):
+        """
+        Args:
+            summary_fields: Top-level fields that must be non-empty strings
+            item_fields: Action item fields that must be non-empty strings
+            error_codes: Allowed values of an error response's ``error``
+        """
+        self.summary_fields = tuple(summary_fields)
+        self.item_fields = tuple(item_fields)
+        self.error_codes = frozenset(error_codes)
+        self._required = frozenset(self.summary_fields) | {"action_items"}
+        self._item_required = frozenset(self.item_fields)
+
+    def is_valid(self, summary: Any) -> bool:
+        """Same verdict as validate_meeting_summary, without reasons"""
+        if not isinstance(summary, dict):
+            return False
+        if "error" in summary:
+            error = summary["error"]
+            return (
+                len(summary) == 1
+                and isinstance(error, str)
+                and error in self.error_codes
+            )
+        if not summary.keys() >= self._required:
+            return False
+        for field in self.summary_fields:
+            value = summary[field]
+            if not isinstance(value, str) or not value or value.isspace():
+                return False
+        items = summary["action_items"]
+        if not isinstance(items, list):
+            return False
+        item_required = self._item_required
+        item_fields = self.item_fields
+        for item in items:
+            if not isinstance(item, dict) or not item.keys() >= item_required:
+                return False
+            for field in item_fields:
+                value = item[field]
+                if not isinstance(value, str) or not value or value.isspace():
+                    return False
+        return True
+
+    def explain(self, summary: Any) -> List[str]:
+        """
+        Every reason a summary is invalid
+
+        Args:
+            summary: Parsed summary
+
+        Returns:
+            list: Human-readable reasons; empty if the summary is valid
+        """
+        if self.is_valid(summary):
+            return []
+        if not isinstance(summary, dict):
+            return [f"summary must be an object, got {type(summary).__name__}"]
+
+        reasons: List[str] = []
+        if "error" in summary:
+            error = summary["error"]
+            if not isinstance(error, str) or error not in self.error_codes:
+                reasons.append(
+                    f"error must be one of {', '.join(sorted(self.error_codes))}, "
+                    f"got {error!r}"
+                )
+            extra = sorted(key for key in summary if key != "error")
+            if extra:
+                reasons.append(
+                    f"error response has unexpected keys: {', '.join(extra)}"
+                )
+            return reasons
+
+        for key in sorted(self._required - summary.keys()):
+            reasons.append(f"missing key: {key}")
+        for field in self.summary_fields:
+            if field in summary and not _non_empty_string(summary[field]):
+                reasons.append(f"{field} must be a non-empty string")
+
+        items = summary.get("action_items")
+        if "action_items" in summary and not isinstance(items, list):
+            reasons.append("action_items must be a list")
+        elif isinstance(items, list):
+            for position, item in enumerate(items):
+                prefix = f"action_items[{position}]"
+                if not isinstance(item, dict):
+                    reasons.append(f"{prefix} must be an object")
+                    continue
+                for key in sorted(self._item_required - item.keys()):
+                    reasons.append(f"{prefix} missing key: {key}")
+                for field in self.item_fields:
+                    if field in item and not _non_empty_string(item[field]):
+                        reasons.append(f"{prefix}.{field} must be a non-empty string")
+        return reasons
+
+    def check(self, index: int, summary: Any) -> ValidationResult:
+        """Validate one record into a ValidationResult"""
+        if self.is_valid(summary):
+            return ValidationResult(index, True, ())
+        return ValidationResult(index, False, tuple(self.explain(summary)))
+
+    def check_line(self, index: int, line: str) -> ValidationResult:
+        """Parse and validate one JSON Lines record"""
+        try:
+            summary = json.loads(line)
+        except json.JSONDecodeError as e:
+            return ValidationResult(index, False, (f"invalid JSON: {e.msg}",))
+        return self.check(index, summary)
+
+
+def _non_empty_string(value: Any) -> bool:
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+_DEFAULT_VALIDATOR = SummaryValidator()
+
+
+def explain_meeting_summary(summary: Any) -> List[str]:
+    """
+    Why a summary fails validate_meeting_summary
+
+    Args:
+        summary: Summary dictionary from the agent
+
+    Returns:
+        list: Failure reasons; empty if the summary is valid
+    """
+    return _DEFAULT_VALIDATOR.explain(summary)
+
+
+def _check_chunk(start: int, records: List[Any]) -> List[ValidationResult]:
+    check = _DEFAULT_VALIDATOR.check
+    return [check(start + offset, record) for offset, record in enumerate(records)]
+
+
+def _check_line_chunk(start: int, lines: List[str]) -> List[ValidationResult]:
+    check_line = _DEFAULT_VALIDATOR.check_line
+    return [
+        check_line(start + offset, line)
+        for offset, line in enumerate(lines)
+        if line.strip()
+    ]
+
+
+def _chunks(records: Iterable[Any], size: int) -> Iterator[Tuple[int, List[Any]]]:
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _run(
+    worker, records: Iterable[Any], workers: Optional[int], chunk_size: int
+) -> Iterator[ValidationResult]:
+    """Apply a chunk worker in-process or across processes, in input order"""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    chunks = _chunks(records, chunk_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for start, chunk in chunks:
+            yield from worker(start, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window of chunks in flight so huge inputs stream
+        pending = []
+        for start, chunk in chunks:
+            pending.append(executor.submit(worker, start, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+def validate_many(
+    summaries: Iterable[Any],
+    workers: Optional[int] = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ValidationResult]:
+    """
+    Validate summaries in bulk
+
+    Args:
+        summaries: Parsed summaries
+        workers: Worker processes; 1 validates in-process, None uses every CPU
+        chunk_size: Records sent to a worker at a time
+
+    Returns:
+        Iterator of ValidationResult in input order
+    """
+    return _run(_check_chunk, summaries, workers, chunk_size)
+
+
+def validate_jsonl(
+    path: str,
+    workers: Optional[int] = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ValidationResult]:
+    """
+    Validate a JSON Lines file of summaries; blank lines are skipped
+
+    Args:
+        path: File with one summary per line
+        workers: Worker processes; 1 validates in-process, None uses every CPU
+        chunk_size: Lines sent to a worker at a time
+
+    Returns:
+        Iterator of ValidationResult in file order; index + 1 is the line
+        number
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _run(_check_line_chunk, f, workers, chunk_size)
+
+
+def summarize_results(results: Iterable[ValidationResult]) -> Dict[str, Any]:
+    """
+    Count valid and invalid records and their failure reasons
+
+    Args:
+        results: Output of validate_many or validate_jsonl
+
+    Returns:
+        dict: Totals, counts per reason and the indexes of invalid records
+    """
+    total = 0
+    invalid: List[int] = []
+    reasons: Dict[str, int] = {}
+    for result in results:
+        total += 1
+        if result.valid:
+            continue
+        invalid.append(result.index)
+        for reason in result.reasons:
+            reasons[reason] = reasons.get(reason, 0) + 1
+    return {
+        "records": total,
+        "valid": total - len(invalid),
+        "invalid": len(invalid),
+        "reasons": dict(sorted(reasons.items(), key=lambda kv: -kv[1])),
+        "invalid_indexes": invalid,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Validate a JSON Lines file")
+    parser.add_argument("path")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    invalid = 0
+    for result in validate_jsonl(args.path, args.workers, args.chunk_size):
+        if not result.valid:
+            invalid += 1
+            print(f"line {result.index + 1}: {'; '.join(result.reasons)}")
+    print(f"{invalid} invalid record(s)", file=sys.stderr)
+    sys.exit(1 if invalid else 0)
@@ -0,0 +1,404 @@
+"""Offline test suite for the Meeting Agent pipeline using a scripted LLM client"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent import MeetingAgent
+from src.chunking import chunk_transcript, estimate_tokens, merge_summaries
+from src.classifier import TranscriptClassifier, evaluate_classifier
+from src.compaction import TranscriptCompactor, missing_expected_terms
+from src.deadlines import DeadlineResolver
+from src.helpers import validate_meeting_summary
+from src.store import ActionItemStore
+from data.test_transcripts import TEST_TRANSCRIPTS
+
+
+def _summary_for(transcript: str) -> str:
+    """Build a schema-valid summary naming the first speaker in the transcript"""
+    first_line = transcript.strip().splitlines()[0]
+    speaker = first_line.split(":", 1)[0]
+    return json.dumps(
+        {
+            "meeting_title": f"Meeting led by {speaker}",
+            "agenda": "Status updates",
+            "action_items": [
+                {"task": first_line, "owner": speaker, "deadline": "tomorrow"}
+            ],
+        }
+    )
+
+
+class ScriptedClient:
+    """LLM client stand-in that answers from the transcript embedded in the prompt"""
+
+    def __init__(self):
+        self.prompts = []
+        self.systems = []
+        self._lock = threading.Lock()
+
+    def _answer(self, prompt: str, system: str = None) -> str:
+        with self._lock:
+            self.prompts.append(prompt)
+            self.systems.append(system)
+        transcript = prompt.split("MEETING TRANSCRIPT:\n", 1)[1]
+        if "MALFORMED" in transcript:
+            return "I could not produce JSON for this one"
+        if "INCOMPLETE" in transcript:
+            return json.dumps(
+                {"meeting_title": "Partial", "agenda": None, "action_items": [{}]}
+            )
+        return _summary_for(transcript)
+
+    def complete(self, prompt: str, system: str = None) -> str:
+        return self._answer(prompt, system)
+
+    async def acomplete(self, prompt: str, system: str = None) -> str:
+        await asyncio.sleep(0)
+        return self._answer(prompt, system)
+
+
+class TestBatchSummarization:
+    """Tests for summarize_many and asummarize_many"""
+
+    def setup_method(self):
+        """Setup agent with a scripted client"""
+        self.client = ScriptedClient()
+        self.agent = MeetingAgent(self.client)
+        self.transcripts = [
+            "Alice: I'll deploy the fix.",
+            "Bob: I'll review the PR.",
+            "Alice: I'll deploy the fix.",
+            "Carol: MALFORMED",
+        ]
+
+    def test_summarize_meeting_parses_response(self):
+        """Test that a single transcript produces a valid summary"""
+        result = self.agent.summarize_meeting("Alice: I'll deploy the fix.")
+        assert validate_meeting_summary(result)
+        assert result["action_items"][0]["owner"] == "Alice"
+
+    def test_instructions_are_sent_as_shared_system_prefix(self):
+        """Test that every request carries the same system prompt and no copy of it"""
+        self.agent.summarize_meeting("Alice: I'll deploy the fix.")
+        self.agent.summarize_meeting("Bob: I'll review the PR.")
+
+        assert self.client.systems == [self.agent.summary_prompt] * 2
+        for prompt in self.client.prompts:
+            assert self.agent.summary_prompt not in prompt
+            assert prompt.startswith("MEETING TRANSCRIPT:\n")
+
+    def test_ordered_results_dedupe_and_isolate_failures(self):
+        """Test input ordering, duplicate reuse, and per-item error isolation"""
+        results = list(self.agent.summarize_many(self.transcripts, max_workers=3))
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert results[0].summary == results[2].summary
+        assert results[0].summary is not results[2].summary
+        results[0].summary["action_items"][0]["owner"] = "Zed"
+        assert results[2].summary["action_items"][0]["owner"] == "Alice"
+        assert results[1].summary["action_items"][0]["owner"] == "Bob"
+        assert results[3].summary is None
+        assert isinstance(results[3].error, ValueError)
+        assert len(self.client.prompts) == 3
+
+    def test_unordered_results_cover_every_input(self):
+        """Test that completion-order streaming still reports every position"""
+        results = list(self.agent.summarize_many(self.transcripts, ordered=False))
+        assert sorted(r.index for r in results) == [0, 1, 2, 3]
+        first, duplicate = sorted(
+            (r for r in results if r.index in (0, 2)), key=lambda r: r.index
+        )
+        assert first.summary == duplicate.summary
+        assert first.summary is not duplicate.summary
+
+    def test_async_batch_matches_sync_batch(self):
+        """Test that the async twin returns the same ordered results"""
+
+        async def collect():
+            return [
+                r
+                async for r in self.agent.asummarize_many(
+                    self.transcripts, max_concurrency=2
+                )
+            ]
+
+        results = asyncio.run(collect())
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert results[0].summary == results[2].summary
+        assert results[0].summary is not results[2].summary
+        assert isinstance(results[3].error, ValueError)
+        assert len(self.client.prompts) == 3
+
+
+class TestChunkedSummarization:
+    """Tests for map-reduce summarization of long transcripts"""
+
+    def setup_method(self):
+        """Setup a long transcript with many speakers"""
+        self.client = ScriptedClient()
+        self.transcript = "\n".join(
+            f"Speaker{i}: I'll finish work item {i} and report back." for i in range(40)
+        )
+
+    def test_chunks_respect_budget_and_turn_boundaries(self):
+        """Test that windows stay under budget and never split a turn"""
+        chunks = chunk_transcript(self.transcript, max_tokens=60)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+        assert "\n".join(chunks) == self.transcript
+
+    def test_oversized_turn_is_split(self):
+        """Test that a single turn larger than the budget is still chunked"""
+        turn = "Alice: " + " ".join(f"Sentence number {i}." for i in range(50))
+        chunks = chunk_transcript(turn, max_tokens=30)
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+
+    def test_long_transcript_is_summarized_per_chunk_and_merged(self):
+        """Test that each chunk is sent separately and results merge into one summary"""
+        agent = MeetingAgent(self.client, chunk_token_budget=60)
+        result = agent.summarize_meeting(self.transcript)
+
+        chunk_count = len(chunk_transcript(self.transcript, 60))
+        assert len(self.client.prompts) == chunk_count
+        assert validate_meeting_summary(result)
+        assert len(result["action_items"]) == chunk_count
+        assert result["meeting_title"] == "Meeting led by Speaker0"
+
+    def test_async_long_transcript_matches_sync(self):
+        """Test that the async path produces the same merged summary"""
+        agent = MeetingAgent(self.client, chunk_token_budget=60)
+        sync_result = agent.summarize_meeting(self.transcript)
+        async_result = asyncio.run(agent.asummarize_meeting(self.transcript))
+        assert async_result == sync_result
+
+    def test_malformed_chunk_is_treated_as_failed(self):
+        """Test that a chunk answer missing fields is dropped instead of breaking the merge"""
+        agent = MeetingAgent(self.client, chunk_token_budget=60)
+        lines = self.transcript.splitlines()
+        lines[0] = "Speaker0: INCOMPLETE"
+        result = agent.summarize_meeting("\n".join(lines))
+
+        chunk_count = len(chunk_transcript(self.transcript, 60))
+        assert validate_meeting_summary(result)
+        assert len(result["action_items"]) == chunk_count - 1
+        assert result["meeting_title"] != "Partial"
+
+        with pytest.raises(ValueError, match="valid summary"):
+            agent.summarize_meeting(self.transcript.replace("report", "INCOMPLETE"))
+
+    def test_merge_deduplicates_and_prefers_specific_deadlines(self):
+        """Test that duplicate items merge and error parts are ignored"""
+        merged = merge_summaries(
+            [
+                {
+                    "meeting_title": "Sync",
+                    "agenda": "Release status",
+                    "action_items": [
+                        {
+                            "task": "Deploy fix",
+                            "owner": "Bob",
+                            "deadline": "Not specified",
+                        }
+                    ],
+                },
+                {"error": "NO_ACTION_ITEMS_FOUND"},
+                {
+                    "meeting_title": "Sync (cont.)",
+                    "agenda": "Release status.",
+                    "action_items": [
+                        {"task": "deploy fix!", "owner": "bob", "deadline": "tomorrow"}
+                    ],
+                },
+            ]
+        )
+
+        assert validate_meeting_summary(merged)
+        assert merged["agenda"] == "Release status"
+        assert merged["action_items"] == [
+            {"task": "Deploy fix", "owner": "Bob", "deadline": "tomorrow"}
+        ]
+
+    def test_merge_of_only_errors(self):
+        """Test that all-error parts collapse into a single error response"""
+        assert merge_summaries(
+            [{"error": "NOT_A_MEETING_TRANSCRIPT"}, {"error": "NO_ACTION_ITEMS_FOUND"}]
+        ) == {"error": "NO_ACTION_ITEMS_FOUND"}
+
+
+class TestLiveMeetingSession:
+    """Tests for incremental summaries of in-progress meetings"""
+
+    def setup_method(self):
+        """Setup agent with a scripted client"""
+        self.client = ScriptedClient()
+        self.agent = MeetingAgent(self.client)
+        self.lines = [
+            f"Speaker{i}: I'll finish work item {i} by Friday." for i in range(12)
+        ]
+
+    def test_feed_emits_updates_per_window_and_summarizes_only_new_lines(self):
+        """Test that each window sends only its own lines and merges the results"""
+        session = self.agent.live_session(window_tokens=40)
+        updates = [s for s in (session.feed(line) for line in self.lines) if s]
+        final = session.finish()
+
+        assert updates
+        assert validate_meeting_summary(final)
+        assert len(self.client.prompts) == session.windows_summarized
+        first, second = [
+            prompt.split("MEETING TRANSCRIPT:\n", 1)[1]
+            for prompt in self.client.prompts[:2]
+        ]
+        assert first.startswith("Speaker0:")
+        assert "Speaker0:" not in second
+        owners = [item["owner"] for item in final["action_items"]]
+        assert len(owners) == session.windows_summarized
+        assert owners[0] == "Speaker0"
+
+    def test_stream_yields_final_summary_last(self):
+        """Test that stream() ends with the same summary finish() would return"""
+        session = self.agent.live_session(window_tokens=40)
+        summaries = list(session.stream(iter(self.lines)))
+
+        assert summaries[-1] == session.summary
+        assert validate_meeting_summary(summaries[-1])
+
+    def test_final_summary_is_post_processed_like_summarize_meeting(self):
+        """Test that finish() resolves deadlines and ingests the meeting"""
+        store = ActionItemStore(path=":memory:")
+        agent = MeetingAgent(
+            self.client, deadline_resolver=DeadlineResolver(), store=store
+        )
+        session = agent.live_session(window_tokens=40)
+        for line in self.lines:
+            session.feed(line)
+        final = session.finish(reference_time="2024-03-13")
+
+        assert validate_meeting_summary(final) and final == session.summary
+        assert {item["deadline_iso"] for item in final["action_items"]} == {
+            "2024-03-14"
+        }
+        assert store.stats()["meetings"] == 1
+        assert store.stats()["items"] == len(final["action_items"])
+
+    def test_invalid_segment_does_not_break_later_windows(self):
+        """Test that a malformed mid-meeting answer is dropped, not merged"""
+        session = self.agent.live_session(window_tokens=1000)
+        session.feed("Alice: I'll deploy the fix by Friday.")
+        first = session.flush()
+        session.feed("Bob: INCOMPLETE notes from the hallway.")
+
+        assert session.flush() == first
+        session.feed("Carol: I'll update the docs by Monday.")
+        final = session.finish()
+
+        assert session.windows_failed == 1
+        assert session.windows_summarized == 2
+        assert validate_meeting_summary(final)
+        owners = [item["owner"] for item in final["action_items"]]
+        assert owners == ["Alice", "Carol"]
+
+    def test_empty_meeting_finishes_with_error(self):
+        """Test that a session with no lines reports a non-meeting"""
+        session = self.agent.live_session()
+        assert session.finish() == {"error": "NOT_A_MEETING_TRANSCRIPT"}
+
+
+class TestPreClassifier:
+    """Tests for the local NOT_A_MEETING / NO_ACTION_ITEMS gate"""
+
+    def setup_method(self):
+        """Setup agent with a scripted client"""
+        self.client = ScriptedClient()
+        self.agent = MeetingAgent(self.client)
+
+    def test_accuracy_on_reference_transcripts(self):
+        """Test that only the error cases are answered locally, and correctly"""
+        report = evaluate_classifier(TranscriptClassifier(), TEST_TRANSCRIPTS)
+
+        assert report["mistakes"] == []
+        assert report["precision"] == 1.0
+        assert report["error_case_coverage"] == 1.0
+
+    def test_error_cases_skip_the_llm(self):
+        """Test that obvious error inputs never reach the LLM client"""
+        for name in ("test_case_not_a_meeting", "test_case_no_action_items"):
+            case = TEST_TRANSCRIPTS[name]
+            result = self.agent.summarize_meeting(case["transcript"])
+            assert result == {"error": case["expected_error"]}
+        assert self.client.prompts == []
+
+    def test_meetings_are_escalated(self):
+        """Test that real meetings still go to the LLM"""
+        self.agent.summarize_meeting(
+            TEST_TRANSCRIPTS["test_case_standup"]["transcript"]
+        )
+        assert len(self.client.prompts) == 1
+
+    def test_threshold_is_tunable(self):
+        """Test that an unreachable threshold disables local answers"""
+        classifier = TranscriptClassifier(min_confidence=1.01)
+        case = TEST_TRANSCRIPTS["test_case_not_a_meeting"]
+        assert classifier.classify(case["transcript"]).label is None
+
+
+class TestTranscriptCompaction:
+    """Tests for token-aware compaction before prompting"""
+
+    def setup_method(self):
+        """Setup a default compactor"""
+        self.compactor = TranscriptCompactor()
+
+    def test_owners_and_deadlines_survive_on_reference_transcripts(self):
+        """Test that no expected owner or deadline is lost from any test case"""
+        for name, case in TEST_TRANSCRIPTS.items():
+            result = self.compactor.compact(case["transcript"])
+            missing = missing_expected_terms(
+                case["transcript"], result, case.get("expected", {})
+            )
+            assert missing == [], f"{name} lost {missing}"
+            assert result.compacted_tokens <= result.original_tokens, name
+
+    def test_filler_whitespace_and_timestamps(self):
+        """Test that filler goes, but replies accepting a request stay"""
+        transcript = (
+            "[00:00:05] Alice:   Can you send the report?\n"
+            "[00:00:09] Bob: Will do!\n"
+            "\n"
+            "Alice: Great, thanks.\n"
+            "Alice:\tAlso the slides by Friday."
+        )
+        result = self.compactor.compact(transcript)
+
+        assert result.text == (
+            "Alice: Can you send the report?\n"
+            "Bob: Will do!\n"
+            "Alice: Also the slides by Friday."
+        )
+        assert result.dropped_turns == 1
+        assert result.stats()["saved_tokens"] > 0
+
+    def test_aliases_are_expanded_in_owner_fields(self):
+        """Test that the legend is sent and aliased owners come back in full"""
+        transcript = "\n".join(
+            f"{speaker}: I'll finish work item {i} by Friday."
+            for i, speaker in enumerate(["Team Lead", "Christopher"] * 15)
+        )
+        client = ScriptedClient()
+        agent = MeetingAgent(client, compactor=self.compactor)
+
+        result = agent.summarize_meeting(transcript)
+
+        assert "SPEAKER ALIASES: TL = Team Lead; C = Christopher" in client.prompts[0]
+        assert "\nTL: I'll finish work item 0" in client.prompts[0]
+        assert result["action_items"][0]["owner"] == "Team Lead"
@@ -0,0 +1,83 @@
+"""Test suite for the benchmark harness"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.run import combine_rounds, compare, measure, percentile
+from benchmarks.synthetic import synthetic_summary, synthetic_transcript
+from src.helpers import validate_meeting_summary
+
+
+class TestBenchmarkHarness:
+    """Tests for percentile, measurement and regression detection"""
+
+    def test_percentile_interpolates(self):
+        """Test that percentiles interpolate between samples"""
+        samples = [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert percentile(samples, 50) == 3.0
+        assert percentile(samples, 95) == 4.8
+        assert percentile([7.0], 99) == 7.0
+
+    def test_measure_reports_percentiles(self):
+        """Test that measure returns ordered percentiles and throughput"""
+        result = measure(
+            lambda _: sum(range(100)), 20, payload_bytes=100, calibration=lambda: 0
+        )
+        assert result["iterations"] == 20
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+        assert result["throughput_ops"] > 0
+        assert result["throughput_mb_s"] > 0
+        assert result["min_ms"] <= result["p50_ms"] and result["mad_ms"] >= 0
+        assert result["calibration_ms"] >= 0
+
+    def test_compare_flags_only_real_regressions(self):
+        """Test that slowdowns past both thresholds are reported"""
+        baseline = {"a": {"p50_ms": 10.0}, "b": {"p50_ms": 0.01}}
+        current = {"a": {"p50_ms": 14.0}, "b": {"p50_ms": 0.03}, "c": {"p50_ms": 1}}
+        regressions = compare(current, baseline, threshold=0.25, min_delta_ms=0.05)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("a p50_ms")
+
+    def test_compare_ignores_slowdowns_within_median_noise(self):
+        """Test that a noisy case needs a slowdown beyond its median's spread"""
+        base = {"p50_ms": 10.0, "mad_ms": 4.0, "iterations": 20}
+        noisy = {"p50_ms": 14.0, "mad_ms": 4.0, "iterations": 20}
+        assert compare({"a": noisy}, {"a": base}, 0.25, 0.05) == []
+        steady = {"p50_ms": 14.0, "mad_ms": 0.1, "iterations": 20}
+        assert (
+            len(compare({"a": steady}, {"a": dict(base, mad_ms=0.1)}, 0.25, 0.05)) == 1
+        )
+
+    def test_rounds_combine_and_widen_the_noise_allowance(self):
+        """Test that rounds merge by median and their drift is tolerated"""
+        rounds = [
+            {"p50_ms": p50, "min_ms": p50 - 1, "mad_ms": 0.1, "iterations": 20}
+            for p50 in (10.0, 13.0, 11.0)
+        ]
+        for result in rounds:
+            result.update(p95_ms=20.0, p99_ms=30.0, peak_rss_mb=None)
+        merged = combine_rounds(rounds)
+        assert merged["p50_ms"] == 11.0 and merged["min_ms"] == 9.0
+        assert merged["iterations"] == 60
+        assert merged["round_p50_ms"] == [10.0, 13.0, 11.0]
+        slower = dict(merged, p50_ms=14.0)
+        assert compare({"a": slower}, {"a": merged}, 0.25, 0.05) == []
+        steady = dict(merged, round_p50_ms=[11.0, 11.0, 11.0])
+        assert len(compare({"a": slower}, {"a": steady}, 0.25, 0.05)) == 1
+
+    def test_compare_scales_baseline_by_machine_speed(self):
+        """Test that a uniformly slower machine is not reported as a regression"""
+        baseline = {"a": {"p50_ms": 10.0, "calibration_ms": 1.0}}
+        slower = {"a": {"p50_ms": 15.0, "calibration_ms": 1.5}}
+        assert compare(slower, baseline, 0.25, 0.05) == []
+        regressed = {"a": {"p50_ms": 20.0, "calibration_ms": 1.5}}
+        assert len(compare(regressed, baseline, 0.25, 0.05)) == 1
+        assert len(compare({"a": {"p50_ms": 15.0}}, baseline, 0.25, 0.05)) == 1
+
+    def test_synthetic_data_is_valid(self):
+        """Test that synthetic inputs match their requested size and schema"""
+        transcript = synthetic_transcript(4096)
+        assert 4096 <= len(transcript) < 4096 + 200
+        assert validate_meeting_summary(synthetic_summary(10))
@@ -0,0 +1,233 @@
+"""Test suite for the LLM response cache store"""
+
+import multiprocessing
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cache import TOUCH_BATCH, CacheStore, SingleFlight, fcntl
+
+
+def _lock_and_report(path, key, queue):
+    """Take the per-key lock in a separate process and report when it was granted"""
+    cache = CacheStore(path=path)
+    with cache.lock(key):
+        queue.put(time.monotonic())
+    cache.close()
+
+
+class TestCacheStore:
+    """Tests for the SQLite-backed cache store"""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """Test that stored values are returned and hits/misses are counted"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"))
+
+        assert cache.get("missing") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == len("value")
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive reopening the store"""
+        path = str(tmp_path / "cache.sqlite3")
+        CacheStore(path=path).set("key", "value")
+
+        assert CacheStore(path=path).get("key") == "value"
+
+    def test_evicts_least_recently_used_by_count(self, tmp_path):
+        """Test that the entry budget evicts the least recently used key"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"), max_entries=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_by_byte_budget(self, tmp_path):
+        """Test that the byte budget bounds the total payload size"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"), max_bytes=10)
+        cache.set("a", "x" * 6)
+        time.sleep(0.01)
+        cache.set("b", "y" * 6)
+
+        assert len(cache) == 1
+        assert cache.get("b") == "y" * 6
+
+    def test_ttl_expires_entries(self, tmp_path):
+        """Test that entries older than the TTL are treated as misses"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0.01)
+        cache.set("key", "value")
+        time.sleep(0.05)
+
+        assert cache.get("key") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_running_totals_match_the_table(self, tmp_path):
+        """Test that totals follow replaces, deletes and expiry, and adopt old files"""
+        path = str(tmp_path / "cache.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO entries VALUES ('old', 'abc', 3, 0, 0)")
+        conn.commit()
+        conn.close()
+
+        cache = CacheStore(path=path, ttl_seconds=60)
+        cache.set("a", "x" * 5)
+        cache.set("a", "x" * 8)
+        cache.set("b", "y")
+        cache.delete("b")
+        assert cache.get("old") is None
+
+        stats = cache.stats()
+        assert (stats["entries"], stats["bytes"]) == (1, 8) == (len(cache), 8)
+
+    def test_hits_update_recency_in_batches(self, tmp_path):
+        """Test that access times are buffered until a batch fills or a write"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"))
+        cache.set("a", "1")
+
+        def accessed_at():
+            return cache._conn.execute(
+                "SELECT accessed_at FROM entries WHERE key = 'a'"
+            ).fetchone()[0]
+
+        written = accessed_at()
+        time.sleep(0.01)
+        for _ in range(TOUCH_BATCH - 1):
+            cache.get("a")
+        cache.get("missing")
+        assert accessed_at() == written
+        cache.set("b", "2")
+        assert accessed_at() > written
+
+    def test_rejects_invalid_budgets(self, tmp_path):
+        """Test that non-positive budgets are rejected"""
+        with pytest.raises(ValueError):
+            CacheStore(path=str(tmp_path / "cache.sqlite3"), max_entries=0)
+
+
+class TestSingleFlight:
+    """Tests for in-process and cross-process request coalescing"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving while a key is in flight reuse its result"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(flight.do, "key", compute)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "key", compute) for _ in range(3)]
+            while flight.coalesced < 3:
+                time.sleep(0.001)
+            release.set()
+
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["value"] * 4
+        assert len(calls) == 1
+
+    def test_errors_propagate_to_waiters_and_are_not_cached(self):
+        """Test that a failure reaches every waiter and the next call retries"""
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("key", fail)
+        assert flight.do("key", lambda: "ok") == "ok"
+
+    def test_cross_process_lock_round_trip(self, tmp_path):
+        """Test that the per-key file lock can be taken and released repeatedly"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"))
+        key = "ab" * 32
+
+        with cache.lock(key):
+            cache.set(key, "value")
+        with cache.lock(key):
+            assert cache.get(key) == "value"
+        cache.close()
+
+    @pytest.mark.skipif(fcntl is None, reason="needs POSIX file locks")
+    def test_second_process_blocks_only_on_the_same_stripe(self, tmp_path):
+        """Test that another process waits for a held key but not for other stripes"""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = CacheStore(path=path)
+        held, other = "ab" * 32, "cd" * 32
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+
+        with cache.lock(held):
+            same = context.Process(target=_lock_and_report, args=(path, held, queue))
+            same.start()
+            different = context.Process(
+                target=_lock_and_report, args=(path, other, queue)
+            )
+            different.start()
+            different.join(5)
+            assert different.exitcode == 0
+            queue.get(timeout=1)
+
+            time.sleep(0.3)
+            assert same.is_alive()
+            released = time.monotonic()
+
+        same.join(5)
+        assert same.exitcode == 0
+        assert queue.get(timeout=1) >= released
+        cache.close()
+
+    @pytest.mark.skipif(fcntl is None, reason="needs POSIX file locks")
+    def test_threads_on_the_same_stripe_block_each_other(self, tmp_path):
+        """Test that two threads of one process serialize on colliding keys"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"))
+        held, colliding = "0000abcd" + "0" * 56, "0001abcd" + "0" * 56
+        granted = threading.Event()
+
+        def take_colliding():
+            with cache.lock(colliding):
+                granted.set()
+
+        with cache.lock(held):
+            thread = threading.Thread(target=take_colliding)
+            thread.start()
+            assert not granted.wait(0.3)
+
+        thread.join(5)
+        assert granted.is_set()
+        with cache.lock(held):
+            pass
+        cache.close()
@@ -0,0 +1,85 @@
+"""Test suite for deadline resolution"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.deadlines import DeadlineResolver, parse_deadline
+from src.helpers import validate_meeting_summary
+from src.llm import LLMClient
+
+# A Wednesday
+MEETING = datetime(2024, 3, 13, 10, 30)
+
+
+class TestDeadlineResolver:
+    """Tests for phrase resolution and the agent post-processing stage"""
+
+    @pytest.mark.parametrize(
+        "phrase, expected",
+        [
+            ("today", "2024-03-13"),
+            ("Tomorrow", "2024-03-14"),
+            ("this afternoon", "2024-03-13T12:00/2024-03-13T17:00"),
+            ("tomorrow morning", "2024-03-14T09:00/2024-03-14T12:00"),
+            ("Friday", "2024-03-15"),
+            ("by Monday.", "2024-03-18"),
+            ("next Friday", "2024-03-22"),
+            ("end of week", "2024-03-15"),
+            ("by the end of this week", "2024-03-15"),
+            ("end of next week", "2024-03-22"),
+            ("next week", "2024-03-18/2024-03-22"),
+            ("this week", "2024-03-13/2024-03-15"),
+            ("end of month", "2024-03-31"),
+            ("next month", "2024-04-01/2024-04-30"),
+            ("end of quarter", "2024-03-31"),
+            ("in two weeks", "2024-03-27"),
+            ("by 3pm", "2024-03-13T15:00"),
+            ("EOD", "2024-03-13T17:00"),
+            ("2024-04-02", "2024-04-02"),
+        ],
+    )
+    def test_phrases(self, phrase, expected):
+        """Test that common deadline phrases resolve to ISO dates or ranges"""
+        assert DeadlineResolver().resolve(phrase, MEETING).iso() == expected
+
+    def test_unrecognized_phrases(self):
+        """Test that relative-to-event and missing deadlines stay unresolved"""
+        resolver = DeadlineResolver()
+        for phrase in ("before the demo", "Not specified", "ASAP", "", None):
+            assert resolver.resolve(phrase, MEETING) is None
+
+    def test_phrases_are_parsed_once(self):
+        """Test that rules are cached independently of the reference time"""
+        parse_deadline.cache_clear()
+        resolver = DeadlineResolver()
+        resolver.resolve("Friday", "2024-03-13")
+        assert resolver.resolve("Friday", "2024-03-16").iso() == "2024-03-22"
+        info = parse_deadline.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_agent_post_processing(self):
+        """Test that the agent adds deadline_iso and the summary stays valid"""
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=FakeBackend())
+        agent = MeetingAgent(client, deadline_resolver=DeadlineResolver())
+        transcript = TEST_TRANSCRIPTS["test_case_standup"]["transcript"]
+
+        summary = agent.summarize_meeting(transcript, reference_time=MEETING)
+        assert validate_meeting_summary(summary)
+        resolved = {
+            item["deadline"].lower(): item["deadline_iso"]
+            for item in summary["action_items"]
+        }
+        assert resolved["tomorrow"] == "2024-03-14"
+        assert resolved["today"] == "2024-03-13"
+
+        plain = MeetingAgent(client).summarize_meeting(transcript)
+        assert all("deadline_iso" not in item for item in plain["action_items"])
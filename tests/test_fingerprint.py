@@ -0,0 +1,165 @@
+"""Test suite for transcript fingerprints and the near-duplicate cache"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.fingerprint import (
+    NearDuplicateIndex,
+    band_rows,
+    canonicalize,
+    fingerprint,
+    similarity,
+)
+from src.llm import LLMClient
+
+KICKOFF = TEST_TRANSCRIPTS["test_case_project_kickoff"]["transcript"]
+
+
+def _client(threshold=0.9):
+    backend = FakeBackend()
+    client = LLMClient(
+        cache=CacheStore(path=":memory:"),
+        backend=backend,
+        near_duplicates=NearDuplicateIndex(path=":memory:", threshold=threshold),
+    )
+    return client, backend
+
+
+def _reformatted(transcript):
+    """Same meeting with CRLF line endings, extra spaces and a sign-off"""
+    spaced = transcript.replace(": ", ":   ").replace("\n", "  \r\n")
+    return f"{spaced}\r\nAlice:  Thanks all!"
+
+
+def _reworded(transcript):
+    """Same meeting with one sentence slightly reworded"""
+    lines = transcript.splitlines()
+    speaker, text = lines[-1].split(": ", 1)
+    lines[-1] = f"{speaker}: {text.rstrip('.')} as discussed."
+    return "\n".join(lines)
+
+
+def _long_meeting(line):
+    """60-turn meeting whose decision line can be varied"""
+    speakers = ["Alice", "Bob", "Carol"]
+    turns = [
+        f"{speakers[i % 3]}: Status point {i} covers the dashboard work in area {i}."
+        for i in range(59)
+    ]
+    turns.insert(30, f"Alice: {line}")
+    return "\n".join(turns)
+
+
+class TestFingerprint:
+    """Tests for canonicalization, anchors and MinHash similarity"""
+
+    def test_canonical_form_ignores_formatting_and_sign_offs(self):
+        """Test that whitespace, line endings and filler turns do not matter"""
+        assert canonicalize(_reformatted(KICKOFF)) == canonicalize(KICKOFF)
+        assert fingerprint(_reformatted(KICKOFF)) == fingerprint(KICKOFF)
+
+    def test_near_and_distinct_transcripts(self):
+        """Test that small edits stay similar while other meetings do not"""
+        base = fingerprint(KICKOFF)
+        near = fingerprint(_reworded(KICKOFF))
+        assert near.canonical != base.canonical and near.anchor == base.anchor
+        assert similarity(base.signature, near.signature) >= 0.9
+
+        others = [
+            fingerprint(case["transcript"]).signature
+            for name, case in TEST_TRANSCRIPTS.items()
+            if name != "test_case_project_kickoff"
+        ]
+        assert max(similarity(base.signature, other) for other in others) < 0.2
+
+    def test_changed_deadline_changes_anchor(self):
+        """Test that a different deadline never matches"""
+        moved = KICKOFF.replace("Friday", "Monday")
+        assert moved != KICKOFF
+        assert fingerprint(moved).anchor != fingerprint(KICKOFF).anchor
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            "Carol will handle the database migration.",
+            "Bob will not handle the database migration.",
+            "Bob won't handle the database migration.",
+        ],
+    )
+    def test_owner_swap_and_negation_never_match(self, changed):
+        """Test that a different owner or a negated decision is not served"""
+        base = fingerprint(_long_meeting("Bob will handle the database migration."))
+        other = fingerprint(_long_meeting(changed))
+        assert similarity(base.signature, other.signature) >= 0.9
+        assert other.anchor != base.anchor
+
+        index = NearDuplicateIndex(path=":memory:", threshold=0.9)
+        index.add(base, "scope", "bob-key")
+        assert index.lookup(other, "scope") is None
+
+    def test_index_lookup_respects_scope_and_threshold(self):
+        """Test band lookup, the similarity threshold and scopes"""
+        base, near = fingerprint(KICKOFF), fingerprint(_reworded(KICKOFF))
+        score = similarity(base.signature, near.signature)
+        index = NearDuplicateIndex(path=":memory:", threshold=score)
+        index.add(base, "scope", "key")
+
+        exact = index.lookup(fingerprint(_reformatted(KICKOFF)), "scope")
+        assert exact == ("key", 1.0, True)
+        assert index.lookup(near, "scope") == ("key", score, False)
+        assert index.lookup(near, "other") is None
+
+        strict = NearDuplicateIndex(path=":memory:", threshold=1.0)
+        strict.add(base, "scope", "key")
+        assert strict.lookup(near, "scope") is None
+        assert [band_rows(t) for t in (0.5, 0.9, 1.0)] == [2, 8, 32]
+
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(path=":memory:", threshold=0)
+
+
+class TestNearDuplicateCache:
+    """Tests for near-duplicate reuse in LLMClient and MeetingAgent"""
+
+    def test_agent_reuses_summary_of_near_duplicate(self):
+        """Test that reformatted and reworded uploads call the model once"""
+        client, backend = _client()
+        agent = MeetingAgent(client, use_pre_classifier=False)
+        first = agent.summarize_meeting(KICKOFF)
+        assert agent.summarize_meeting(_reformatted(KICKOFF)) == first
+        assert agent.summarize_meeting(_reworded(KICKOFF)) == first
+        assert backend.calls == 1
+
+        agent.summarize_meeting(KICKOFF.replace("Friday", "Monday"))
+        assert backend.calls == 2
+
+    def test_only_dedupe_text_requests_are_matched(self):
+        """Test that plain prompts keep exact-key caching"""
+        client, backend = _client()
+        client.complete("MEETING TRANSCRIPT:\n" + KICKOFF)
+        client.complete("MEETING TRANSCRIPT:\n" + _reformatted(KICKOFF))
+        assert backend.calls == 2
+
+    def test_async_requests_share_the_index(self):
+        """Test that acomplete() indexes and reuses responses too"""
+        client, backend = _client()
+
+        async def run():
+            first = await client.acomplete("a", dedupe_text=KICKOFF)
+            second = await client.acomplete("b", dedupe_text=_reformatted(KICKOFF))
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert backend.calls == 1
+        assert client.complete("c", dedupe_text=_reworded(KICKOFF)) == first
+        assert backend.calls == 1
@@ -0,0 +1,108 @@
+"""Test suite for the helper functions"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.helpers import (
+    extract_json_object,
+    normalize_structured_summary,
+    parse_json_response,
+    validate_meeting_summary,
+)
+
+
+class TestJsonExtraction:
+    """Tests for extracting JSON objects from LLM responses"""
+
+    def test_bare_json(self):
+        """Test that a plain JSON response is parsed directly"""
+        assert extract_json_object('{"a": 1}') == {"a": 1}
+
+    def test_fenced_json_with_nested_braces(self):
+        """Test that nested objects inside a code fence are parsed whole"""
+        text = 'Here you go:\n```json\n{"a": {"b": {"c": 1}}, "d": 2}\n```\nThanks!'
+        assert extract_json_object(text) == {"a": {"b": {"c": 1}}, "d": 2}
+
+    def test_prose_braces_before_and_after(self):
+        """Test that braces in surrounding prose don't swallow the object"""
+        text = 'Use {name} placeholders. {"title": "Sync"} Also see {that}.'
+        assert extract_json_object(text) == {"title": "Sync"}
+
+    def test_braces_and_escapes_inside_strings(self):
+        """Test that braces and escaped quotes inside strings are not structural"""
+        text = 'Result: {"task": "fix \\"}{\\" parsing", "owner": "Bob"} done'
+        assert extract_json_object(text) == {
+            "task": 'fix "}{" parsing',
+            "owner": "Bob",
+        }
+
+    def test_invalid_outer_object_is_not_replaced_by_inner(self):
+        """Test that an object nested in broken JSON is never returned"""
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object('{"broken": 1, {"a": 2}')
+        assert extract_json_object('{"broken": 1, {"a": 2}} {"b": 3}') == {"b": 3}
+
+    def test_truncated_summary_raises(self):
+        """Test that a summary cut off mid action item is rejected"""
+        summary = json.dumps(
+            {
+                "meeting_title": "Release",
+                "agenda": "Ship it",
+                "action_items": [
+                    {"task": "Deploy", "owner": "Bob", "deadline": "today"},
+                    {"task": "Review", "owner": "Alice", "deadline": "Friday"},
+                ],
+            }
+        )
+        truncated = summary[: summary.index('"Review"')]
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object(f"```json\n{truncated}")
+
+    def test_large_unclosed_input_is_linear(self):
+        """Test that a long unclosed response fails fast instead of rescanning"""
+        item = '{"task": "Deploy \\"x\\" {now}", "owner": "Bob", "deadline": "today"}, '
+        text = '{"action_items": [' + item * 6000
+        assert len(text) > 400_000
+        started = time.perf_counter()
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object(text)
+        assert time.perf_counter() - started < 0.5
+
+    def test_no_object_raises_decode_error(self):
+        """Test that responses without JSON raise JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_response("no json here {at all}")
+
+
+class TestStructuredSummary:
+    """Tests for mapping structured-output responses to the summary shape"""
+
+    def test_error_response_drops_other_fields(self):
+        """Test that a reported error becomes a single-key error response"""
+        data = {
+            "error": "NO_ACTION_ITEMS_FOUND",
+            "meeting_title": None,
+            "agenda": None,
+            "action_items": None,
+        }
+        result = normalize_structured_summary(data)
+        assert result == {"error": "NO_ACTION_ITEMS_FOUND"}
+        assert validate_meeting_summary(result)
+
+    def test_success_response_drops_null_error(self):
+        """Test that a null error field is removed from a summary"""
+        data = {
+            "error": None,
+            "meeting_title": "Sync",
+            "agenda": "Status",
+            "action_items": [],
+        }
+        result = normalize_structured_summary(data)
+        assert "error" not in result
+        assert validate_meeting_summary(result)
@@ -0,0 +1,132 @@
+"""Test suite for the parallel judge evaluation runner"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from judge.llm_judge import judge_meeting_summary
+from judge.runner import EvaluationRunner, build_report
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.llm import LLMClient
+
+
+class CountingJudge:
+    """Wraps judge_meeting_summary and counts calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, transcript, agent_summary, expected, llm_client):
+        with self._lock:
+            self.calls += 1
+        return judge_meeting_summary(transcript, agent_summary, expected, llm_client)
+
+
+class TestEvaluationRunner:
+    """Tests for concurrency, verdict caching and resuming"""
+
+    def setup_method(self):
+        """Setup an offline client and agent"""
+        self.client = LLMClient(
+            cache=CacheStore(path=":memory:"), backend=FakeBackend(latency=0.01)
+        )
+        self.agent = MeetingAgent(self.client)
+
+    def _runner(self, tmp_path, judge, results="results.jsonl"):
+        return EvaluationRunner(
+            self.agent,
+            self.client,
+            max_workers=4,
+            verdict_cache=CacheStore(path=str(tmp_path / "verdicts.sqlite3")),
+            results_path=str(tmp_path / results) if results else None,
+            judge=judge,
+        )
+
+    def test_report_covers_all_cases(self, tmp_path):
+        """Test pass rate, criteria means and that error cases skip the judge"""
+        judge = CountingJudge()
+        report = self._runner(tmp_path, judge).run(TEST_TRANSCRIPTS)
+
+        meetings = [c for c in TEST_TRANSCRIPTS.values() if "expected" in c]
+        assert report["cases"] == len(TEST_TRANSCRIPTS)
+        assert report["pass_rate"] == 1.0
+        assert judge.calls == len(meetings)
+        assert report["criteria_means"]["ownership_accuracy"] == 16
+        assert set(report["latency_seconds"]) == {"mean", "p50", "p95", "max"}
+
+    def test_verdicts_are_cached_across_runs(self, tmp_path):
+        """Test that re-judging the same summaries hits the verdict cache"""
+        judge = CountingJudge()
+        self._runner(tmp_path, judge, results=None).run(TEST_TRANSCRIPTS)
+        calls = judge.calls
+
+        report = self._runner(tmp_path, judge, results=None).run(TEST_TRANSCRIPTS)
+        assert judge.calls == calls
+        assert report["cached_verdicts"] == calls
+
+    def test_resume_skips_finished_cases(self, tmp_path):
+        """Test that a partial results file is resumed, not recomputed"""
+        names = list(TEST_TRANSCRIPTS)
+        first_half = {name: TEST_TRANSCRIPTS[name] for name in names[:3]}
+        self._runner(tmp_path, CountingJudge()).run(first_half)
+        with open(tmp_path / "results.jsonl", "a") as f:
+            f.write('{"case": "interrupted mid-wri')
+
+        agent_calls = []
+        original = self.agent.summarize_meeting
+        self.agent.summarize_meeting = lambda t: agent_calls.append(t) or original(t)
+        report = self._runner(tmp_path, CountingJudge()).run(TEST_TRANSCRIPTS)
+
+        assert report["resumed"] == 3
+        assert len(agent_calls) == len(names) - 3
+        assert report["completed"] == len(names)
+
+    def test_failures_are_recorded_not_raised(self, tmp_path):
+        """Test that an agent failure becomes an error record and is retried later"""
+
+        class Broken:
+            def summarize_meeting(self, transcript):
+                raise RuntimeError("upstream down")
+
+        runner = self._runner(tmp_path, CountingJudge())
+        runner.agent = Broken()
+        case = {"standup": TEST_TRANSCRIPTS["test_case_standup"]}
+        report = runner.run(case)
+        assert report["errors"] == {"standup": "RuntimeError: upstream down"}
+
+        runner.agent = self.agent
+        assert runner.run(case)["completed"] == 1
+
+    def test_build_report_of_records(self):
+        """Test aggregation over hand-written records"""
+        records = [
+            {
+                "case": "a",
+                "pass": True,
+                "score": 90,
+                "error": None,
+                "criteria_scores": {"deadline_accuracy": 20},
+                "total_seconds": 1.0,
+            },
+            {
+                "case": "b",
+                "pass": False,
+                "score": 40,
+                "error": None,
+                "criteria_scores": {"deadline_accuracy": 10},
+                "total_seconds": 3.0,
+            },
+        ]
+        report = build_report(records)
+        assert report["pass_rate"] == 0.5
+        assert report["mean_score"] == 65
+        assert report["criteria_means"] == {"deadline_accuracy": 15}
+        assert report["failed"] == ["b"]
+        assert json.dumps(report)
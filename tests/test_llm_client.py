@@ -0,0 +1,230 @@
+"""Test suite for the LLM client"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent import MeetingAgent
+from src.backends import FakeBackend, OpenAIBackend, ReplayBackend, RecordingBackend
+from src.cache import CacheStore
+from src.helpers import MEETING_SUMMARY_SCHEMA, validate_meeting_summary
+from src.llm import LLMClient
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+        self.message = SimpleNamespace(content=text)
+
+
+class FakeOpenAI:
+    """Stand-in for the llama_index OpenAI instance that counts calls"""
+
+    def __init__(self, text="response", delay=0.0):
+        self.text = text
+        self.delay = delay
+        self.calls = 0
+        self.kwargs = []
+        self.messages = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.kwargs.append(kwargs)
+        time.sleep(self.delay)
+        return _Response(self.text)
+
+    def chat(self, messages, **kwargs):
+        with self._lock:
+            self.messages.append(messages)
+        return self.complete(messages[-1].content, **kwargs)
+
+
+class TestLLMClient:
+    """Tests for caching and request coalescing in LLMClient"""
+
+    def _client(self, tmp_path, fake):
+        return LLMClient(
+            cache=CacheStore(path=str(tmp_path / "cache.sqlite3")),
+            backend=OpenAIBackend(llm=fake),
+        )
+
+    def test_second_call_is_served_from_cache(self, tmp_path):
+        """Test that a repeated prompt does not reach the model"""
+        fake = FakeOpenAI()
+        client = self._client(tmp_path, fake)
+
+        assert client.complete("prompt") == "response"
+        assert client.complete("prompt") == "response"
+        assert fake.calls == 1
+
+    def test_concurrent_identical_prompts_call_model_once(self, tmp_path):
+        """Test that identical in-flight prompts are coalesced"""
+        fake = FakeOpenAI(delay=0.2)
+        client = self._client(tmp_path, fake)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(client.complete, ["same prompt"] * 8))
+
+        assert results == ["response"] * 8
+        assert fake.calls == 1
+
+    def test_failures_are_wrapped(self, tmp_path):
+        """Test that model errors surface as LLM completion failures"""
+
+        class Broken:
+            def complete(self, prompt, **kwargs):
+                raise RuntimeError("upstream down")
+
+        client = self._client(tmp_path, Broken())
+        with pytest.raises(Exception, match="LLM completion failed"):
+            client.complete("prompt")
+
+    def test_structured_completion_sends_schema_and_parses(self, tmp_path):
+        """Test that complete_structured passes the schema and returns a dict"""
+        fake = FakeOpenAI(text='{"answer": 42}')
+        client = self._client(tmp_path, fake)
+        schema = {"type": "object", "properties": {"answer": {"type": "integer"}}}
+
+        assert client.complete_structured("prompt", schema, "answer") == {"answer": 42}
+        assert client.complete_structured("prompt", schema, "answer") == {"answer": 42}
+        response_format = fake.kwargs[0]["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["schema"] == schema
+        assert fake.calls == 1
+
+        client.complete("prompt")
+        assert fake.calls == 2, "plain and structured requests must not share a key"
+
+    def test_system_prefix_is_sent_as_separate_message(self, tmp_path):
+        """Test that system instructions lead as their own message and key part"""
+        fake = FakeOpenAI()
+        client = self._client(tmp_path, fake)
+
+        client.complete("transcript one", system="instructions")
+        client.complete("transcript one", system="instructions")
+        client.complete("transcript two", system="instructions")
+        client.complete("transcript one", system="other instructions")
+        client.complete("instructions\ntranscript one")
+
+        assert fake.calls == 4
+        roles = [message.role.value for message in fake.messages[0]]
+        assert roles == ["system", "user"]
+        assert fake.messages[0][0].content == "instructions"
+        assert fake.messages[1][0].content == "instructions"
+        assert fake.messages[1][1].content == "transcript two"
+
+    def test_agent_uses_structured_summary_schema(self, tmp_path):
+        """Test that the agent requests the summary schema and normalizes nulls"""
+        fake = FakeOpenAI(
+            text=(
+                '{"error": null, "meeting_title": "Standup", "agenda": "Updates",'
+                ' "action_items": [{"task": "Deploy", "owner": "Bob",'
+                ' "deadline": "tomorrow"}]}'
+            )
+        )
+        agent = MeetingAgent(self._client(tmp_path, fake))
+
+        result = agent.summarize_meeting("Bob: I'll deploy it tomorrow.")
+
+        assert validate_meeting_summary(result)
+        assert "error" not in result
+        schema = fake.kwargs[0]["response_format"]["json_schema"]["schema"]
+        assert schema == MEETING_SUMMARY_SCHEMA
+        assert fake.messages[0][0].content == agent.summary_prompt
+
+
+class TestAsyncLLMClient:
+    """Tests for the async completion path"""
+
+    def test_acomplete_bounds_concurrency_and_shares_cache(self, tmp_path):
+        """Test that acomplete respects max_concurrency and fills the shared cache"""
+
+        class AsyncFake(FakeOpenAI):
+            def __init__(self):
+                super().__init__()
+                self.active = 0
+                self.peak = 0
+
+            async def acomplete(self, prompt, **kwargs):
+                self.calls += 1
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return _Response(f"answer to {prompt}")
+
+        fake = AsyncFake()
+        client = LLMClient(
+            cache=CacheStore(path=str(tmp_path / "cache.sqlite3")),
+            max_concurrency=3,
+            backend=OpenAIBackend(llm=fake),
+        )
+
+        async def run():
+            prompts = [f"prompt {i}" for i in range(10)] + ["prompt 0"] * 5
+            return await asyncio.gather(*(client.acomplete(p) for p in prompts))
+
+        results = asyncio.run(run())
+
+        assert results[0] == "answer to prompt 0"
+        assert results[-1] == "answer to prompt 0"
+        assert fake.calls == 10
+        assert fake.peak <= 3
+        assert client.complete("prompt 3") == "answer to prompt 3"
+        assert fake.calls == 10
+
+
+class TestBackends:
+    """Tests for the offline backends"""
+
+    def test_fake_backend_produces_valid_summaries_and_errors(self, tmp_path):
+        """Test that the fake backend drives the agent end to end offline"""
+        backend = FakeBackend()
+        client = LLMClient(
+            cache=CacheStore(path=str(tmp_path / "cache.sqlite3")), backend=backend
+        )
+        agent = MeetingAgent(client, use_pre_classifier=False)
+
+        summary = agent.summarize_meeting(
+            "Alice: Can you review the PR?\nBob: Sure, I'll review it today."
+        )
+        assert validate_meeting_summary(summary)
+        assert summary["action_items"][-1]["owner"] == "Bob"
+        assert summary["action_items"][-1]["deadline"] == "today"
+
+        assert agent.summarize_meeting("Once upon a time there was a knight.") == {
+            "error": "NOT_A_MEETING_TRANSCRIPT"
+        }
+
+    def test_fake_backend_latency(self):
+        """Test that the configured latency is applied per call"""
+        backend = FakeBackend(latency=0.05)
+        started = time.perf_counter()
+        backend.complete("Alice: I'll do it.")
+        assert time.perf_counter() - started >= 0.05
+
+    def test_record_then_replay(self, tmp_path):
+        """Test that recorded responses are served back by the replay backend"""
+        path = str(tmp_path / "recording.jsonl")
+        recorder = RecordingBackend(OpenAIBackend(llm=FakeOpenAI(text="hello")), path)
+        recorder.complete("prompt one")
+        recorder.complete("prompt two", response_format={"type": "json_object"})
+
+        replay = ReplayBackend(path)
+        assert replay.complete("prompt one") == "hello"
+        assert (
+            replay.complete("prompt two", response_format={"type": "json_object"})
+            == "hello"
+        )
+        with pytest.raises(LookupError):
+            replay.complete("never recorded")
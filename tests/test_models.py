@@ -0,0 +1,94 @@
+"""Test suite for the compact summary models"""
+
+import json
+import pickle
+import sys
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.helpers import validate_meeting_summary
+from src.models import (
+    ActionItem,
+    MeetingSummary,
+    SummaryError,
+    SummaryValidationError,
+    summary_from_dict,
+    summary_from_json,
+)
+
+SUMMARY = {
+    "meeting_title": "Release “sync”",
+    "agenda": 'Ship the "login" fix',
+    "action_items": [
+        {"task": "Deploy fix", "owner": "Bob", "deadline": "Friday"},
+        {"task": "Update docs", "owner": "Alice", "deadline": "Friday"},
+    ],
+}
+
+
+class TestSummaryModels:
+    """Tests for construction, validation, interning and serialization"""
+
+    def test_round_trip_matches_dict_and_json(self):
+        """Test that to_dict and to_json reproduce the agent's output shape"""
+        model = summary_from_dict(SUMMARY)
+        assert isinstance(model, MeetingSummary) and not model.is_error
+        assert model.to_dict() == SUMMARY
+        assert model.to_json() == json.dumps(SUMMARY)
+        assert validate_meeting_summary(json.loads(model.to_json()))
+        assert model.owners == ("Bob", "Alice")
+
+    def test_error_variant(self):
+        """Test both error codes and that other codes are rejected"""
+        model = summary_from_json('```json\n{"error": "NO_ACTION_ITEMS_FOUND"}\n```')
+        assert isinstance(model, SummaryError) and model.is_error
+        assert model.to_json() == '{"error": "NO_ACTION_ITEMS_FOUND"}'
+        assert summary_from_dict({"error": "NOT_A_MEETING_TRANSCRIPT"}).is_error
+        with pytest.raises(SummaryValidationError):
+            SummaryError("TIMEOUT")
+
+    def test_invalid_data_reports_every_reason(self):
+        """Test that construction fails with the bulk validator's reasons"""
+        bad = {
+            "meeting_title": "",
+            "agenda": "Plan",
+            "action_items": [{"task": "Deploy", "owner": " "}],
+        }
+        with pytest.raises(SummaryValidationError) as info:
+            summary_from_dict(bad)
+        assert info.value.reasons == (
+            "meeting_title must be a non-empty string",
+            "action_items[0] missing key: deadline",
+            "action_items[0].owner must be a non-empty string",
+        )
+        with pytest.raises(SummaryValidationError):
+            summary_from_dict({"error": "NO_ACTION_ITEMS_FOUND", "agenda": "x"})
+
+    def test_structured_response(self):
+        """Test that null fields of a structured-output response are dropped"""
+        text = json.dumps(dict(SUMMARY, error=None))
+        assert summary_from_json(text, structured=True).to_dict() == SUMMARY
+
+    def test_frozen_slotted_and_interned(self):
+        """Test immutability, the absence of __dict__ and shared strings"""
+        first = summary_from_dict(json.loads(json.dumps(SUMMARY)))
+        second = summary_from_dict(json.loads(json.dumps(SUMMARY)))
+        item = first.action_items[0]
+        assert not hasattr(item, "__dict__") and not hasattr(first, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            item.owner = "Eve"
+        assert item.owner is second.action_items[0].owner
+        assert first.action_items[0].deadline is first.action_items[1].deadline
+        assert first == second and hash(first) == hash(second)
+
+    def test_pickle_keeps_interning(self):
+        """Test that models survive pickling, e.g. to worker processes"""
+        model = summary_from_dict(SUMMARY)
+        restored = pickle.loads(pickle.dumps(model))
+        assert restored == model
+        assert restored.action_items[0].owner is model.action_items[0].owner
+        assert isinstance(ActionItem.from_dict(SUMMARY["action_items"][0]), ActionItem)
@@ -0,0 +1,128 @@
+"""Test suite for the rule-based pre-judge"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from judge.prejudge import RulePreJudge, coverage, measure_agreement
+from judge.runner import EvaluationRunner
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.llm import LLMClient
+
+CASE = TEST_TRANSCRIPTS["test_case_client_meeting"]
+GOOD_SUMMARY = {
+    "meeting_title": "Client Feedback Review",
+    "agenda": "Review client feedback on the dashboard and plan follow-ups",
+    "action_items": [
+        {
+            "task": "Send the dashboard screenshots to the client",
+            "owner": "Tom",
+            "deadline": "tomorrow",
+        },
+        {"task": "Schedule a demo", "owner": "Emily", "deadline": "next Monday"},
+        {
+            "task": "Update the documentation",
+            "owner": "Emily",
+            "deadline": "before the demo",
+        },
+    ],
+}
+
+
+def _without(index):
+    items = [item for i, item in enumerate(GOOD_SUMMARY["action_items"]) if i != index]
+    return dict(GOOD_SUMMARY, action_items=items)
+
+
+def _escalation(calls):
+    def judge(transcript, agent_summary, expected, llm_client):
+        calls.append(agent_summary)
+        return {"pass": True, "score": 75, "criteria_scores": {}, "issues": []}
+
+    return judge
+
+
+class TestRulePreJudge:
+    """Tests for local verdicts and escalation"""
+
+    def test_fuzzy_coverage(self):
+        """Test that inflections and filler words do not block a match"""
+        assert coverage("update documentation", "Updating the API documentation") == 1
+        assert coverage("end of this week", "End of week") == 1
+        assert coverage("deploy login feature", "Deploy the dashboard") == 1 / 3
+
+    def test_clear_pass_is_decided_locally(self):
+        """Test that a complete summary passes without calling the LLM judge"""
+        calls = []
+        result = RulePreJudge().judge(
+            CASE["transcript"], GOOD_SUMMARY, CASE["expected"], None, _escalation(calls)
+        )
+        assert result["pass"] and result["judge"] == "rules"
+        assert result["score"] == 100
+        assert sum(result["criteria_scores"].values()) == result["score"]
+        assert calls == []
+
+    def test_invalid_summary_fails_locally(self):
+        """Test that a summary failing validation never reaches the LLM judge"""
+        calls = []
+        summary = {"meeting_title": "Sync", "agenda": "Updates"}
+        result = RulePreJudge().judge(
+            CASE["transcript"], summary, CASE["expected"], None, _escalation(calls)
+        )
+        assert not result["pass"] and result["score"] == 0
+        assert calls == []
+
+    def test_borderline_summary_is_escalated(self):
+        """Test that a summary missing one item goes to the LLM judge"""
+        calls = []
+        prejudge = RulePreJudge()
+        local = prejudge.evaluate(CASE["transcript"], _without(0), CASE["expected"])
+        assert not local["decided"]
+        assert "Missing owner: Tom" in local["issues"]
+
+        result = prejudge.judge(
+            CASE["transcript"], _without(0), CASE["expected"], None, _escalation(calls)
+        )
+        assert result["judge"] == "llm" and result["score"] == 75
+        assert len(calls) == 1
+
+    def test_invented_owner_blocks_local_pass(self):
+        """Test that an owner absent from the transcript is reported"""
+        summary = dict(GOOD_SUMMARY, action_items=list(GOOD_SUMMARY["action_items"]))
+        summary["action_items"].append(
+            {"task": "Send invoice", "owner": "Zed", "deadline": "tomorrow"}
+        )
+        result = RulePreJudge().evaluate(CASE["transcript"], summary, CASE["expected"])
+        assert "Owner not found in transcript: Zed" in result["issues"]
+        assert not result["decided"]
+
+    def test_agreement_with_llm_judge(self):
+        """Test agreement rate, escalation rate and disagreement indexes"""
+        cases = [
+            (CASE["transcript"], GOOD_SUMMARY, CASE["expected"]),
+            (CASE["transcript"], _without(0), CASE["expected"]),
+            (CASE["transcript"], {"agenda": "x"}, CASE["expected"]),
+        ]
+        report = measure_agreement(RulePreJudge(), cases, None, _escalation([]))
+        assert report["cases"] == 3
+        assert report["decided_locally"] == 2
+        assert report["agreement_rate"] == 0.5
+        assert report["disagreements"] == [2]
+
+    def test_runner_counts_local_verdicts(self, tmp_path):
+        """Test that the runner accepts the pre-judge and reports its share"""
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=FakeBackend())
+        runner = EvaluationRunner(
+            MeetingAgent(client),
+            client,
+            verdict_cache=CacheStore(path=str(tmp_path / "verdicts.sqlite3")),
+            results_path=None,
+            judge=RulePreJudge().judge,
+        )
+        report = runner.run(TEST_TRANSCRIPTS)
+        assert report["completed"] == len(TEST_TRANSCRIPTS)
+        assert 0 < report["local_verdicts"] < 4
@@ -0,0 +1,252 @@
+"""Test suite for retries, deadlines, rate limiting and circuit breaking"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import telemetry
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.llm import LLMClient
+from src.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    Resilience,
+    RetryPolicy,
+    TokenBucket,
+    UpstreamUnavailableError,
+    is_retryable,
+    retry_after,
+)
+
+
+class APIError(Exception):
+    """Shaped like the OpenAI SDK's status errors"""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+class FlakyBackend(FakeBackend):
+    """Raises the queued errors before answering normally"""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+
+    def complete(self, prompt, **kwargs):
+        self._delay()
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.respond(prompt, **kwargs)
+
+
+@pytest.fixture
+def recording():
+    """Enable the process-wide collector for one test"""
+    collector = telemetry.get_telemetry()
+    collector.reset()
+    telemetry.enable()
+    yield collector
+    telemetry.disable()
+    collector.reset()
+
+
+def _fast(max_attempts=3, breaker=None, **kwargs):
+    return Resilience(
+        RetryPolicy(max_attempts=max_attempts, base_delay=0.001, **kwargs),
+        breaker=breaker,
+        seed=0,
+    )
+
+
+class TestRetryPolicy:
+    """Tests for error classification, rate-limit headers and backoff"""
+
+    def test_classification_and_headers(self):
+        """Test which errors are retried and how long the upstream asked to wait"""
+        assert is_retryable(APIError(429)) and is_retryable(APIError(503))
+        assert not is_retryable(APIError(400)) and not is_retryable(ValueError())
+        assert is_retryable(TimeoutError()) and not is_retryable(CircuitOpenError())
+
+        assert retry_after(APIError(429, {"Retry-After": "2"})) == 2.0
+        assert retry_after(APIError(429, {"retry-after-ms": "150"})) == 0.15
+        reset = {"x-ratelimit-reset-requests": "1m30s"}
+        assert retry_after(APIError(429, reset)) == 90.0
+        assert retry_after(APIError(429, {"x-ratelimit-reset-tokens": "120ms"})) == 0.12
+        assert retry_after(APIError(500)) is None
+
+    def test_backoff_honors_header_and_jitters(self):
+        """Test full-jitter bounds and that Retry-After overrides them"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        rng = random.Random(0)
+        delays = [policy.backoff(attempt, APIError(503), rng) for attempt in (1, 5)]
+        assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 4.0
+        assert policy.backoff(1, APIError(429, {"retry-after": "7"}), rng) == 7.0
+
+
+class TestResilience:
+    """Tests for Resilience.call/acall"""
+
+    def test_retries_transient_errors(self, recording):
+        """Test that 429/503 are retried and counted, 400 is not"""
+        errors = [APIError(429), APIError(503)]
+
+        def flaky():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert _fast().call(flaky) == "ok"
+        counters = recording.snapshot()["counters"]
+        assert sum(counters["llm_retries"].values()) == 2
+        assert counters["llm_call_outcomes"] == {'outcome="retried"': 1}
+
+        calls = []
+
+        def bad_request():
+            calls.append(1)
+            raise APIError(400)
+
+        with pytest.raises(APIError):
+            _fast().call(bad_request)
+        assert len(calls) == 1
+
+        with pytest.raises(UpstreamUnavailableError, match="3 attempt"):
+            _fast().call(lambda: (_ for _ in ()).throw(APIError(502)))
+
+    def test_attempt_timeout_and_deadline(self):
+        """Test that hung attempts are abandoned and the deadline is shared"""
+        policy = _fast(max_attempts=10, attempt_timeout=0.05, deadline=0.2)
+        started = time.monotonic()
+        with pytest.raises(UpstreamUnavailableError):
+            policy.call(lambda: time.sleep(1))
+        assert time.monotonic() - started < 0.5
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        with pytest.raises(UpstreamUnavailableError) as info:
+            asyncio.run(_fast(max_attempts=1, attempt_timeout=0.05).acall(hang))
+        assert isinstance(info.value.__cause__, DeadlineExceeded)
+
+    def test_clients_share_the_attempt_timeout_workers(self):
+        """Test that a new policy reuses the worker threads instead of starting its own"""
+        workers = [
+            _fast(attempt_timeout=5).call(lambda: threading.current_thread())
+            for _ in range(5)
+        ]
+        assert workers[0] is not threading.current_thread()
+        assert len(set(workers)) == 1
+
+    def test_token_bucket_is_shared_across_threads(self):
+        """Test that concurrent callers are spaced out to the rate"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - started >= 0.09
+
+    def test_circuit_breaker_opens_and_probes(self):
+        """Test open, fail-fast, single half-open probe and recovery"""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10, clock=lambda: now[0]
+        )
+        for _ in range(2):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.state == "open" and not breaker.allow()
+
+        now[0] = 10.0
+        assert breaker.state == "half_open"
+        assert breaker.allow() and not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        now[0] = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed" and breaker.allow()
+
+    def test_probe_without_outcome_is_released(self):
+        """Test that a cancelled probe or an expired deadline never wedges the breaker"""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] = 10.0
+
+        async def cancel_probe():
+            task = asyncio.ensure_future(
+                Resilience(breaker=breaker).acall(lambda: asyncio.sleep(10))
+            )
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_probe())
+        assert breaker.state == "half_open"
+
+        expired = Resilience(RetryPolicy(deadline=0), breaker=breaker)
+        with pytest.raises(DeadlineExceeded):
+            expired.call(lambda: "ok")
+
+        assert Resilience(breaker=breaker).call(lambda: "ok") == "ok"
+        assert breaker.state == "closed"
+
+
+class TestClientResilience:
+    """Tests for the resilience layer inside LLMClient"""
+
+    def test_client_retries_then_caches(self):
+        """Test that a rate-limited request succeeds on retry"""
+        backend = FlakyBackend([APIError(429, {"retry-after-ms": "1"})])
+        client = LLMClient(
+            cache=CacheStore(path=":memory:"), backend=backend, resilience=_fast()
+        )
+        first = client.complete("MEETING TRANSCRIPT:\nBob: I'll ship it today.")
+        assert backend.calls == 2
+        assert client.complete("MEETING TRANSCRIPT:\nBob: I'll ship it today.") == first
+        assert backend.calls == 2
+
+    def test_open_circuit_fails_fast_or_serves_stale(self, tmp_path, recording):
+        """Test fail-fast while degraded and the expired-entry fallback"""
+        cache = CacheStore(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0.05)
+        backend = FlakyBackend([])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        client = LLMClient(
+            cache=cache, backend=backend, resilience=_fast(1, breaker=breaker)
+        )
+        cached = client.complete("cached prompt")
+        time.sleep(0.1)
+
+        backend.errors = [APIError(503)]
+        with pytest.raises(Exception, match="LLM completion failed"):
+            client.complete("new prompt")
+        assert breaker.state == "open"
+
+        assert client.complete("cached prompt") == cached
+        with pytest.raises(Exception, match="circuit breaker is open"):
+            client.complete("another prompt")
+        assert backend.calls == 2
+
+        outcomes = recording.snapshot()["counters"]["llm_call_outcomes"]
+        assert outcomes['outcome="stale_fallback"'] == 1
+        assert outcomes['outcome="circuit_open"'] == 2
@@ -0,0 +1,116 @@
+"""Test suite for model routing and escalation"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from src.agent import MeetingAgent
+from src.backends import FakeBackend, OpenAIBackend
+from src.cache import CacheStore
+from src.helpers import validate_meeting_summary
+from src.llm import LLMClient
+from src.routing import ModelRouter, Route, transcript_features
+
+STANDUP = TEST_TRANSCRIPTS["test_case_standup"]["transcript"]
+
+
+class RoutedBackend(FakeBackend):
+    """Records each request's model and budget; optionally botches small-model answers"""
+
+    def __init__(self, broken_model=None):
+        super().__init__()
+        self.broken_model = broken_model
+        self.requests = []
+
+    def respond(self, prompt, **kwargs):
+        model = kwargs.pop("model", self.model)
+        self.requests.append((model, kwargs.pop("max_tokens", self.max_tokens)))
+        if model == self.broken_model:
+            return json.dumps({"meeting_title": "", "agenda": "", "action_items": []})
+        return super().respond(prompt, **kwargs)
+
+
+def _agent(backend):
+    client = LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+    return MeetingAgent(
+        client, use_pre_classifier=False, structured_output=False, router=ModelRouter()
+    )
+
+
+def _crowded_transcript(speakers=10, turns=40):
+    return "\n".join(
+        f"Person {i % speakers}: I'll handle part {i} of the migration by Friday."
+        for i in range(turns)
+    )
+
+
+class TestModelRouter:
+    """Tests for features, tier selection and output budgets"""
+
+    def test_features(self):
+        """Test speaker and commitment counting"""
+        features = transcript_features(STANDUP)
+        assert features.speakers == 3
+        assert features.commitments == 2
+        assert features.tokens > 0
+
+    def test_short_standup_uses_small_model_and_small_budget(self):
+        """Test that a standup gets the small model and far fewer than 4096 tokens"""
+        route = ModelRouter().route(STANDUP)
+        assert route.model == "gpt-4o-mini" and route.tier == "small"
+        assert 256 <= route.max_tokens <= 1024
+
+    def test_crowded_transcript_uses_large_model(self):
+        """Test that many speakers or commitments pick the large model and budget"""
+        router = ModelRouter()
+        route = router.route(_crowded_transcript())
+        assert route.model == "gpt-4o" and route.tier == "large"
+        assert route.max_tokens == 4096
+        assert router.route(_crowded_transcript(turns=6)).max_tokens < 4096
+
+    def test_escalation_steps(self):
+        """Test small -> large -> full budget -> nothing left"""
+        router = ModelRouter()
+        first = router.escalate(Route("gpt-4o-mini", 704, "small"))
+        assert first == Route("gpt-4o", 1408, "escalated")
+        assert router.escalate(first) == Route("gpt-4o", 4096, "escalated")
+        assert router.escalate(Route("gpt-4o", 4096, "large")) is None
+
+
+class TestRoutedAgent:
+    """Tests for routing inside MeetingAgent and the backends"""
+
+    def test_agent_sends_routed_model_and_budget(self):
+        """Test that the client forwards the route and caches per model"""
+        backend = RoutedBackend()
+        summary = _agent(backend).summarize_meeting(STANDUP)
+        assert validate_meeting_summary(summary)
+        [(model, max_tokens)] = backend.requests
+        assert model == "gpt-4o-mini" and max_tokens < 4096
+
+    def test_invalid_answer_escalates_once(self):
+        """Test that only an answer failing validation is retried on the large model"""
+        backend = RoutedBackend(broken_model="gpt-4o-mini")
+        summary = _agent(backend).summarize_meeting(STANDUP)
+        assert validate_meeting_summary(summary)
+        assert [model for model, _ in backend.requests] == ["gpt-4o-mini", "gpt-4o"]
+        assert backend.requests[1][1] == 2 * backend.requests[0][1]
+
+    def test_openai_backend_forwards_overrides_to_prebuilt_llm(self):
+        """Test that a pre-built llm receives the per-request model and budget"""
+
+        class Recorder:
+            kwargs = []
+
+            def complete(self, prompt, **kwargs):
+                self.kwargs.append(kwargs)
+                return type("Response", (), {"text": "ok"})()
+
+        llm = Recorder()
+        backend = OpenAIBackend(llm=llm)
+        backend.complete("prompt")
+        backend.complete("prompt", model="gpt-4o", max_tokens=512)
+        assert llm.kwargs == [{}, {"model": "gpt-4o", "max_tokens": 512}]
@@ -0,0 +1,115 @@
+"""Test suite for the speaker index and owner resolution"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from judge.prejudge import RulePreJudge
+from src.agent import MeetingAgent
+from src.speakers import SpeakerIndex
+
+TRANSCRIPT = """Alice Johnson: Morning all. Bob, can you review the API changes?
+Bob: Sure, I'll review them today.
+Team Lead: Alice, please update the docs. Also ask Priya to check the load tests.
+Alice Johnson: Will do, by Friday.
+Bob: Thanks Alice."""
+
+SUMMARY = {
+    "meeting_title": "API review",
+    "agenda": "Review API changes",
+    "action_items": [
+        {"task": "Review API changes", "owner": "bob", "deadline": "today"},
+        {"task": "Update docs", "owner": "Alice", "deadline": "Friday"},
+        {"task": "Check load tests", "owner": "Priya", "deadline": "Not specified"},
+        {"task": "Approve budget", "owner": "Zed", "deadline": "Not specified"},
+        {"task": "Plan sprint", "owner": "TL", "deadline": "Not specified"},
+    ],
+}
+
+
+class StaticClient:
+    """Returns the same summary for every prompt"""
+
+    def complete(self, prompt, system=None):
+        return json.dumps(SUMMARY)
+
+
+class TestSpeakerIndex:
+    """Tests for the single-scan index, canonical owners and hallucinations"""
+
+    def test_index_records_turns_mentions_and_aliases(self):
+        """Test offsets, name mentions and unique-part aliases"""
+        stats = SpeakerIndex(TRANSCRIPT).stats()
+        assert list(stats) == ["Alice Johnson", "Bob", "Team Lead"]
+        assert stats["Alice Johnson"]["turns"] == 2
+        assert stats["Alice Johnson"]["mentions"] == 2
+        assert stats["Bob"]["first_offset"] == TRANSCRIPT.index("Bob:")
+        assert stats["Alice Johnson"]["aliases"] == [
+            "aj",
+            "alice",
+            "alice johnson",
+            "johnson",
+        ]
+        assert "team" not in stats["Team Lead"]["aliases"]
+
+    def test_canonical_and_hallucinated_owners(self):
+        """Test resolution of owner spellings to speaker labels"""
+        index = SpeakerIndex(TRANSCRIPT)
+        assert index.canonical("alice") == "Alice Johnson"
+        assert index.canonical("Bob (backend)") == "Bob"
+        assert index.canonical("TL") == "Team Lead"
+        assert index.canonical("Alice and Bob") is None
+        assert not index.is_hallucinated("Priya")
+        assert not index.is_hallucinated("Not specified")
+        assert index.is_hallucinated("Zed")
+
+    def test_possessive_owners_resolve_to_the_speaker(self):
+        """Test that owners like "Bob's team" are not treated as unknown names"""
+        index = SpeakerIndex(TRANSCRIPT)
+        assert index.canonical("Bob's team") == "Bob"
+        assert index.canonical("Alice’s") == "Alice Johnson"
+        assert not index.is_hallucinated("Bob's team")
+        assert not index.is_hallucinated("Priya's")
+
+    def test_agent_canonicalizes_owners(self):
+        """Test that summaries use speaker labels and owner_report counts items"""
+        agent = MeetingAgent(StaticClient(), use_pre_classifier=False)
+        summary = agent.summarize_meeting(TRANSCRIPT)
+        owners = [item["owner"] for item in summary["action_items"]]
+        assert owners == ["Bob", "Alice Johnson", "Priya", "Zed", "Team Lead"]
+
+        report = agent.owner_report(TRANSCRIPT, summary)
+        assert report["hallucinated"] == ["Zed"]
+        assert report["action_items"] == {
+            "Alice Johnson": 1,
+            "Bob": 1,
+            "Team Lead": 1,
+            "Priya": 1,
+            "Zed": 1,
+        }
+
+        raw = MeetingAgent(
+            StaticClient(), use_pre_classifier=False, canonicalize_owners=False
+        ).summarize_meeting(TRANSCRIPT)
+        assert raw["action_items"][0]["owner"] == "bob"
+
+    def test_judge_reuses_index(self):
+        """Test that the pre-judge flags invented owners from the shared index"""
+        SpeakerIndex.clear_cache()
+        result = RulePreJudge().evaluate(TRANSCRIPT, SUMMARY, {})
+        assert "Owner not found in transcript: Zed" in result["issues"]
+        index = SpeakerIndex.for_transcript("".join(list(TRANSCRIPT)))
+        assert SpeakerIndex.for_transcript(TRANSCRIPT) is index
+
+    def test_shared_index_is_read_only(self):
+        """Test that a cached index cannot be changed by one of its users"""
+        index = SpeakerIndex.for_transcript(TRANSCRIPT)
+        with pytest.raises(TypeError):
+            index.speakers["Zed"] = index.speakers["Bob"]
+        with pytest.raises(AttributeError):
+            index.speakers["Bob"].aliases.append("zed")
+        assert not hasattr(index, "add_aliases")
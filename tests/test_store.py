@@ -0,0 +1,118 @@
+"""Test suite for the cross-meeting action item store"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.llm import LLMClient
+from src.models import summary_from_dict
+from src.store import ActionItemStore
+
+# Both meetings are on Wednesdays
+SPRINT = {
+    "meeting_title": "Sprint sync",
+    "agenda": "Release blockers",
+    "action_items": [
+        {"task": "Fix the login bug", "owner": "Lisa", "deadline": "this afternoon"},
+        {"task": "Write release notes", "owner": "Mike", "deadline": "Friday"},
+        {"task": "Plan the retro", "owner": "lisa", "deadline": "next week"},
+    ],
+}
+CLIENT = {
+    "meeting_title": "Client review",
+    "agenda": "Dashboard feedback",
+    "action_items": [
+        {"task": "Send login screenshots", "owner": "Lisa", "deadline": "tomorrow"},
+        {"task": "Update docs", "owner": "Emily", "deadline": "before the demo"},
+    ],
+}
+
+
+def _store(path=":memory:"):
+    store = ActionItemStore(path=path)
+    store.ingest(SPRINT, meeting_key="sprint", held_at="2024-03-13T10:00")
+    store.ingest(summary_from_dict(CLIENT), meeting_key="client", held_at="2024-03-20")
+    return store
+
+
+class TestActionItemStore:
+    """Tests for ingestion, indexes and queries"""
+
+    def test_owner_and_due_window(self):
+        """Test what an owner owes in a week, including overlapping ranges"""
+        items = _store().query(owner="LISA", due_from="2024-03-11", due_to="2024-03-17")
+        assert [item.task for item in items] == ["Fix the login bug"]
+        assert items[0].due_start == "2024-03-13T12:00:00"
+
+        next_week = _store().query(due_from="2024-03-21", due_to="2024-03-21")
+        assert {item.task for item in next_week} == {
+            "Plan the retro",
+            "Send login screenshots",
+        }
+
+    def test_keyword_and_meeting_queries(self):
+        """Test that every keyword must match and meeting filters apply"""
+        store = _store()
+        assert {i.task for i in store.query(text="login")} == {
+            "Fix the login bug",
+            "Send login screenshots",
+        }
+        assert [i.task for i in store.query(text="LOGIN bug")] == ["Fix the login bug"]
+        assert store.query(text="login payroll") == []
+
+        sprint_id = store.query(text="retro")[0].meeting_id
+        assert len(store.query(meeting_id=sprint_id)) == 3
+        assert store.meeting(sprint_id) == SPRINT
+
+    def test_undated_items(self):
+        """Test that unresolvable deadlines are kept and optionally included"""
+        store = _store()
+        dated = store.query(due_from="2024-03-01", due_to="2024-03-31")
+        assert "Update docs" not in {i.task for i in dated}
+        both = store.query(
+            due_from="2024-03-01", due_to="2024-03-31", include_undated=True
+        )
+        assert both[-1].task == "Update docs" and both[-1].due_start is None
+        assert store.stats() == {"meetings": 2, "items": 5, "dated_items": 4}
+        assert store.owner_counts()["Lisa"] == 3
+
+    def test_ingest_is_incremental_and_persistent(self, tmp_path):
+        """Test that re-ingesting is a no-op and data survives reopening"""
+        path = str(tmp_path / "items.sqlite3")
+        store = _store(path)
+        first = store.ingest(SPRINT, meeting_key="sprint")
+        assert store.ingest({"error": "NO_ACTION_ITEMS_FOUND"}) is None
+        store.close()
+
+        reopened = ActionItemStore(path=path)
+        assert reopened.ingest(SPRINT, meeting_key="sprint") == first
+        assert reopened.stats()["items"] == 5
+        assert len(reopened.query(text="retro")) == 1
+
+    def test_models_and_dicts_ingest_alike(self):
+        """Test that a validated model is stored like its dict, under the same identity"""
+        store = ActionItemStore(path=":memory:")
+        meeting_id = store.ingest(summary_from_dict(SPRINT), held_at="2024-03-13")
+        assert store.ingest(SPRINT) == meeting_id
+        assert store.meeting(meeting_id) == SPRINT
+        assert (
+            store.ingest(summary_from_dict({"error": "NO_ACTION_ITEMS_FOUND"})) is None
+        )
+        assert store.stats()["items"] == len(SPRINT["action_items"])
+
+    def test_agent_ingests_summaries(self):
+        """Test that the agent appends each successful summary to its store"""
+        store = ActionItemStore(path=":memory:")
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=FakeBackend())
+        agent = MeetingAgent(client, store=store)
+        for case in TEST_TRANSCRIPTS.values():
+            agent.summarize_meeting(case["transcript"], reference_time="2024-03-13")
+
+        meetings = [c for c in TEST_TRANSCRIPTS.values() if "expected" in c]
+        assert store.stats()["meetings"] == len(meetings)
+        assert [i.deadline for i in store.query(owner="Mike")] == ["this afternoon"]
@@ -0,0 +1,199 @@
+"""Test suite for streamed completions and incremental summary parsing"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.test_transcripts import TEST_TRANSCRIPTS
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.fingerprint import NearDuplicateIndex
+from src.helpers import validate_meeting_summary
+from src.llm import LLMClient
+from src.resilience import Resilience, RetryPolicy
+from src.routing import ModelRouter
+from src.streaming import StreamEvent, SummaryStreamParser
+
+STANDUP = TEST_TRANSCRIPTS["test_case_standup"]["transcript"]
+
+SUMMARY = {
+    "meeting_title": 'Release "v2" {planning}',
+    "agenda": "Ship the \\ release",
+    "action_items": [
+        {"task": "Fix the } bug", "owner": "Bob", "deadline": "Friday"},
+        {"task": "Review [docs]", "owner": "Alice", "deadline": "today"},
+    ],
+}
+
+
+def _feed(text, size):
+    parser = SummaryStreamParser()
+    events, progress = [], []
+    for start in range(0, len(text), size):
+        new = parser.feed(text[start : start + size])
+        events.extend(new)
+        progress.extend([start + size] * len(new))
+    return parser, events, progress
+
+
+class InterruptedBackend(FakeBackend):
+    """Streams the first pieces of the response, then fails"""
+
+    def stream_complete(self, prompt, **kwargs):
+        pieces = super().stream_complete(prompt, **kwargs)
+        yield next(pieces)
+        raise ConnectionError("stream reset")
+
+
+class TestSummaryStreamParser:
+    """Tests for incremental field and action item extraction"""
+
+    @pytest.mark.parametrize("size", [1, 5, 64, 10_000])
+    def test_events_match_the_full_parse(self, size):
+        """Test that any chunking yields the same events and final result"""
+        text = "```json\n" + json.dumps(SUMMARY, indent=2) + "\n```"
+        parser, events, _ = _feed(text, size)
+        assert events == [
+            StreamEvent("meeting_title", SUMMARY["meeting_title"]),
+            StreamEvent("agenda", SUMMARY["agenda"]),
+            *(StreamEvent("action_items", item) for item in SUMMARY["action_items"]),
+        ]
+        assert parser.result() == SUMMARY
+
+    def test_items_are_emitted_before_the_response_ends(self):
+        """Test that the first action item arrives as soon as its object closes"""
+        text = json.dumps(SUMMARY)
+        _, events, progress = _feed(text, 1)
+        first_item_end = text.index('"Friday"}') + len('"Friday"}')
+        assert events[2].field == "action_items"
+        assert progress[2] == first_item_end < len(text)
+
+    def test_error_and_null_fields(self):
+        """Test structured-output shapes with null fields"""
+        text = json.dumps(
+            {
+                "error": "NOT_A_MEETING_TRANSCRIPT",
+                "meeting_title": None,
+                "agenda": None,
+                "action_items": None,
+            }
+        )
+        _, events, _ = _feed(text, 3)
+        assert events[0] == StreamEvent("error", "NOT_A_MEETING_TRANSCRIPT")
+        assert [event.field for event in events] == ["error", "meeting_title", "agenda"]
+
+
+class TestStreamingClient:
+    """Tests for LLMClient.stream_complete and MeetingAgent.stream_summary"""
+
+    def test_stream_shares_cache_with_complete(self):
+        """Test that a fully read stream is cached and served by complete()"""
+        backend = FakeBackend(chunk_chars=8)
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+        pieces = list(client.stream_complete("MEETING TRANSCRIPT:\n" + STANDUP))
+        assert len(pieces) > 1
+        assert client.complete("MEETING TRANSCRIPT:\n" + STANDUP) == "".join(pieces)
+        assert list(client.stream_complete("MEETING TRANSCRIPT:\n" + STANDUP)) == [
+            "".join(pieces)
+        ]
+        assert backend.calls == 1
+
+    def test_interrupted_stream_fails_and_is_not_cached(self):
+        """Test that a mid-stream failure is raised and leaves no cache entry"""
+        backend = InterruptedBackend()
+        client = LLMClient(
+            cache=CacheStore(path=":memory:"),
+            backend=backend,
+            resilience=Resilience(RetryPolicy(max_attempts=1)),
+        )
+        with pytest.raises(Exception, match="LLM completion failed"):
+            list(client.stream_complete("MEETING TRANSCRIPT:\n" + STANDUP))
+        with pytest.raises(Exception, match="LLM completion failed"):
+            list(client.stream_complete("MEETING TRANSCRIPT:\n" + STANDUP))
+        assert backend.calls == 2
+
+    @pytest.mark.parametrize("structured", [True, False])
+    def test_agent_streams_items_then_validated_summary(self, structured):
+        """Test partial events followed by the same summary summarize_meeting gives"""
+        backend = FakeBackend()
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+        agent = MeetingAgent(
+            client,
+            use_pre_classifier=False,
+            structured_output=structured,
+            router=ModelRouter(),
+        )
+        events = list(agent.stream_summary(STANDUP))
+        *partial, final = events
+        assert final.field == "summary" and validate_meeting_summary(final.value)
+        assert partial[0] == StreamEvent("meeting_title", final.value["meeting_title"])
+        items = [event.value for event in partial if event.field == "action_items"]
+        assert items == final.value["action_items"]
+        assert agent.summarize_meeting(STANDUP) == final.value
+        assert backend.calls == 1
+
+    def test_local_answers_yield_only_the_summary(self):
+        """Test that pre-classified inputs skip the LLM and stream one event"""
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=FakeBackend())
+        agent = MeetingAgent(client)
+        story = TEST_TRANSCRIPTS["test_case_not_a_meeting"]["transcript"]
+        events = list(agent.stream_summary(story))
+        assert events == [StreamEvent("summary", {"error": "NOT_A_MEETING_TRANSCRIPT"})]
+
+    def test_agent_stream_reuses_near_duplicate_summary(self):
+        """Test that a re-uploaded transcript is served by the near-duplicate index"""
+        backend = FakeBackend()
+        client = LLMClient(
+            cache=CacheStore(path=":memory:"),
+            backend=backend,
+            near_duplicates=NearDuplicateIndex(path=":memory:"),
+        )
+        agent = MeetingAgent(client, use_pre_classifier=False)
+        first = list(agent.stream_summary(STANDUP))[-1]
+        reuploaded = STANDUP.replace("\n", "  \r\n") + "\r\nAlice: Thanks all!"
+        assert list(agent.stream_summary(reuploaded))[-1] == first
+        assert backend.calls == 1
+
+    def test_concurrent_streams_share_one_request(self):
+        """Test that identical streams in flight make one upstream request"""
+        backend = FakeBackend(latency=0.2)
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+        prompt = "MEETING TRANSCRIPT:\n" + STANDUP
+        results = []
+
+        def read():
+            results.append("".join(client.stream_complete(prompt)))
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(results)) == 1 and len(results) == 3
+        assert backend.calls == 1
+
+    def test_abandoned_stream_hands_over_to_waiting_caller(self):
+        """Test that a reader stopping early neither caches nor fails waiters"""
+        backend = FakeBackend(latency=0.1, chunk_chars=4)
+        client = LLMClient(cache=CacheStore(path=":memory:"), backend=backend)
+        prompt = "MEETING TRANSCRIPT:\n" + STANDUP
+        stream = client.stream_complete(prompt)
+        next(stream)
+
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append("".join(client.stream_complete(prompt)))
+        )
+        waiter.start()
+        time.sleep(0.05)
+        stream.close()
+        waiter.join()
+        assert json.loads(results[0])["action_items"]
+        assert backend.calls == 2
@@ -0,0 +1,139 @@
+"""Test suite for stage timing and counters"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from judge.llm_judge import judge_meeting_summary
+from src import telemetry
+from src.agent import MeetingAgent
+from src.backends import FakeBackend
+from src.cache import CacheStore
+from src.llm import LLMClient
+from src.telemetry import Telemetry
+
+TRANSCRIPT = """Alice: Let's plan the release.
+Bob: I'll deploy the login fix by Friday.
+Alice: Great, thanks."""
+
+
+@pytest.fixture
+def recording():
+    """Enable the process-wide collector for one test"""
+    collector = telemetry.get_telemetry()
+    collector.reset()
+    telemetry.enable()
+    yield collector
+    telemetry.disable()
+    collector.reset()
+
+
+class TestTelemetry:
+    """Tests for spans, counters and exports"""
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled collector hands out the shared no-op span"""
+        collector = Telemetry(enabled=False)
+        first = collector.span("a")
+        with first as s:
+            s.set("key", "value")
+        collector.count("requests")
+        assert first is collector.span("b")
+        assert collector.snapshot() == {"stages": {}, "counters": {}}
+
+    def test_spans_nest_and_record_errors(self):
+        """Test that child spans share the trace and failures are marked"""
+        collector = Telemetry(enabled=True)
+        with collector.span("outer") as outer:
+            with pytest.raises(ValueError):
+                with collector.span("inner"):
+                    raise ValueError("boom")
+
+        stages = collector.snapshot()["stages"]
+        assert stages["outer"]["count"] == 1
+        assert stages["inner"]["errors"] == 1
+
+        spans = collector.to_otel_json()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        inner = next(s for s in spans if s["name"] == "inner")
+        assert inner["traceId"] == outer.trace_id
+        assert inner["parentSpanId"] == outer.span_id
+        assert inner["status"]["code"] == 2
+
+    def test_prometheus_export(self, tmp_path):
+        """Test the Prometheus text format of histograms and counters"""
+        collector = Telemetry(enabled=True)
+        with collector.span("llm.request"):
+            pass
+        collector.count("llm_cache_requests", outcome="hit")
+        collector.count("llm_cache_requests", 2, outcome="hit")
+
+        text = collector.to_prometheus()
+        assert 'meeting_stage_duration_seconds_count{stage="llm.request"} 1' in text
+        assert (
+            'meeting_stage_duration_seconds_bucket{stage="llm.request",le="+Inf"} 1'
+            in text
+        )
+        assert 'meeting_llm_cache_requests_total{outcome="hit"} 3' in text
+
+        path = tmp_path / "metrics.prom"
+        collector.export(str(path))
+        assert path.read_text() == text
+
+
+class TestInstrumentation:
+    """Tests for the spans and counters emitted by the pipeline"""
+
+    def test_summarize_records_stages_tokens_and_cache(self, recording, tmp_path):
+        """Test that a summary run reports every stage and cache outcome"""
+        client = LLMClient(
+            cache=CacheStore(path=str(tmp_path / "cache.sqlite3")),
+            backend=FakeBackend(),
+        )
+        agent = MeetingAgent(client, structured_output=False)
+        agent.summarize_meeting(TRANSCRIPT)
+        agent.summarize_meeting(TRANSCRIPT)
+
+        snapshot = recording.snapshot()
+        for stage in (
+            "agent.summarize_meeting",
+            "agent.pre_classify",
+            "agent.parse_response",
+            "llm.complete",
+            "llm.cache_lookup",
+            "llm.request",
+        ):
+            assert stage in snapshot["stages"], stage
+        assert snapshot["stages"]["llm.request"]["count"] == 1
+
+        counters = snapshot["counters"]
+        assert counters["llm_cache_requests"] == {
+            'outcome="miss"': 1,
+            'outcome="hit"': 1,
+        }
+        assert (
+            counters["llm_prompt_tokens"]['model="fake-summarizer",source="estimate"']
+            > 0
+        )
+
+    def test_judge_is_instrumented(self, recording, tmp_path):
+        """Test that judge calls record a span and a verdict counter"""
+        client = LLMClient(
+            cache=CacheStore(path=str(tmp_path / "cache.sqlite3")),
+            backend=FakeBackend(),
+        )
+        evaluation = judge_meeting_summary(TRANSCRIPT, {}, {}, client)
+
+        snapshot = recording.snapshot()
+        assert evaluation["pass"]
+        assert snapshot["stages"]["judge.evaluate"]["count"] == 1
+        assert snapshot["counters"]["judge_verdicts"] == {'outcome="pass"': 1}
+
+        exported = json.loads(json.dumps(recording.to_otel_json()))
+        names = {
+            s["name"] for s in exported["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        }
+        assert {"judge.evaluate", "llm.complete", "llm.request"} <= names
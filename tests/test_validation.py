@@ -0,0 +1,80 @@
+"""Test suite for bulk summary validation"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.helpers import validate_meeting_summary
+from src.validation import (
+    explain_meeting_summary,
+    summarize_results,
+    validate_jsonl,
+    validate_many,
+)
+
+VALID = {
+    "meeting_title": "Sync",
+    "agenda": "Release",
+    "action_items": [{"task": "Deploy", "owner": "Bob", "deadline": "Friday"}],
+}
+SAMPLES = [
+    VALID,
+    {"meeting_title": "Sync", "agenda": "Release", "action_items": []},
+    {"error": "NO_ACTION_ITEMS_FOUND"},
+    {"error": "UNKNOWN"},
+    {"error": "NOT_A_MEETING_TRANSCRIPT", "agenda": "x"},
+    {"meeting_title": " \n", "agenda": "Release", "action_items": []},
+    {"meeting_title": "Sync", "action_items": []},
+    {"meeting_title": "Sync", "agenda": "Release", "action_items": {}},
+    dict(VALID, action_items=["Deploy"]),
+    dict(VALID, action_items=[{"task": "Deploy", "owner": "Bob"}]),
+    dict(VALID, action_items=[{"task": "Deploy", "owner": 3, "deadline": "x"}]),
+    dict(VALID, action_items=[{"task": "Deploy", "owner": "Bob", "deadline": ""}]),
+]
+
+
+class TestBulkValidation:
+    """Tests for reasons, agreement with validate_meeting_summary and bulk APIs"""
+
+    def test_verdicts_match_validate_meeting_summary(self):
+        """Test that every sample gets the same verdict as the original check"""
+        for sample, result in zip(SAMPLES, validate_many(SAMPLES)):
+            assert result.valid == validate_meeting_summary(sample), sample
+            assert result.valid == (not result.reasons)
+
+    def test_reasons_name_the_failing_fields(self):
+        """Test that reasons point at the offending key or item"""
+        assert explain_meeting_summary(VALID) == []
+        assert explain_meeting_summary(SAMPLES[4]) == [
+            "error response has unexpected keys: agenda"
+        ]
+        assert explain_meeting_summary(SAMPLES[6]) == ["missing key: agenda"]
+        assert explain_meeting_summary(SAMPLES[10]) == [
+            "action_items[0].owner must be a non-empty string"
+        ]
+        assert explain_meeting_summary([]) == ["summary must be an object, got list"]
+
+    def test_jsonl_file_in_parallel(self, tmp_path):
+        """Test that processes give the same ordered results as one process"""
+        path = tmp_path / "summaries.jsonl"
+        lines = [json.dumps(s) for s in SAMPLES * 3]
+        lines.insert(2, "")
+        lines.insert(5, '{"meeting_title": ')
+        path.write_text("\n".join(lines) + "\n")
+
+        serial = list(validate_jsonl(str(path)))
+        parallel = list(validate_jsonl(str(path), workers=2, chunk_size=4))
+        assert serial == parallel
+        assert len(serial) == len(lines) - 1
+        assert serial[4].index == 5
+        assert serial[4].reasons[0].startswith("invalid JSON")
+
+    def test_summarize_results(self):
+        """Test totals and reason counts"""
+        report = summarize_results(validate_many(SAMPLES * 2))
+        assert report["records"] == len(SAMPLES) * 2
+        assert report["valid"] == 6
+        assert report["reasons"]["missing key: agenda"] == 2
+        assert report["invalid_indexes"][:2] == [3, 4]